@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate
 from django.contrib.auth import get_user_model
+from survey_project.fieldsets import SparseFieldsetMixin
 
 User = get_user_model()
 
@@ -46,7 +47,7 @@ class UserLoginSerializer(serializers.Serializer):
         else:
             raise serializers.ValidationError('사용자명과 비밀번호를 모두 입력해주세요.')
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ('id', 'username', 'email', 'first_name', 'last_name', 'role', 'date_joined')
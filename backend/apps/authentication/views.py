@@ -72,7 +72,7 @@ def logout_view(request):
 def profile_view(request):
     """사용자 프로필 조회"""
     return Response({
-        'user': UserSerializer(request.user).data
+        'user': UserSerializer(request.user, context={'request': request}).data
     }, status=status.HTTP_200_OK)
 
 @api_view(['POST', 'OPTIONS'])
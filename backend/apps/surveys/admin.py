@@ -1,5 +1,17 @@
 from django.contrib import admin
 from .models import Survey, Question, Response, Answer
+from .tallies import rebuild_tallies_for_question_ids
+from .caching import invalidate_survey
+
+
+def _changed_question_ids(formset):
+    """인라인 폼셋에서 수정/삭제된 질문 ID 목록"""
+    question_ids = set()
+    for form in formset.forms:
+        if form.has_changed() or form in formset.deleted_forms:
+            question_ids.add(form.initial.get('question') or form.initial.get('id'))
+            question_ids.add(getattr(form.instance, 'question_id', None) or form.instance.pk)
+    return question_ids
 
 class QuestionInline(admin.TabularInline):
     model = Question
@@ -8,19 +20,37 @@ class QuestionInline(admin.TabularInline):
 
 @admin.register(Survey)
 class SurveyAdmin(admin.ModelAdmin):
-    list_display = ('title', 'creator', 'status', 'response_count', 'created_at')
+    list_display = ('title', 'creator', 'status', 'response_count', 'view_count', 'created_at')
     list_filter = ('status', 'created_at', 'creator')
     search_fields = ('title', 'description')
     inlines = [QuestionInline]
     
     def get_queryset(self, request):
         return super().get_queryset(request).select_related('creator')
+    
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        invalidate_survey(obj.pk)
+    
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        invalidate_survey(obj.pk)
+    
+    def save_formset(self, request, form, formset, change):
+        super().save_formset(request, form, formset, change)
+        # 질문 유형/선택지 변경 시 집계 재생성
+        rebuild_tallies_for_question_ids(_changed_question_ids(formset))
 
 @admin.register(Question)
 class QuestionAdmin(admin.ModelAdmin):
     list_display = ('text', 'survey', 'type', 'required', 'order')
     list_filter = ('type', 'required', 'survey__status')
     search_fields = ('text', 'survey__title')
+    
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        rebuild_tallies_for_question_ids([obj.pk])
+        invalidate_survey(obj.survey_id)
 
 class AnswerInline(admin.TabularInline):
     model = Answer
@@ -36,9 +66,27 @@ class ResponseAdmin(admin.ModelAdmin):
     
     def get_queryset(self, request):
         return super().get_queryset(request).select_related('survey')
+    
+    def save_formset(self, request, form, formset, change):
+        super().save_formset(request, form, formset, change)
+        # 답변을 직접 수정/삭제한 경우 해당 질문의 집계 재생성
+        rebuild_tallies_for_question_ids(_changed_question_ids(formset))
 
 @admin.register(Answer)
 class AnswerAdmin(admin.ModelAdmin):
     list_display = ('question', 'response', 'text_answer', 'choice_answers')
     list_filter = ('question__type', 'response__submitted_at')
     search_fields = ('text_answer', 'question__text')
+    
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        rebuild_tallies_for_question_ids([form.initial.get('question'), obj.question_id])
+    
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        rebuild_tallies_for_question_ids([obj.question_id])
+    
+    def delete_queryset(self, request, queryset):
+        question_ids = set(queryset.values_list('question_id', flat=True))
+        super().delete_queryset(request, queryset)
+        rebuild_tallies_for_question_ids(question_ids)
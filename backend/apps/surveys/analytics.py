@@ -0,0 +1,28 @@
+"""설문 분석 데이터 생성
+
+질문별 응답 분포는 tallies 모듈이 관리하는 집계 테이블에서 읽으므로,
+응답 수와 관계없이 질문 수에 비례하는 행만 조회한다.
+"""
+from .serializers import QuestionSerializer
+from .tallies import CHOICE_QUESTION_TYPES, load_question_tallies, option_key
+
+
+def build_questions_analytics(questions):
+    """질문 목록 전체의 분석 데이터 생성 (질문 수와 무관하게 쿼리 수 고정)"""
+    questions = list(questions)
+    tallies = load_question_tallies(questions)
+
+    questions_analytics = []
+    for question in questions:
+        total_answers, option_counts = tallies.get(question.id, (0, {}))
+        distribution = {}
+        if question.type in CHOICE_QUESTION_TYPES:
+            for option in question.options:
+                distribution[option] = option_counts.get(option_key(option), 0)
+
+        questions_analytics.append({
+            'question': QuestionSerializer(question).data,
+            'total_answers': total_answers,
+            'answer_distribution': distribution,
+        })
+    return questions_analytics
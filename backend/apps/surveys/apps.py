@@ -4,3 +4,7 @@ class SurveysConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.surveys'
     verbose_name = '설문조사'
+    
+    def ready(self):
+        from . import signals  # noqa: F401
+        from survey_project.db import stats  # noqa: F401  (연결 재사용 통계 수집)
@@ -0,0 +1,131 @@
+"""설문 단위 버전 캐시
+
+캐시 키는 (네임스페이스, 설문 ID, 버전)으로 구성된다. 응답 제출, 설문 수정, 삭제 시
+버전을 올리면 이전 버전의 항목은 더 이상 조회되지 않고 TTL/최대 항목 수에 따라 정리된다.
+Django 캐시 프레임워크의 SURVEY_CACHE_ALIAS 캐시를 사용하며, 로컬 메모리 백엔드는
+프로세스별로 분리되므로 여러 워커가 버전을 공유해야 하면 파일 백엔드를 사용한다.
+
+버전은 증가하는 숫자가 아니라 무효화할 때마다 새로 만드는 임의 토큰이다. 파일 백엔드의
+incr는 읽기-쓰기가 원자적이지 않아 동시에 올리면 같은 값이 되어 무효화가 사라질 수
+있지만, 새 토큰을 set하면 어느 쓰기가 남든 이전 버전과는 다른 값이 된다.
+따라서 캐시 백엔드는 set/add만 프로세스 간에 일관되면 된다.
+
+적중/실패 횟수는 캐시에 쓰지 않고 프로세스 메모리의 요청 지표(survey_project.metrics)에
+더하므로, 적중한 요청은 캐시 읽기만 한다 (/api/metrics/ 의 survey_cache_requests_total).
+"""
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from survey_project import metrics
+
+ANALYTICS = 'analytics'
+DEFINITION = 'definition'
+
+
+def _cache():
+    return caches[getattr(settings, 'SURVEY_CACHE_ALIAS', 'default')]
+
+
+def _version_key(namespace, survey_id):
+    return f'survey:{namespace}:{survey_id}:version'
+
+
+def _new_version():
+    # 버전 키가 축출되거나 동시에 무효화되어도 이전 버전 값과 겹치지 않는 토큰
+    return uuid.uuid4().hex
+
+
+def get_version(survey_id, namespace=ANALYTICS):
+    """설문의 현재 캐시 버전"""
+    cache = _cache()
+    key = _version_key(namespace, survey_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _new_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(survey_id, namespace=ANALYTICS):
+    """설문의 캐시 버전을 새 토큰으로 교체 (트랜잭션 커밋 이후 적용)"""
+    def bump():
+        _cache().set(_version_key(namespace, survey_id), _new_version(), timeout=None)
+
+    transaction.on_commit(bump)
+
+
+def invalidate_survey(survey_id):
+    """설문 정의(질문/상태)가 바뀌었을 때 정의와 분석 캐시를 모두 무효화"""
+    bump_version(survey_id, DEFINITION)
+    bump_version(survey_id, ANALYTICS)
+
+
+def _count(namespace, result):
+    metrics.increment(metrics.CACHE_REQUESTS_TOTAL, namespace, result)
+
+
+def _entry_key(namespace, survey_id, version):
+    return f'survey:{namespace}:{survey_id}:v{version}'
+
+
+def _timeout_kwargs(namespace, timeout):
+    if timeout is None:
+        timeout = getattr(settings, 'SURVEY_CACHE_TIMEOUTS', {}).get(namespace)
+    return {} if timeout is None else {'timeout': timeout}
+
+
+def get_or_build(survey_id, builder, namespace=ANALYTICS, timeout=None):
+    """현재 버전의 캐시 값을 반환하고, 없으면 builder()로 생성 후 저장. (값, 적중 여부) 반환"""
+    cache = _cache()
+    key = _entry_key(namespace, survey_id, get_version(survey_id, namespace))
+    value = cache.get(key)
+    if value is not None:
+        _count(namespace, 'hits')
+        return value, True
+
+    _count(namespace, 'misses')
+    value = builder()
+    cache.set(key, value, **_timeout_kwargs(namespace, timeout))
+    return value, False
+
+
+async def aget_version(survey_id, namespace=ANALYTICS):
+    """get_version의 비동기 버전"""
+    cache = _cache()
+    key = _version_key(namespace, survey_id)
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, _new_version(), timeout=None)
+        version = await cache.aget(key)
+    return version
+
+
+async def aget_or_build(survey_id, builder, namespace=ANALYTICS, timeout=None):
+    """get_or_build의 비동기 버전 (builder는 코루틴 함수)"""
+    cache = _cache()
+    key = _entry_key(namespace, survey_id, await aget_version(survey_id, namespace))
+    value = await cache.aget(key)
+    if value is not None:
+        _count(namespace, 'hits')
+        return value, True
+
+    _count(namespace, 'misses')
+    value = await builder()
+    await cache.aset(key, value, **_timeout_kwargs(namespace, timeout))
+    return value, False
+
+
+def cache_stats(namespace=ANALYTICS):
+    """네임스페이스별 캐시 적중/실패 횟수 (모든 워커 합산)"""
+    counts = metrics.counter_values(metrics.CACHE_REQUESTS_TOTAL)
+    hits = counts.get((namespace, 'hits'), 0)
+    misses = counts.get((namespace, 'misses'), 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total, 4) if total else None,
+    }
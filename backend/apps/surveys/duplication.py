@@ -0,0 +1,44 @@
+"""설문 복제
+
+원본 설문 수와 질문 수에 관계없이 설문 INSERT 1회, 질문 SELECT/INSERT 각 1회로 복제한다.
+"""
+from collections import defaultdict
+
+from django.db import transaction
+
+from .models import Survey, Question
+from .tallies import rebuild_question_tallies
+
+QUESTION_COPY_FIELDS = ('text', 'description', 'type', 'required', 'order', 'options')
+
+
+@transaction.atomic
+def duplicate_surveys(surveys, creator):
+    """설문들을 임시저장 상태로 복제하여 복사본 목록 반환 (원본과 같은 순서, 같은 원본이 반복되면 각각 복제)"""
+    surveys = list(surveys)
+    copies = Survey.objects.bulk_create([
+        Survey(
+            title=f"{survey.title} (복사본)",
+            description=survey.description,
+            creator=creator,
+            status='draft'
+        )
+        for survey in surveys
+    ])
+    # 같은 원본이 여러 번 요청될 수 있으므로 원본 ID가 아니라 복사본마다 원본 질문을 붙임
+    questions_by_source = defaultdict(list)
+    for question in Question.objects.filter(survey_id__in={survey.id for survey in surveys}):
+        questions_by_source[question.survey_id].append(question)
+
+    questions = Question.objects.bulk_create([
+        Question(
+            survey=copy,
+            **{field: getattr(question, field) for field in QUESTION_COPY_FIELDS}
+        )
+        for survey, copy in zip(surveys, copies)
+        for question in questions_by_source[survey.id]
+    ])
+
+    # 복사된 질문의 집계 행 초기화
+    rebuild_question_tallies(questions)
+    return copies
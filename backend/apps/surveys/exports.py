@@ -0,0 +1,106 @@
+"""설문 응답 스트리밍 내보내기 (CSV / NDJSON)
+
+응답은 QuerySet.iterator(chunk_size)로 청크 단위로 읽고, 각 청크의 답변은 한 번의
+prefetch 쿼리로 가져온다. 행은 생성되는 즉시 StreamingHttpResponse로 전송되므로
+응답 수와 관계없이 워커 메모리 사용량이 일정하게 유지된다.
+
+ASGI에서는 Django가 동기 반복자를 sync_to_async(list)로 모두 모은 뒤 전송하므로,
+aiter_rows로 감싼 비동기 반복자를 넘겨 한 번에 최대 EXPORT_CHUNK_SIZE행만 메모리에 둔다.
+"""
+import csv
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from survey_project.renderers import dumps
+
+from .models import Answer
+
+EXPORT_CHUNK_SIZE = 500
+
+CSV_CONTENT_TYPE = 'text/csv; charset=utf-8'
+NDJSON_CONTENT_TYPE = 'application/x-ndjson; charset=utf-8'
+
+
+class _Echo:
+    """csv.writer가 쓴 한 줄을 그대로 반환하는 버퍼"""
+
+    def write(self, value):
+        return value
+
+
+def iter_responses(survey, chunk_size=EXPORT_CHUNK_SIZE):
+    """설문 응답을 제출 순서대로 청크 단위로 순회 (청크당 응답/답변 쿼리 각 1회)"""
+    answers = Answer.objects.only('response_id', 'question_id', 'text_answer', 'choice_answers')
+    return (
+        survey.responses
+        # survey_id: 관계 관리자가 각 응답에 설문을 연결할 때 읽으므로 지연 로딩되지 않도록 포함
+        .only('id', 'survey_id', 'respondent_email', 'submitted_at')
+        .order_by('submitted_at', 'id')
+        .prefetch_related(Prefetch('answers', queryset=answers))
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+def _next_rows(rows, count):
+    return list(islice(rows, count))
+
+
+async def aiter_rows(rows, batch_size=EXPORT_CHUNK_SIZE):
+    """동기 행 생성기를 ASGI 스트리밍용 비동기 반복자로 변환
+
+    생성기는 DB를 읽으므로 요청의 연결이 있는 스레드(thread_sensitive)에서 batch_size행씩 만든다.
+    """
+    next_rows = sync_to_async(_next_rows, thread_sensitive=True)
+    while True:
+        batch = await next_rows(rows, batch_size)
+        if not batch:
+            return
+        for row in batch:
+            yield row
+
+
+def _csv_value(answer):
+    if answer is None:
+        return ''
+    if answer.choice_answers:
+        return ', '.join(str(choice) for choice in answer.choice_answers)
+    return answer.text_answer
+
+
+def stream_csv(survey, questions):
+    """질문마다 한 열을 갖는 CSV 행 생성기"""
+    writer = csv.writer(_Echo())
+    question_ids = [question.id for question in questions]
+
+    # 엑셀에서 한글이 깨지지 않도록 BOM으로 시작
+    yield '\ufeff' + writer.writerow(
+        ['응답 ID', '제출일시', '응답자 이메일'] + [question.text for question in questions]
+    )
+    for response in iter_responses(survey):
+        answers = {answer.question_id: answer for answer in response.answers.all()}
+        yield writer.writerow(
+            [response.id, timezone.localtime(response.submitted_at).isoformat(), response.respondent_email]
+            + [_csv_value(answers.get(question_id)) for question_id in question_ids]
+        )
+
+
+def stream_ndjson(survey):
+    """응답 하나당 JSON 한 줄을 생성 (답변은 질문 ID로 키)"""
+    for response in iter_responses(survey):
+        record = {
+            'id': response.id,
+            'submitted_at': response.submitted_at,
+            'respondent_email': response.respondent_email,
+            'answers': {
+                str(answer.question_id): {
+                    'text_answer': answer.text_answer,
+                    'choice_answers': answer.choice_answers,
+                }
+                for answer in response.answers.all()
+            },
+        }
+        yield dumps(record) + b'\n'
@@ -0,0 +1,44 @@
+"""응답 제출 멱등성 키 저장소
+
+클라이언트는 Idempotency-Key 헤더(또는 본문의 client_submission_id)로 제출 한 건을 식별한다.
+처음 처리된 결과(상태 코드, 응답/제출 ID, 요청 본문 지문)를 SURVEY_IDEMPOTENCY_CACHE_ALIAS
+캐시에 SURVEY_IDEMPOTENCY_TTL 동안 보관하고, 같은 키로 다시 오면 저장 없이 그 결과를 돌려준다.
+제출마다 키가 하나씩 쌓이므로 설문 정의/분석 캐시(SURVEY_CACHE_ALIAS)와는 다른 캐시를 쓴다.
+
+캐시에서 키가 만료/축출된 뒤의 재시도는 (survey, client_submission_id) 유일 제약이 막는다.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 64
+
+
+def _cache():
+    return caches[getattr(settings, 'SURVEY_IDEMPOTENCY_CACHE_ALIAS', 'default')]
+
+
+def _store_key(survey_id, key):
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return f'survey:idempotency:{survey_id}:{digest}'
+
+
+def fingerprint(body):
+    """같은 키로 다른 내용을 보냈는지 판별하기 위한 요청 본문 지문"""
+    return hashlib.sha1(body).hexdigest()[:16]
+
+
+async def alookup(survey_id, key):
+    """저장된 (상태 코드, ID, 본문 지문) 또는 None"""
+    return await _cache().aget(_store_key(survey_id, key))
+
+
+async def aremember(survey_id, key, status_code, object_id, body_fingerprint):
+    """처리 결과 저장 (먼저 저장된 결과가 있으면 유지)"""
+    await _cache().aadd(
+        _store_key(survey_id, key),
+        (status_code, str(object_id), body_fingerprint),
+        timeout=settings.SURVEY_IDEMPOTENCY_TTL,
+    )
@@ -0,0 +1,54 @@
+"""응답 저장 경로
+
+응답/답변 행은 bulk_create로 한 번에 삽입하고, 집계 테이블, 시간대별 버킷과
+설문 응답 수는 F() 표현식으로 갱신한다. 모든 쓰기는 하나의 트랜잭션 안에서 수행되므로 제출 건수와
+관계없이 왕복 횟수가 일정하고, 동시 제출에서도 응답 수 증가가 유실되지 않는다.
+"""
+from django.db import transaction
+from django.db.models import F
+
+from .models import Survey, Question, Response, Answer
+from .tallies import record_answers
+from .timeline import record_submissions
+
+ANSWER_BATCH_SIZE = 1000
+
+
+@transaction.atomic
+def create_responses(survey, submissions, questions=None):
+    """여러 응답을 한 트랜잭션으로 저장
+
+    submissions는 (응답 필드 dict, 답변 목록) 튜플의 목록이며, 답변은
+    AnswerSerializer가 검증한 question_id / text_answer / choice_answers 를 갖는다.
+    """
+    responses = [Response(survey=survey, **fields) for fields, _ in submissions]
+    if not responses:
+        return responses
+    Response.objects.bulk_create(responses)
+
+    answers = [
+        Answer(
+            response=response,
+            question_id=answer_data['question_id'],
+            text_answer=answer_data['text_answer'],
+            choice_answers=answer_data['choice_answers'],
+        )
+        for response, (_, answers_data) in zip(responses, submissions)
+        for answer_data in answers_data
+    ]
+    Answer.objects.bulk_create(answers, batch_size=ANSWER_BATCH_SIZE)
+
+    # 질문/선택지 집계 갱신
+    if questions is None:
+        questions = Question.objects.filter(survey_id=survey.pk).only('id', 'type', 'options')
+    record_answers(
+        [(answer.question_id, answer.choice_answers) for answer in answers],
+        {question.id: question for question in questions}
+    )
+
+    # 시간/일 단위 제출 수 버킷 갱신
+    record_submissions(survey.pk, [response.submitted_at for response in responses])
+
+    # 응답 수 증가 (updated_at 등 다른 컬럼은 건드리지 않음)
+    Survey.objects.filter(pk=survey.pk).update(response_count=F('response_count') + len(responses))
+    return responses
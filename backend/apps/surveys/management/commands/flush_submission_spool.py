@@ -0,0 +1,39 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.surveys.spool import get_spool, flush_spool
+
+
+class Command(BaseCommand):
+    help = ('응답 제출 스풀을 큰 묶음으로 꺼내 데이터베이스에 저장합니다. '
+            '웹 프로세스와 같은 스풀 파일(SURVEY_SPOOL_PATH)을 볼 수 있는 곳에서 실행해야 합니다.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='스풀을 계속 감시하며 처리')
+        parser.add_argument('--interval', type=float, default=1.0, help='스풀이 비었을 때 대기 시간(초)')
+        parser.add_argument('--batch-size', type=int, default=settings.SURVEY_SPOOL_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        spool = get_spool()
+        flushed = 0
+        try:
+            while True:
+                close_old_connections()
+                count = flush_spool(spool, options['batch_size'])
+                flushed += count
+                if count:
+                    self.stdout.write(f'{count}개 제출 저장 (남은 항목 {spool.pending_count()}개)')
+                elif not options['loop']:
+                    break
+                else:
+                    time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(f'총 {flushed}개 제출을 처리했습니다.'))
+        quarantined = spool.quarantined_count()
+        if quarantined:
+            self.stdout.write(self.style.WARNING(f'격리된 제출 {quarantined}개가 스풀의 quarantined 테이블에 있습니다.'))
@@ -0,0 +1,68 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.surveys.models import Survey
+from apps.surveys.synthetic import QUESTION_TYPES, GenerationOptions, generate
+
+
+class Command(BaseCommand):
+    help = '부하 테스트용 합성 설문/질문/응답/답변을 대량으로 생성합니다. (같은 seed면 같은 데이터)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--surveys', type=int, default=10, help='생성할 설문 수')
+        parser.add_argument('--questions', type=int, default=10, help='설문당 질문 수 (모든 유형을 순환 배정)')
+        parser.add_argument('--responses', type=int, default=1000, help='설문당 응답 수')
+        parser.add_argument('--types', default=','.join(QUESTION_TYPES), help='사용할 질문 유형 (쉼표로 구분)')
+        parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+        parser.add_argument('--choice-skew', type=float, default=1.0,
+                            help='선택지 쏠림 정도 (0이면 균등, 클수록 앞쪽 선택지에 집중)')
+        parser.add_argument('--answer-rate', type=float, default=0.85, help='필수가 아닌 질문에 답할 확률')
+        parser.add_argument('--required-ratio', type=float, default=0.5, help='필수 질문 비율')
+        parser.add_argument('--email-rate', type=float, default=0.3, help='응답자 이메일을 남기는 비율')
+        parser.add_argument('--days', type=int, default=30, help='제출 시각을 분포시킬 기간(일)')
+        parser.add_argument('--until', help='제출 시각 기간의 끝 (ISO 8601, 기본값: 현재 시각)')
+        parser.add_argument('--status', default='active', choices=[status for status, _ in Survey.STATUS_CHOICES])
+        parser.add_argument('--batch-size', type=int, default=20000, help='한 번에 삽입할 답변 행 수')
+        parser.add_argument('--username', default='synthetic', help='설문 작성자 (없으면 생성)')
+
+    def handle(self, *args, **options):
+        types = [question_type.strip() for question_type in options['types'].split(',') if question_type.strip()]
+        unknown = set(types) - set(QUESTION_TYPES)
+        if not types or unknown:
+            raise CommandError(f"알 수 없는 질문 유형입니다: {', '.join(sorted(unknown)) or '(없음)'}")
+        until = timezone.now()
+        if options['until']:
+            until = parse_datetime(options['until'])
+            if until is None:
+                raise CommandError('--until은 ISO 8601 형식이어야 합니다.')
+            if timezone.is_naive(until):
+                until = timezone.make_aware(until)
+
+        generation = GenerationOptions(
+            surveys=options['surveys'], questions=options['questions'], responses=options['responses'],
+            types=types, seed=options['seed'], choice_skew=options['choice_skew'],
+            answer_rate=options['answer_rate'], required_ratio=options['required_ratio'],
+            email_rate=options['email_rate'], days=options['days'], until=until,
+            status=options['status'], batch_size=options['batch_size'],
+        )
+        if Survey.objects.filter(id=generation.first_survey_id()).exists():
+            raise CommandError(f"같은 seed({options['seed']})로 생성한 데이터가 이미 있습니다. 다른 --seed를 지정하세요.")
+
+        creator, _ = get_user_model().objects.get_or_create(username=options['username'])
+
+        started = time.monotonic()
+
+        def progress(survey, responses, answers):
+            self.stdout.write(f'{survey.id} {survey.title}: 응답 {responses:,}개, 답변 {answers:,}개')
+
+        surveys, responses, answers = generate(creator, generation, progress)
+        elapsed = time.monotonic() - started
+        rate = answers / elapsed * 60 if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'설문 {surveys:,}개, 응답 {responses:,}개, 답변 {answers:,}개를 {elapsed:.1f}초에 생성했습니다. '
+            f'(분당 답변 {rate:,.0f}개)'
+        ))
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Sum
+
+from apps.surveys.models import Survey
+from apps.surveys.tallies import rebuild_question_tallies
+from apps.surveys.timeline import rebuild_time_buckets
+
+
+class Command(BaseCommand):
+    help = ('답변/응답 테이블로부터 질문/선택지 집계, 시간대별 응답 수 버킷과 설문별 응답 수를 다시 생성합니다. '
+            '설문별 조회 수는 일 단위 버킷의 조회 수 합계로 맞춥니다.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('survey_ids', nargs='*', help='대상 설문 ID (생략 시 전체 설문)')
+
+    def handle(self, *args, **options):
+        surveys = Survey.objects.all()
+        if options['survey_ids']:
+            surveys = surveys.filter(id__in=options['survey_ids'])
+
+        rebuilt = 0
+        for survey in surveys.iterator():
+            # 설문 단위 트랜잭션으로 메모리와 잠금 범위를 제한
+            with transaction.atomic():
+                rebuild_question_tallies(survey.questions.all())
+                rebuild_time_buckets([survey.pk])
+                Survey.objects.filter(pk=survey.pk).update(
+                    response_count=survey.responses.count(),
+                    view_count=survey.time_buckets.filter(granularity='day').aggregate(total=Sum('views'))['total'] or 0,
+                )
+            rebuilt += 1
+            self.stdout.write(f'{survey.id} {survey.title}')
+
+        self.stdout.write(self.style.SUCCESS(f'{rebuilt}개 설문의 집계를 다시 생성했습니다.'))
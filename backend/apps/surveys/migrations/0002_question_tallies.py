@@ -0,0 +1,86 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:24
+
+from collections import defaultdict
+
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+import uuid
+
+from apps.surveys.tallies import compute_distribution
+
+
+def backfill_question_tallies(apps, schema_editor):
+    """기존 질문의 집계 행을 답변으로부터 생성 (질문 1000개마다 GROUP BY 쿼리 1회)
+
+    조회 시점의 지연 재구성이 동시 제출과 경합하지 않도록 배포 시 미리 채운다.
+    선택지 일치 규칙은 제출 시 증분과 같도록 tallies.compute_distribution 을 사용한다.
+    """
+    Question = apps.get_model('surveys', 'Question')
+    Answer = apps.get_model('surveys', 'Answer')
+    QuestionTally = apps.get_model('surveys', 'QuestionTally')
+    OptionTally = apps.get_model('surveys', 'OptionTally')
+
+    question_ids = list(Question.objects.order_by('id').values_list('id', flat=True))
+    for offset in range(0, len(question_ids), 1000):
+        batch = question_ids[offset:offset + 1000]
+        groups = defaultdict(list)
+        rows = (
+            Answer.objects
+            .filter(question_id__in=batch)
+            .values('question_id', 'choice_answers')
+            .annotate(answer_count=Count('id'))
+            .order_by()
+        )
+        for row in rows:
+            groups[row['question_id']].append((row['choice_answers'], row['answer_count']))
+
+        question_tallies = []
+        option_tallies = []
+        for question in Question.objects.filter(id__in=batch).only('id', 'type', 'options'):
+            total_answers, option_counts = compute_distribution(question, groups.get(question.id, []))
+            question_tallies.append(QuestionTally(question_id=question.id, total_answers=total_answers))
+            option_tallies.extend(
+                OptionTally(question_id=question.id, option=key, count=count)
+                for key, count in option_counts.items()
+            )
+        QuestionTally.objects.bulk_create(question_tallies, batch_size=1000)
+        OptionTally.objects.bulk_create(option_tallies, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surveys', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuestionTally',
+            fields=[
+                ('question', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='tally', serialize=False, to='surveys.question', verbose_name='질문')),
+                ('total_answers', models.IntegerField(default=0, verbose_name='답변수')),
+            ],
+            options={
+                'verbose_name': '질문 집계',
+                'verbose_name_plural': '질문 집계들',
+                'db_table': 'question_tallies',
+            },
+        ),
+        migrations.CreateModel(
+            name='OptionTally',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('option', models.TextField(verbose_name='선택지')),
+                ('count', models.IntegerField(default=0, verbose_name='선택수')),
+                ('question', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='option_tallies', to='surveys.question', verbose_name='질문')),
+            ],
+            options={
+                'verbose_name': '선택지 집계',
+                'verbose_name_plural': '선택지 집계들',
+                'db_table': 'option_tallies',
+                'unique_together': {('question', 'option')},
+            },
+        ),
+        migrations.RunPython(backfill_question_tallies, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:29
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surveys', '0002_question_tallies'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='response',
+            name='client_submission_id',
+            field=models.CharField(blank=True, max_length=64, null=True, verbose_name='클라이언트 제출 ID'),
+        ),
+        migrations.AlterField(
+            model_name='response',
+            name='submitted_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='제출일시'),
+        ),
+        migrations.AddConstraint(
+            model_name='response',
+            constraint=models.UniqueConstraint(fields=('survey', 'client_submission_id'), name='responses_survey_client_submission_uniq'),
+        ),
+    ]
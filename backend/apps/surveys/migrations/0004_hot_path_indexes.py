@@ -0,0 +1,48 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:47
+
+from django.db import migrations, models
+
+# answers.choice_answers 인덱스 (DB별로 다른 방식)
+#   PostgreSQL: jsonb containment(@>, choice_answers__contains)용 GIN 인덱스
+#   SQLite: GIN이 없으므로 질문별 선택 답변 GROUP BY/일치 조회용 B-tree 인덱스
+CHOICE_ANSWER_INDEXES = {
+    'postgresql': (
+        'CREATE INDEX IF NOT EXISTS answers_choice_answers_gin ON answers USING gin (choice_answers jsonb_path_ops)',
+        'DROP INDEX IF EXISTS answers_choice_answers_gin',
+    ),
+    'sqlite': (
+        'CREATE INDEX IF NOT EXISTS answers_question_choice_idx ON answers (question_id, choice_answers)',
+        'DROP INDEX IF EXISTS answers_question_choice_idx',
+    ),
+}
+
+
+def create_choice_answer_index(apps, schema_editor):
+    statements = CHOICE_ANSWER_INDEXES.get(schema_editor.connection.vendor)
+    if statements:
+        schema_editor.execute(statements[0])
+
+
+def drop_choice_answer_index(apps, schema_editor):
+    statements = CHOICE_ANSWER_INDEXES.get(schema_editor.connection.vendor)
+    if statements:
+        schema_editor.execute(statements[1])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surveys', '0003_response_client_submission_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='response',
+            index=models.Index(fields=['survey', '-submitted_at', '-id'], name='responses_survey_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='survey',
+            index=models.Index(fields=['creator', '-created_at'], name='surveys_creator_created_idx'),
+        ),
+        migrations.RunPython(create_choice_answer_index, drop_choice_answer_index),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:59
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDay, TruncHour
+from django.utils import timezone
+import django.db.models.deletion
+import uuid
+
+
+def backfill_time_buckets(apps, schema_editor):
+    """기존 응답의 제출 시각으로 시간/일 단위 버킷 생성 (단위별 GROUP BY 쿼리 1회)"""
+    Response = apps.get_model('surveys', 'Response')
+    SurveyTimeBucket = apps.get_model('surveys', 'SurveyTimeBucket')
+    tzinfo = timezone.get_current_timezone()
+    for granularity, truncate in (('hour', TruncHour), ('day', TruncDay)):
+        rows = (
+            Response.objects
+            .annotate(bucket=truncate('submitted_at', tzinfo=tzinfo))
+            .values('survey_id', 'bucket')
+            .annotate(response_count=Count('id'))
+            .order_by()
+        )
+        SurveyTimeBucket.objects.bulk_create((
+            SurveyTimeBucket(
+                survey_id=row['survey_id'], granularity=granularity,
+                bucket_start=row['bucket'], responses=row['response_count'],
+            )
+            for row in rows.iterator()
+        ), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surveys', '0004_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SurveyTimeBucket',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('granularity', models.CharField(choices=[('hour', '시간'), ('day', '일')], max_length=4, verbose_name='단위')),
+                ('bucket_start', models.DateTimeField(verbose_name='구간 시작')),
+                ('responses', models.IntegerField(default=0, verbose_name='응답수')),
+                ('survey', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='time_buckets', to='surveys.survey', verbose_name='설문조사')),
+            ],
+            options={
+                'verbose_name': '시간대별 집계',
+                'verbose_name_plural': '시간대별 집계들',
+                'db_table': 'survey_time_buckets',
+                'unique_together': {('survey', 'granularity', 'bucket_start')},
+            },
+        ),
+        migrations.RunPython(backfill_time_buckets, migrations.RunPython.noop),
+    ]
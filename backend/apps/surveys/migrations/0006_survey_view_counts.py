@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-18 05:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surveys', '0005_survey_time_buckets'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='survey',
+            name='view_count',
+            field=models.IntegerField(default=0, verbose_name='조회수'),
+        ),
+        migrations.AddField(
+            model_name='surveytimebucket',
+            name='views',
+            field=models.IntegerField(default=0, verbose_name='조회수'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def resync_response_counts(apps, schema_editor):
+    """설문의 누적 응답 수(response_count)를 응답 행 수로 다시 맞춤 (UPDATE 1회)
+
+    분석 API가 응답 테이블을 세지 않고 response_count 를 읽으므로, 이전 코드에서
+    응답 삭제 등으로 어긋난 값을 배포 시 바로잡는다.
+    """
+    Survey = apps.get_model('surveys', 'Survey')
+    Response = apps.get_model('surveys', 'Response')
+    counts = (
+        Response.objects
+        .filter(survey_id=OuterRef('pk'))
+        .order_by()
+        .values('survey_id')
+        .annotate(response_count=Count('id'))
+        .values('response_count')
+    )
+    Survey.objects.update(
+        response_count=Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surveys', '0006_survey_view_counts'),
+    ]
+
+    operations = [
+        migrations.RunPython(resync_response_counts, migrations.RunPython.noop),
+    ]
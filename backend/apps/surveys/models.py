@@ -22,12 +22,18 @@ class Survey(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
     response_count = models.IntegerField(default=0, verbose_name='응답수')
+    # 공개 설문 조회 수 (tracking 모듈이 주기적으로 모아서 증분 갱신)
+    view_count = models.IntegerField(default=0, verbose_name='조회수')
     
     class Meta:
         db_table = 'surveys'
         ordering = ['-created_at']
         verbose_name = '설문조사'
         verbose_name_plural = '설문조사들'
+        indexes = [
+            # 작성자별 설문 목록 (최신순)
+            models.Index(fields=['creator', '-created_at'], name='surveys_creator_created_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -78,14 +84,26 @@ class Response(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     survey = models.ForeignKey(Survey, on_delete=models.CASCADE, related_name='responses', verbose_name='설문조사')
     respondent_email = models.EmailField(blank=True, verbose_name='응답자 이메일')
-    submitted_at = models.DateTimeField(auto_now_add=True, verbose_name='제출일시')
+    # 스풀을 거쳐 늦게 저장되는 응답도 접수 시각을 유지하도록 기본값으로 설정
+    submitted_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name='제출일시')
     ip_address = models.GenericIPAddressField(null=True, blank=True, verbose_name='IP 주소')
+    client_submission_id = models.CharField(max_length=64, null=True, blank=True, verbose_name='클라이언트 제출 ID')
     
     class Meta:
         db_table = 'responses'
         ordering = ['-submitted_at']
         verbose_name = '응답'
         verbose_name_plural = '응답들'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['survey', 'client_submission_id'],
+                name='responses_survey_client_submission_uniq'
+            ),
+        ]
+        indexes = [
+            # 설문별 응답 목록/키셋 페이지네이션/내보내기 (submitted_at, id) 순서
+            models.Index(fields=['survey', '-submitted_at', '-id'], name='responses_survey_submitted_idx'),
+        ]
     
     def __str__(self):
         return f"{self.survey.title} - {self.submitted_at.strftime('%Y-%m-%d %H:%M')}"
@@ -103,6 +121,64 @@ class Answer(models.Model):
         verbose_name = '답변'
         verbose_name_plural = '답변들'
         unique_together = ['response', 'question']
+        # choice_answers 인덱스는 DB별로 다르므로 마이그레이션 0004에서 직접 생성
+        # (PostgreSQL: jsonb_path_ops GIN, SQLite: (question_id, choice_answers) B-tree)
     
     def __str__(self):
         return f"{self.question.text[:30]} - {self.text_answer[:30] if self.text_answer else self.choice_answers}"
+
+
+class QuestionTally(models.Model):
+    """질문별 누적 답변 수 (제출 시 증분 갱신)"""
+    question = models.OneToOneField(Question, on_delete=models.CASCADE, primary_key=True, related_name='tally', verbose_name='질문')
+    total_answers = models.IntegerField(default=0, verbose_name='답변수')
+    
+    class Meta:
+        db_table = 'question_tallies'
+        verbose_name = '질문 집계'
+        verbose_name_plural = '질문 집계들'
+    
+    def __str__(self):
+        return f"{self.question_id} - {self.total_answers}"
+
+
+class OptionTally(models.Model):
+    """질문의 선택지별 누적 선택 수 (제출 시 증분 갱신)"""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    question = models.ForeignKey(Question, on_delete=models.CASCADE, related_name='option_tallies', verbose_name='질문')
+    option = models.TextField(verbose_name='선택지')
+    count = models.IntegerField(default=0, verbose_name='선택수')
+    
+    class Meta:
+        db_table = 'option_tallies'
+        verbose_name = '선택지 집계'
+        verbose_name_plural = '선택지 집계들'
+        unique_together = ['question', 'option']
+    
+    def __str__(self):
+        return f"{self.option} - {self.count}"
+
+
+class SurveyTimeBucket(models.Model):
+    """설문별 시간 단위(시/일) 제출 수 (제출 시 증분 갱신)와 조회 수 (주기적으로 모아서 갱신)"""
+    GRANULARITY_CHOICES = [
+        ('hour', '시간'),
+        ('day', '일'),
+    ]
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    survey = models.ForeignKey(Survey, on_delete=models.CASCADE, related_name='time_buckets', verbose_name='설문조사')
+    granularity = models.CharField(max_length=4, choices=GRANULARITY_CHOICES, verbose_name='단위')
+    bucket_start = models.DateTimeField(verbose_name='구간 시작')
+    responses = models.IntegerField(default=0, verbose_name='응답수')
+    views = models.IntegerField(default=0, verbose_name='조회수')
+    
+    class Meta:
+        db_table = 'survey_time_buckets'
+        verbose_name = '시간대별 집계'
+        verbose_name_plural = '시간대별 집계들'
+        # 설문/단위별 기간 조회 (bucket_start 범위 스캔)에도 사용
+        unique_together = ['survey', 'granularity', 'bucket_start']
+    
+    def __str__(self):
+        return f"{self.survey_id} {self.granularity} {self.bucket_start:%Y-%m-%d %H:%M} - {self.responses}/{self.views}"
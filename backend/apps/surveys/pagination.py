@@ -0,0 +1,79 @@
+"""응답 목록 키셋(커서) 페이지네이션
+
+(submitted_at, id) 쌍을 커서로 사용하여 OFFSET 없이 다음 페이지를 조회한다.
+어느 페이지든 인덱스 탐색 한 번과 page_size 만큼의 행만 읽으므로 비용이 일정하다.
+"""
+import base64
+import binascii
+import uuid
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class ResponseKeysetPagination(BasePagination):
+    """최신 응답부터 (submitted_at, id) 역순으로 페이지를 나누는 커서 페이지네이션"""
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    invalid_cursor_message = '유효하지 않은 커서입니다.'
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return api_settings.PAGE_SIZE
+        return max(1, min(page_size, self.max_page_size))
+
+    def encode_cursor(self, response):
+        raw = f'{response.submitted_at.isoformat()}|{response.id}'
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            submitted_at, response_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+            submitted_at = parse_datetime(submitted_at)
+            response_id = uuid.UUID(response_id)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if submitted_at is None:
+            raise NotFound(self.invalid_cursor_message)
+        return submitted_at, response_id
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by('-submitted_at', '-id')
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            submitted_at, response_id = self.decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(submitted_at__lt=submitted_at) | Q(submitted_at=submitted_at, id__lt=response_id)
+            )
+
+        # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+        page = list(queryset[:self.page_size + 1])
+        self.has_next = len(page) > self.page_size
+        page = page[:self.page_size]
+        self.next_cursor = self.encode_cursor(page[-1]) if self.has_next else None
+        return page
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data, **extra):
+        return Response({
+            **extra,
+            'next': self.get_next_link(),
+            'page_size': self.page_size,
+            'results': data,
+        })
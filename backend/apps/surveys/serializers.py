@@ -1,16 +1,23 @@
+import json
+from collections import defaultdict
 from rest_framework import serializers
+from django.db import transaction
 from .models import Survey, Question, Response, Answer
+from .tallies import rebuild_question_tallies
+from .ingest import create_responses
+from .caching import invalidate_survey
 from apps.authentication.serializers import UserSerializer
+from survey_project.fieldsets import SparseFieldsetMixin
 import logging
 
 logger = logging.getLogger(__name__)
 
-class QuestionSerializer(serializers.ModelSerializer):
+class QuestionSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Question
         fields = ('id', 'text', 'description', 'type', 'required', 'order', 'options')
 
-class SurveySerializer(serializers.ModelSerializer):
+class SurveySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     questions = QuestionSerializer(many=True, read_only=True)
     creator = UserSerializer(read_only=True)
     
@@ -20,26 +27,61 @@ class SurveySerializer(serializers.ModelSerializer):
                  'created_at', 'updated_at', 'response_count', 'questions')
         read_only_fields = ('id', 'creator', 'created_at', 'updated_at', 'response_count')
 
+class PublicSurveySerializer(SurveySerializer):
+    """공개 설문 정의 (응답 수 제외: 정의 캐시는 제출 시 갱신되지 않으므로 오래된 값이 노출됨)"""
+    class Meta(SurveySerializer.Meta):
+        fields = tuple(field for field in SurveySerializer.Meta.fields if field != 'response_count')
+
+class QuestionWriteSerializer(QuestionSerializer):
+    """설문 생성/수정용 질문 직렬화 (기존 질문을 식별하기 위해 id 입력 허용)"""
+    id = serializers.UUIDField(required=False)
+
+# 질문 수정 시 비교하는 필드와 집계 재생성이 필요한 필드
+QUESTION_SYNC_FIELDS = ('text', 'description', 'type', 'required', 'order', 'options')
+QUESTION_TALLY_FIELDS = ('type', 'options')
+
+class SurveyListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """설문 목록용 요약 표현 (작성자/질문 중첩 없이 개수만 포함)"""
+    question_count = serializers.IntegerField(read_only=True)
+    live_response_count = serializers.IntegerField(read_only=True)
+    
+    class Meta:
+        model = Survey
+        fields = ('id', 'title', 'description', 'status', 'scheduled_date', 'created_at',
+                 'updated_at', 'response_count', 'question_count', 'live_response_count')
+        read_only_fields = fields
+
 class SurveyCreateSerializer(serializers.ModelSerializer):
-    questions = QuestionSerializer(many=True, required=False)
+    questions = QuestionWriteSerializer(many=True, required=False)
     
     class Meta:
         model = Survey
         fields = ('title', 'description', 'status', 'scheduled_date', 'questions')
     
+    def validate_questions(self, value):
+        orders = [question['order'] for question in value]
+        if len(orders) != len(set(orders)):
+            raise serializers.ValidationError('질문 순서(order)가 중복되었습니다.')
+        return value
+    
+    @transaction.atomic
     def create(self, validated_data):
         logger.info(f"SurveyCreateSerializer received data: {validated_data}")
         questions_data = validated_data.pop('questions', [])
-        logger.info(f"Questions data: {questions_data}")
         survey = Survey.objects.create(**validated_data)
-        logger.info(f"Created survey: {survey.id}")
+        logger.info(f"Created survey: {survey.id} with {len(questions_data)} questions")
+        
+        questions = Question.objects.bulk_create([
+            Question(survey=survey, **self._question_fields(question_data))
+            for question_data in questions_data
+        ])
         
-        for i, question_data in enumerate(questions_data):
-            logger.info(f"Creating question {i+1}: {question_data}")
-            Question.objects.create(survey=survey, **question_data)
+        # 새 질문들의 집계 행 초기화
+        rebuild_question_tallies(questions)
         
         return survey
     
+    @transaction.atomic
     def update(self, instance, validated_data):
         logger.info(f"SurveyCreateSerializer update received data: {validated_data}")
         questions_data = validated_data.pop('questions', [])
@@ -51,15 +93,96 @@ class SurveyCreateSerializer(serializers.ModelSerializer):
         
         # Handle questions update
         if questions_data:
-            # Delete existing questions
-            instance.questions.all().delete()
-            
-            # Create new questions
-            for question_data in questions_data:
-                logger.info(f"Creating updated question: {question_data}")
-                Question.objects.create(survey=instance, **question_data)
+            self._sync_questions(instance, questions_data)
         
+        invalidate_survey(instance.id)
         return instance
+    
+    @staticmethod
+    def _question_fields(question_data):
+        return {field: question_data[field] for field in QUESTION_SYNC_FIELDS if field in question_data}
+    
+    @staticmethod
+    def _match_questions(existing, questions_data):
+        """요청의 질문마다 대응하는 기존 질문 (없으면 None → 새 질문)
+        
+        id가 있으면 id로 대응시킨다. id가 없는 질문(id를 보내지 않는 클라이언트 호환)은
+        유형과 문구가 그대로인 기존 질문에만 대응시키고, 그 외에는 새 질문으로 만든다.
+        순서(order)만으로 대응시키면 질문을 지우거나 끼워 넣을 때 다른 질문의 답변이
+        엉뚱한 질문에 붙으므로 사용하지 않는다.
+        """
+        matches = [None] * len(questions_data)
+        kept_ids = set()
+        for index, question_data in enumerate(questions_data):
+            question = existing.get(question_data.get('id'))
+            if question is not None and question.id not in kept_ids:
+                matches[index] = question
+                kept_ids.add(question.id)
+        
+        unmatched = defaultdict(list)
+        for question in sorted(existing.values(), key=lambda question: question.order):
+            if question.id not in kept_ids:
+                unmatched[(question.type, question.text)].append(question)
+        for index, question_data in enumerate(questions_data):
+            if question_data.get('id') is not None:
+                continue
+            candidates = unmatched.get((question_data.get('type'), question_data.get('text')))
+            if candidates:
+                matches[index] = candidates.pop(0)
+        return matches
+    
+    def _sync_questions(self, survey, questions_data):
+        """기존 질문과 대응시켜 변경분만 일괄 반영 (변경 없는 질문과 그 답변은 유지)"""
+        existing = {question.id: question for question in survey.questions.all()}
+        
+        to_update = []
+        to_create = []
+        retally = []
+        kept_ids = set()
+        matches = self._match_questions(existing, questions_data)
+        for question_data, question in zip(questions_data, matches):
+            fields = self._question_fields(question_data)
+            if question is None:
+                to_create.append(Question(survey=survey, **fields))
+                continue
+            
+            kept_ids.add(question.id)
+            changed = [field for field, value in fields.items() if getattr(question, field) != value]
+            if not changed:
+                continue
+            if any(field in QUESTION_TALLY_FIELDS for field in changed):
+                retally.append(question)
+            to_update.append((question, fields))
+        
+        removed_ids = [question_id for question_id in existing if question_id not in kept_ids]
+        logger.info(
+            f"Syncing questions for survey {survey.id}: "
+            f"{len(to_update)} updated, {len(to_create)} created, {len(removed_ids)} deleted"
+        )
+        
+        if removed_ids:
+            Question.objects.filter(id__in=removed_ids).delete()
+        
+        if to_update:
+            # (survey, order) 유일 제약 충돌을 피하기 위해 순서가 바뀌는 질문은 임시 음수 순서로 먼저 이동
+            reordered = [question for question, fields in to_update if question.order != fields.get('order', question.order)]
+            for index, question in enumerate(reordered):
+                question.order = -(index + 1)
+            if reordered:
+                Question.objects.bulk_update(reordered, ['order'])
+            
+            for question, fields in to_update:
+                for field, value in fields.items():
+                    setattr(question, field, value)
+            Question.objects.bulk_update([question for question, _ in to_update], list(QUESTION_SYNC_FIELDS))
+        
+        created = Question.objects.bulk_create(to_create)
+        
+        # 새 질문과 유형/선택지가 바뀐 질문의 집계 재생성
+        rebuild_question_tallies(created + retally)
+
+# json.loads가 받아들이는 값의 첫 글자 (배열, 객체, 문자열, 숫자, true/false/null, NaN/Infinity)
+JSON_VALUE_START = frozenset('[{"-0123456789tfnNI')
 
 class AnswerSerializer(serializers.ModelSerializer):
     question_id = serializers.UUIDField(write_only=True)
@@ -77,9 +200,15 @@ class AnswerSerializer(serializers.ModelSerializer):
         """answer 필드를 적절한 필드로 변환"""
         answer = attrs.pop('answer', '')
         
+        # JSON 값으로 시작할 수 없는 문자열은 파싱 없이 텍스트 답변으로 처리
+        stripped = answer.lstrip()
+        if not stripped or stripped[0] not in JSON_VALUE_START:
+            attrs['text_answer'] = answer
+            attrs['choice_answers'] = []
+            return attrs
+        
         # JSON 문자열인지 확인해서 choice_answers 또는 text_answer로 분류
         try:
-            import json
             parsed_answer = json.loads(answer)
             if isinstance(parsed_answer, list):
                 attrs['choice_answers'] = parsed_answer
@@ -100,33 +229,63 @@ class ResponseSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Response
-        fields = ('respondent_email', 'respondent_name', 'answers')
+        fields = ('respondent_email', 'respondent_name', 'client_submission_id', 'answers')
+        extra_kwargs = {
+            'client_submission_id': {'write_only': True},
+        }
     
-    def create(self, validated_data):
-        answers_data = validated_data.pop('answers')
+    @staticmethod
+    def split_submission(validated_data):
+        """검증된 데이터를 (응답 필드, 답변 목록)으로 분리"""
+        fields = dict(validated_data)
+        answers_data = fields.pop('answers')
         # respondent_name은 데이터베이스에 저장하지 않고 제거
-        validated_data.pop('respondent_name', None)
-        
-        response = Response.objects.create(**validated_data)
-        
-        for answer_data in answers_data:
-            question_id = answer_data.pop('question_id')
-            Answer.objects.create(
-                response=response,
-                question_id=question_id,
-                **answer_data
-            )
-        
-        # 응답 수 증가
-        response.survey.response_count += 1
-        response.survey.save()
+        fields.pop('respondent_name', None)
+        return fields, answers_data
+    
+    def validate(self, attrs):
+        """설문별 검증기로 소속 질문, 유형, 선택지, 필수 응답 검사 (DB 조회 없음)"""
+        validator = self.context.get('answer_validator')
+        if validator is not None:
+            errors = validator.errors(attrs['answers'])
+            if errors:
+                raise serializers.ValidationError({'answers': errors})
+        return attrs
+    
+    def create(self, validated_data):
+        fields, answers_data = self.split_submission(validated_data)
+        survey = fields.pop('survey')
+        validator = self.context.get('answer_validator')
         
+        # 응답/답변 일괄 삽입, 집계 및 응답 수 갱신을 한 트랜잭션으로 처리
+        response, = create_responses(
+            survey, [(fields, answers_data)],
+            questions=validator.questions if validator is not None else None
+        )
         return response
 
-class ResponseDetailSerializer(serializers.ModelSerializer):
+class ResponseDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     answers = AnswerSerializer(many=True, read_only=True)
     survey = SurveySerializer(read_only=True)
     
     class Meta:
         model = Response
         fields = ('id', 'survey', 'respondent_email', 'submitted_at', 'answers')
+
+class ResponseCompactSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """설문 정보 없이 답변을 질문 ID로 키잉한 간결한 응답 표현"""
+    answers = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = Response
+        fields = ('id', 'respondent_email', 'submitted_at', 'answers')
+        field_prefetches = {'answers': ('answers',)}
+    
+    def get_answers(self, obj):
+        return {
+            str(answer.question_id): {
+                'text_answer': answer.text_answer,
+                'choice_answers': answer.choice_answers,
+            }
+            for answer in obj.answers.all()
+        }
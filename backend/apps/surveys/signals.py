@@ -0,0 +1,25 @@
+from django.db.models import F
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from .models import Survey, Question, Response
+from .tallies import discount_response
+from .timeline import discount_submission
+from .caching import bump_version
+
+
+def _deleted_with_parent(origin):
+    """설문/질문 삭제에 따른 연쇄 삭제인지 확인 (집계 행도 함께 삭제되므로 차감 불필요)"""
+    model = getattr(origin, 'model', None) or type(origin)
+    return issubclass(model, (Survey, Question))
+
+
+@receiver(pre_delete, sender=Response)
+def discount_deleted_response(sender, instance, origin=None, **kwargs):
+    """응답 삭제 시 질문/선택지 집계, 시간대별 버킷과 응답 수에서 차감"""
+    if origin is not None and _deleted_with_parent(origin):
+        return
+    discount_response(instance)
+    discount_submission(instance)
+    Survey.objects.filter(pk=instance.survey_id).update(response_count=F('response_count') - 1)
+    bump_version(instance.survey_id)
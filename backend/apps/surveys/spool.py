@@ -0,0 +1,312 @@
+"""응답 제출 쓰기 지연(write-behind) 스풀
+
+SURVEY_SUBMISSION_MODE = 'spool' 이면 submit_response는 검증된 응답을 로컬 SQLite 큐에
+추가하고 바로 202를 반환한다. 웹 프로세스마다 도는 데몬 스레드(SURVEY_SPOOL_IN_PROCESS_FLUSH)가
+SURVEY_SPOOL_FLUSH_INTERVAL초마다 큐를 큰 묶음으로 꺼내 ingest.create_responses로 저장한다.
+
+- 배치 제약: 스풀은 웹 프로세스의 로컬 파일이므로 같은 파일을 여는 프로세스만 비울 수 있다.
+  Heroku/Railway처럼 프로세스 유형마다 별도 컨테이너(파일 시스템)를 쓰는 환경에서 별도
+  flush_submission_spool 프로세스를 띄우면 웹 프로세스의 스풀을 읽지 못한다. 별도 작업자는
+  SURVEY_SPOOL_PATH가 공유 볼륨에 있을 때만 사용하고, 그 외에는 프로세스 내 반영을 사용한다.
+
+- 내구성: WAL + synchronous=FULL 로 추가된 항목은 커밋 즉시 디스크에 기록된다.
+- 장애 복구: 꺼낸 항목은 임대(lease) 시각만 기록되고, 저장 완료 후에만 삭제된다.
+  작업자가 중간에 죽으면 임대가 만료된 뒤 다른 작업자가 다시 가져간다.
+- 정확히 한 번: 항목마다 client_submission_id가 있고, DB의 (survey, client_submission_id)
+  유일 제약과 저장 전 중복 조회로 재처리 시에도 응답이 한 번만 저장된다.
+- 격리: 저장 중 예상하지 못한 오류가 난 묶음은 quarantined 테이블로 옮기고 로그를 남긴다.
+  같은 항목으로 반영이 계속 실패하지 않도록 하며, DB 연결 오류는 항목 문제가 아니므로 재시도한다.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import defaultdict
+from pathlib import Path
+
+from django.conf import settings
+from django.db import IntegrityError, InterfaceError, OperationalError, connection
+from django.utils.dateparse import parse_datetime
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS submissions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    submission_id TEXT NOT NULL,
+    survey_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    received_at TEXT NOT NULL,
+    claimed_at REAL,
+    UNIQUE (survey_id, submission_id)
+)
+"""
+
+QUARANTINE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quarantined (
+    id INTEGER PRIMARY KEY,
+    submission_id TEXT NOT NULL,
+    survey_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    received_at TEXT NOT NULL,
+    error TEXT NOT NULL,
+    quarantined_at REAL NOT NULL
+)
+"""
+
+
+class SubmissionSpool:
+    """SQLite 파일 기반의 추가 전용 제출 큐 (여러 프로세스에서 동시 사용 가능)"""
+
+    def __init__(self, path=None, lease_seconds=None):
+        self.path = Path(path or settings.SURVEY_SPOOL_PATH)
+        self.lease_seconds = lease_seconds or settings.SURVEY_SPOOL_LEASE_SECONDS
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(SCHEMA)
+            conn.execute(QUARANTINE_SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute('PRAGMA synchronous=FULL')
+        return _Connection(conn)
+
+    def append(self, survey_id, submission_id, payload, received_at):
+        """검증된 제출을 큐에 추가 (설문별로 같은 submission_id는 한 번만 저장). 새로 추가되면 True"""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                'INSERT OR IGNORE INTO submissions (submission_id, survey_id, payload, received_at) '
+                'VALUES (?, ?, ?, ?)',
+                (submission_id, str(survey_id), json.dumps(payload, ensure_ascii=False), received_at.isoformat())
+            )
+            return cursor.rowcount == 1
+
+    def claim(self, batch_size):
+        """처리할 항목을 임대하여 반환 (임대가 만료된 항목 포함)"""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            rows = conn.execute(
+                'SELECT id, submission_id, survey_id, payload, received_at FROM submissions '
+                'WHERE claimed_at IS NULL OR claimed_at < ? ORDER BY id LIMIT ?',
+                (now - self.lease_seconds, batch_size)
+            ).fetchall()
+            ids = [row[0] for row in rows]
+            conn.execute(f'UPDATE submissions SET claimed_at = ? WHERE id IN ({_placeholders(ids)})', [now, *ids])
+            conn.execute('COMMIT')
+        return [
+            {
+                'id': row[0],
+                'submission_id': row[1],
+                'survey_id': row[2],
+                'payload': json.loads(row[3]),
+                'received_at': parse_datetime(row[4]),
+            }
+            for row in rows
+        ]
+
+    def ack(self, ids):
+        """저장이 끝난 항목 삭제"""
+        with self._connect() as conn:
+            conn.execute(f'DELETE FROM submissions WHERE id IN ({_placeholders(ids)})', list(ids))
+
+    def release(self, ids):
+        """저장에 실패한 항목의 임대를 해제하여 다음 처리에서 재시도"""
+        with self._connect() as conn:
+            conn.execute(f'UPDATE submissions SET claimed_at = NULL WHERE id IN ({_placeholders(ids)})', list(ids))
+
+    def quarantine(self, ids, error):
+        """저장할 수 없는 항목을 quarantined 테이블로 옮김 (오류 내용과 함께 보관)"""
+        ids = list(ids)
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute(
+                'INSERT OR REPLACE INTO quarantined '
+                '(id, submission_id, survey_id, payload, received_at, error, quarantined_at) '
+                'SELECT id, submission_id, survey_id, payload, received_at, ?, ? FROM submissions '
+                f'WHERE id IN ({_placeholders(ids)})',
+                [error, time.time(), *ids]
+            )
+            conn.execute(f'DELETE FROM submissions WHERE id IN ({_placeholders(ids)})', ids)
+            conn.execute('COMMIT')
+
+    def pending_count(self):
+        with self._connect() as conn:
+            return conn.execute('SELECT COUNT(*) FROM submissions').fetchone()[0]
+
+    def quarantined_count(self):
+        with self._connect() as conn:
+            return conn.execute('SELECT COUNT(*) FROM quarantined').fetchone()[0]
+
+
+def _placeholders(values):
+    return ', '.join('?' * len(values))
+
+
+class _Connection:
+    """with 블록 종료 시 연결을 닫는 sqlite3 연결 래퍼"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self.conn
+
+    def __exit__(self, *exc_info):
+        self.conn.close()
+
+
+_spool = None
+
+
+def get_spool():
+    """프로세스 공용 스풀 인스턴스 (최초 사용 시 파일/스키마 생성)"""
+    global _spool
+    if _spool is None:
+        _spool = SubmissionSpool()
+    return _spool
+
+
+def spool_payload(fields, answers_data):
+    """검증된 응답을 스풀에 저장할 JSON 형식으로 변환"""
+    return {
+        'fields': fields,
+        'answers': [
+            {
+                'question_id': str(answer['question_id']),
+                'text_answer': answer['text_answer'],
+                'choice_answers': answer['choice_answers'],
+            }
+            for answer in answers_data
+        ],
+    }
+
+
+def _store_entries(survey, entries):
+    """한 설문의 스풀 항목들을 저장. 새로 저장한 제출이 있으면 True"""
+    from .ingest import create_responses
+    from .models import Question, Response
+
+    # 이미 저장된 제출(이전 처리 도중 중단된 경우)은 건너뜀
+    submission_ids = [entry['submission_id'] for entry in entries]
+    stored = set(
+        Response.objects.filter(survey=survey, client_submission_id__in=submission_ids)
+        .values_list('client_submission_id', flat=True)
+    )
+    questions = list(Question.objects.filter(survey_id=survey.pk).only('id', 'type', 'options'))
+    question_ids = {question.id for question in questions}
+
+    submissions = []
+    for entry in entries:
+        if entry['submission_id'] in stored:
+            continue
+        payload = entry['payload']
+        fields = {
+            **payload['fields'],
+            'client_submission_id': entry['submission_id'],
+            'submitted_at': entry['received_at'],
+        }
+        # 스풀 이후 삭제된 질문의 답변은 제외
+        answers_data = [
+            {**answer, 'question_id': uuid.UUID(answer['question_id'])}
+            for answer in payload['answers']
+            if uuid.UUID(answer['question_id']) in question_ids
+        ]
+        submissions.append((fields, answers_data))
+
+    create_responses(survey, submissions, questions=questions)
+    return bool(submissions)
+
+
+def flush_spool(spool, batch_size=None):
+    """스풀에서 한 묶음을 꺼내 설문별로 일괄 저장. 처리(저장/폐기/격리)한 항목 수 반환"""
+    from .caching import bump_version
+    from .models import Survey
+
+    entries = spool.claim(batch_size or settings.SURVEY_SPOOL_BATCH_SIZE)
+    by_survey = defaultdict(list)
+    for entry in entries:
+        by_survey[entry['survey_id']].append(entry)
+
+    processed = 0
+    batches = list(by_survey.items())
+    for index, (survey_id, survey_entries) in enumerate(batches):
+        spool_ids = [entry['id'] for entry in survey_entries]
+        try:
+            survey = Survey.objects.filter(id=survey_id).first()
+            if survey is None:
+                logger.warning(f"Dropping {len(spool_ids)} spooled submissions for deleted survey {survey_id}")
+                spool.ack(spool_ids)
+                processed += len(spool_ids)
+                continue
+            if _store_entries(survey, survey_entries):
+                bump_version(survey.id)
+        except IntegrityError:
+            # 다른 작업자가 같은 항목을 동시에 저장한 경우: 임대를 풀고 다음 처리에서 중복 제거
+            logger.exception(f"Spool flush conflict for survey {survey_id}, retrying later")
+            spool.release(spool_ids)
+            continue
+        except (OperationalError, InterfaceError):
+            # DB 연결 문제는 항목 탓이 아니므로 남은 묶음까지 임대를 풀고 다음 처리에서 재시도
+            logger.exception(f"Database unavailable while flushing spool, retrying {len(entries) - processed} entries later")
+            spool.release([entry['id'] for _, remaining in batches[index:] for entry in remaining])
+            break
+        except Exception as exc:
+            # 저장할 수 없는 항목(손상된 페이로드, 예상하지 못한 오류)이 반영을 계속 막지 않도록 격리
+            logger.exception(f"Quarantining {len(spool_ids)} spooled submissions for survey {survey_id}")
+            spool.quarantine(spool_ids, f'{type(exc).__name__}: {exc}')
+            processed += len(spool_ids)
+            continue
+
+        spool.ack(spool_ids)
+        processed += len(spool_ids)
+
+    return processed
+
+
+class _PeriodicFlusher:
+    """SURVEY_SPOOL_FLUSH_INTERVAL초마다 스풀을 비우는 데몬 스레드 (웹 프로세스별 하나)
+
+    같은 스풀 파일을 여는 여러 워커가 각자 돌아도 임대(claim)로 항목을 나누어 가진다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pid = None
+
+    def ensure_started(self):
+        # fork된 워커에는 마스터의 스레드가 복제되지 않으므로 프로세스 ID로 시작 여부 판단
+        if self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.pid != os.getpid():
+                threading.Thread(target=self.run, name='survey-spool-flush', daemon=True).start()
+                self.pid = os.getpid()
+
+    def run(self):
+        while True:
+            time.sleep(settings.SURVEY_SPOOL_FLUSH_INTERVAL)
+            if settings.SURVEY_SUBMISSION_MODE != 'spool' or not settings.SURVEY_SPOOL_IN_PROCESS_FLUSH:
+                continue
+            try:
+                # 한 간격 동안 쌓인 항목을 모두 비움
+                while flush_spool(get_spool()):
+                    pass
+            except Exception:
+                logger.exception('Periodic spool flush failed')
+            finally:
+                # 이 스레드의 연결을 다음 간격까지 붙잡아 두지 않음 (풀 사용 시 반환)
+                connection.close()
+
+
+flusher = _PeriodicFlusher()
+
+
+def start_flusher():
+    """spool 모드이고 프로세스 내 반영이 켜져 있으면 이 프로세스의 반영 스레드 시작"""
+    if settings.SURVEY_SUBMISSION_MODE == 'spool' and settings.SURVEY_SPOOL_IN_PROCESS_FLUSH:
+        flusher.ensure_started()
@@ -0,0 +1,287 @@
+"""대용량 합성 데이터 생성 (generate_survey_data 명령)
+
+모든 질문 유형을 포함한 설문/질문은 ORM bulk_create로, 수가 많은 응답/답변 행은
+모델 인스턴스를 만들지 않고 DB 값으로 바로 만들어 묶음 단위로 삽입한다.
+PostgreSQL(psycopg2)에서는 COPY, 그 밖의 DB에서는 executemany를 사용한다.
+
+같은 seed와 옵션이면 같은 ID와 내용이 생성된다 (시각은 until 기준의 상대 값).
+질문/선택지 집계, 시간대별 버킷과 응답 수는 생성하면서 메모리에서 세어 마지막에 한 번에 기록한다.
+"""
+import csv
+import io
+import json
+import random
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import timedelta
+from itertools import accumulate
+
+from django.db import connection, transaction
+
+from .models import Answer, OptionTally, Question, QuestionTally, Response, Survey, SurveyTimeBucket
+from .tallies import CHOICE_QUESTION_TYPES, MULTI_CHOICE_TYPES, option_key
+from .timeline import bucket_start, rollup
+
+QUESTION_TYPES = [question_type for question_type, _ in Question.QUESTION_TYPES]
+
+OPTION_SETS = [
+    ['매우 그렇다', '그렇다', '보통이다', '그렇지 않다', '전혀 그렇지 않다'],
+    ['매일', '주 2~3회', '주 1회', '월 1~2회', '거의 사용하지 않음'],
+    ['프로그래밍', '데이터베이스', '네트워크', '보안', '클라우드', '인공지능'],
+    ['온라인', '오프라인', '혼합형'],
+    ['10대', '20대', '30대', '40대', '50대 이상'],
+]
+
+QUESTION_TEXTS = {
+    'text': '한 단어로 표현한다면?',
+    'textarea': '개선할 점이 있다면 자유롭게 작성해 주세요.',
+    'radio': '전반적으로 만족하셨나요?',
+    'checkbox': '도움이 된 항목을 모두 골라 주세요.',
+    'dropdown': '해당하는 항목을 선택해 주세요.',
+    'rating': '점수를 매겨 주세요. (1~5)',
+    'date': '참여한 날짜를 알려 주세요.',
+    'time': '주로 이용하는 시간대는?',
+    'email': '결과를 받을 이메일 주소',
+    'phone': '연락 가능한 전화번호',
+}
+
+SHORT_TEXTS = ['좋음', '만족', '보통', '아쉬움', '유익함', '재미있음', '어려움', '무난함', '최고', '지루함']
+SENTENCES = [
+    '강의 내용이 실무에 많은 도움이 되었습니다.',
+    '실습 시간이 조금 더 길었으면 좋겠습니다.',
+    '설명이 이해하기 쉬웠습니다.',
+    '자료가 미리 공유되면 좋겠습니다.',
+    '진행 속도가 약간 빨랐습니다.',
+    '질문에 친절하게 답변해 주셔서 감사합니다.',
+    '다음 과정도 참여하고 싶습니다.',
+    '온라인 환경에서 음질이 고르지 않았습니다.',
+]
+# 평점 1~5의 상대 빈도, 제출 시각(시)별 상대 빈도 (오전/저녁에 몰림)
+RATING_WEIGHTS = [1, 2, 5, 8, 5]
+HOUR_WEIGHTS = [1, 1, 1, 1, 1, 2, 3, 5, 7, 9, 10, 9, 8, 8, 9, 9, 8, 7, 7, 8, 9, 8, 5, 2]
+CHECKBOX_PICKS = [1, 2, 3]
+CHECKBOX_PICK_WEIGHTS = [5, 3, 2]
+
+
+@dataclass
+class GenerationOptions:
+    surveys: int = 10
+    questions: int = 10
+    responses: int = 1000
+    types: list = field(default_factory=lambda: list(QUESTION_TYPES))
+    seed: int = 0
+    choice_skew: float = 1.0
+    answer_rate: float = 0.85
+    required_ratio: float = 0.5
+    email_rate: float = 0.3
+    days: int = 30
+    until: object = None
+    status: str = 'active'
+    batch_size: int = 20000
+
+    def first_survey_id(self):
+        """이 seed로 생성될 첫 설문의 ID (같은 seed로 이미 생성했는지 확인용)"""
+        return uuid.UUID(int=_IdSource(self.seed).next())
+
+
+class _RowWriter:
+    """DB 값으로 만든 행을 묶음 삽입 (PostgreSQL은 COPY)"""
+
+    def __init__(self):
+        self.use_copy = connection.vendor == 'postgresql'
+        self.native_uuid = connection.features.has_native_uuid_field
+
+    def uuid(self, value):
+        if self.native_uuid:
+            text = f'{value:032x}'
+            return f'{text[:8]}-{text[8:12]}-{text[12:16]}-{text[16:20]}-{text[20:]}'
+        return f'{value:032x}'
+
+    def datetime(self, value):
+        if self.use_copy:
+            return value.isoformat()
+        return connection.ops.adapt_datetimefield_value(value)
+
+    def insert(self, model, field_names, rows):
+        if not rows:
+            return
+        table = connection.ops.quote_name(model._meta.db_table)
+        columns = ', '.join(connection.ops.quote_name(model._meta.get_field(name).column) for name in field_names)
+        with connection.cursor() as cursor:
+            raw = cursor.cursor
+            if self.use_copy and hasattr(raw, 'copy_expert'):
+                # NULL 값은 만들지 않으므로 모든 값을 따옴표로 감싸 빈 문자열과 구분
+                buffer = io.StringIO()
+                csv.writer(buffer, quoting=csv.QUOTE_ALL).writerows(rows)
+                buffer.seek(0)
+                raw.copy_expert(f'COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)', buffer)
+            else:
+                placeholders = ', '.join(['%s'] * len(field_names))
+                cursor.executemany(f'INSERT INTO {table} ({columns}) VALUES ({placeholders})', rows)
+
+
+class _IdSource:
+    """seed로 결정되는 UUID4 값"""
+
+    def __init__(self, seed):
+        self.rng = random.Random(f'{seed}:ids')
+
+    def next(self):
+        value = self.rng.getrandbits(128)
+        # 버전 4, RFC 4122 변형 비트 설정
+        value = (value & ~(0xF000 << 64)) | (0x4000 << 64)
+        return (value & ~(0xC000 << 48)) | (0x8000 << 48)
+
+
+def _skewed_cum_weights(count, skew):
+    """앞쪽 선택지가 더 자주 선택되는 누적 가중치 (skew=0이면 균등)"""
+    return list(accumulate(1 / (rank + 1) ** skew for rank in range(count)))
+
+
+def _answer_generator(question, rng, options, until):
+    """질문 하나의 답변 생성기: () -> (text_answer, choice_answers JSON, 선택지 키 목록)"""
+    question_type = question.type
+    empty = json.dumps([])
+
+    if question_type in CHOICE_QUESTION_TYPES:
+        choices = question.options
+        cum_weights = _skewed_cum_weights(len(choices), options.choice_skew)
+        if question_type not in MULTI_CHOICE_TYPES:
+            encoded = [('', json.dumps([choice]), (option_key(choice),)) for choice in choices]
+            return lambda: rng.choices(encoded, cum_weights=cum_weights)[0]
+
+        indexes = range(len(choices))
+        cache = {}
+
+        def multiple():
+            picks = rng.choices(CHECKBOX_PICKS, CHECKBOX_PICK_WEIGHTS)[0]
+            selected = tuple(sorted(set(rng.choices(indexes, cum_weights=cum_weights, k=picks))))
+            result = cache.get(selected)
+            if result is None:
+                values = [choices[index] for index in selected]
+                result = cache[selected] = ('', json.dumps(values), tuple(option_key(value) for value in values))
+            return result
+        return multiple
+
+    text_generators = {
+        'text': lambda: rng.choice(SHORT_TEXTS),
+        'textarea': lambda: ' '.join(rng.sample(SENTENCES, rng.randint(1, 3))),
+        'rating': lambda: str(rng.choices(range(1, 6), RATING_WEIGHTS)[0]),
+        'date': lambda: (until - timedelta(days=rng.randrange(365))).date().isoformat(),
+        'time': lambda: f'{rng.randrange(8, 23):02d}:{rng.choice((0, 15, 30, 45)):02d}',
+        'email': lambda: f'respondent{rng.randrange(10 ** 6)}@example.com',
+        'phone': lambda: f'010-{rng.randrange(10 ** 4):04d}-{rng.randrange(10 ** 4):04d}',
+    }
+    make_text = text_generators[question_type]
+    return lambda: (make_text(), empty, ())
+
+
+def _create_survey(creator, index, rng, ids, options):
+    survey = Survey.objects.create(
+        id=uuid.UUID(int=ids.next()), title=f'합성 설문 {index + 1}',
+        description='generate_survey_data로 생성한 데이터', creator=creator, status=options.status,
+    )
+    # 모든 유형이 한 번씩 나오도록 순환 배정한 뒤 순서를 섞음
+    types = [options.types[order % len(options.types)] for order in range(options.questions)]
+    rng.shuffle(types)
+    questions = Question.objects.bulk_create([
+        Question(
+            id=uuid.UUID(int=ids.next()), survey=survey, order=order, type=question_type,
+            text=f'{order}. {QUESTION_TEXTS[question_type]}',
+            required=rng.random() < options.required_ratio,
+            options=rng.choice(OPTION_SETS) if question_type in CHOICE_QUESTION_TYPES else [],
+        )
+        for order, question_type in enumerate(types, start=1)
+    ])
+    return survey, questions
+
+
+def _write_tallies(survey, questions, response_count, totals, option_counts, hour_counts):
+    QuestionTally.objects.bulk_create([
+        QuestionTally(question=question, total_answers=totals[question.id]) for question in questions
+    ])
+    OptionTally.objects.bulk_create([
+        OptionTally(question=question, option=option_key(choice), count=option_counts[(question.id, option_key(choice))])
+        for question in questions if question.type in CHOICE_QUESTION_TYPES
+        for choice in question.options
+    ])
+    SurveyTimeBucket.objects.bulk_create([
+        SurveyTimeBucket(survey_id=survey_id, granularity=granularity, bucket_start=start, responses=count)
+        for (survey_id, granularity, start), count in rollup(hour_counts).items()
+    ], batch_size=1000)
+    Survey.objects.filter(pk=survey.pk).update(response_count=response_count)
+
+
+def generate(creator, options, progress=None):
+    """합성 설문/응답/답변 생성. 생성한 (설문 수, 응답 수, 답변 수) 반환
+
+    progress(survey, responses, answers)는 설문 하나를 마칠 때마다 호출된다.
+    """
+    rng = random.Random(options.seed)
+    ids = _IdSource(options.seed)
+    writer = _RowWriter()
+    until = options.until
+    window_days = max(1, options.days)
+    hour_cum_weights = list(accumulate(HOUR_WEIGHTS))
+    hours = range(24)
+    response_fields = ('id', 'survey', 'respondent_email', 'submitted_at')
+    answer_fields = ('id', 'response', 'question', 'text_answer', 'choice_answers')
+
+    total_responses = total_answers = 0
+    for index in range(options.surveys):
+        with transaction.atomic():
+            survey, questions = _create_survey(creator, index, rng, ids, options)
+        survey_id = writer.uuid(survey.id.int)
+        answerers = [
+            (writer.uuid(question.id.int), question.id, question.required, _answer_generator(question, rng, options, until))
+            for question in questions
+        ]
+        totals = Counter()
+        option_counts = Counter()
+        hour_counts = Counter()
+        response_rows, answer_rows = [], []
+        survey_answers = 0
+
+        def flush():
+            with transaction.atomic():
+                writer.insert(Response, response_fields, response_rows)
+                writer.insert(Answer, answer_fields, answer_rows)
+            response_rows.clear()
+            answer_rows.clear()
+
+        for number in range(options.responses):
+            response_id = writer.uuid(ids.next())
+            submitted_at = (until - timedelta(days=rng.randrange(window_days))).replace(
+                hour=rng.choices(hours, cum_weights=hour_cum_weights)[0],
+                minute=rng.randrange(60), second=rng.randrange(60), microsecond=rng.randrange(10 ** 6),
+            )
+            if submitted_at > until:
+                submitted_at -= timedelta(days=1)
+            email = f'user{index}-{number}@example.com' if rng.random() < options.email_rate else ''
+            response_rows.append((response_id, survey_id, email, writer.datetime(submitted_at)))
+            hour_counts[(survey.id, bucket_start(submitted_at, 'hour'))] += 1
+
+            for question_db_id, question_id, required, answer in answerers:
+                if not required and rng.random() >= options.answer_rate:
+                    continue
+                text_answer, choice_answers, keys = answer()
+                answer_rows.append((writer.uuid(ids.next()), response_id, question_db_id, text_answer, choice_answers))
+                totals[question_id] += 1
+                for key in keys:
+                    option_counts[(question_id, key)] += 1
+
+            if len(answer_rows) >= options.batch_size:
+                survey_answers += len(answer_rows)
+                flush()
+
+        survey_answers += len(answer_rows)
+        flush()
+        with transaction.atomic():
+            _write_tallies(survey, questions, options.responses, totals, option_counts, hour_counts)
+
+        total_responses += options.responses
+        total_answers += survey_answers
+        if progress:
+            progress(survey, options.responses, survey_answers)
+    return options.surveys, total_responses, total_answers
@@ -0,0 +1,252 @@
+"""질문/선택지 집계 테이블 관리
+
+응답이 제출될 때 같은 트랜잭션 안에서 QuestionTally / OptionTally 카운터를 증분 갱신한다.
+분석 API는 답변 테이블을 다시 스캔하지 않고 질문 수에 비례하는 집계 행만 읽는다.
+기존 질문의 집계 행은 마이그레이션 0002에서 채우며, 그래도 집계 행이 없는 질문은
+조회 시점에 답변으로부터 재구성한다.
+"""
+import json
+import operator
+from collections import Counter, defaultdict
+from functools import reduce
+
+from django.db import connections, transaction
+from django.db.models import Case, Count, F, IntegerField, Q, Value, When
+
+from .models import Answer, Question, QuestionTally, OptionTally
+
+# 선택지 분포를 계산하는 질문 유형
+SINGLE_CHOICE_TYPES = ('radio', 'dropdown')
+MULTI_CHOICE_TYPES = ('checkbox',)
+CHOICE_QUESTION_TYPES = SINGLE_CHOICE_TYPES + MULTI_CHOICE_TYPES
+# 한 UPDATE 문에 넣는 집계 행 수
+CONDITION_BATCH_SIZE = 200
+
+
+def option_key(option):
+    """선택지 값을 집계 테이블의 키 문자열로 변환"""
+    if isinstance(option, str):
+        return option
+    return json.dumps(option, ensure_ascii=False, sort_keys=True)
+
+
+def _contains_option(question_type, choices, option):
+    """JSON containment(choice_answers__contains) 규칙과 동일하게 선택 여부 판단"""
+    if isinstance(choices, list):
+        return option in choices
+    # 배열이 아닌 값은 다중 선택 질문의 스칼라 비교에서만 일치할 수 있다
+    return question_type in MULTI_CHOICE_TYPES and choices == option
+
+
+def matching_option_keys(question, choices):
+    """답변(choice_answers)이 선택한 선택지 키 집합"""
+    if question.type not in CHOICE_QUESTION_TYPES:
+        return set()
+    return {
+        option_key(option) for option in question.options
+        if _contains_option(question.type, choices, option)
+    }
+
+
+def collect_answer_groups(question_ids):
+    """질문별 [(선택 답변, 답변 수), ...] 목록을 한 번의 GROUP BY 쿼리로 수집"""
+    groups = defaultdict(list)
+    question_ids = list(question_ids)
+    if not question_ids:
+        return groups
+
+    rows = (
+        Answer.objects
+        .filter(question_id__in=question_ids)
+        .values('question_id', 'choice_answers')
+        .annotate(answer_count=Count('id'))
+        .order_by()
+    )
+    for row in rows:
+        groups[row['question_id']].append((row['choice_answers'], row['answer_count']))
+    return groups
+
+
+def compute_distribution(question, groups):
+    """집계된 그룹으로부터 (전체 답변 수, {선택지 키: 선택 수}) 계산"""
+    total_answers = sum(count for _, count in groups)
+    option_counts = {option_key(option): 0 for option in question.options} \
+        if question.type in CHOICE_QUESTION_TYPES else {}
+
+    for choices, count in groups:
+        for key in matching_option_keys(question, choices):
+            option_counts[key] += count
+
+    return total_answers, option_counts
+
+
+def answer_deltas(answers, questions_by_id):
+    """(question_id, choice_answers) 목록으로부터 집계 증분 계산"""
+    total_deltas = Counter()
+    option_deltas = Counter()
+    for question_id, choices in answers:
+        question = questions_by_id.get(question_id)
+        if question is None:
+            continue
+        total_deltas[question_id] += 1
+        for key in matching_option_keys(question, choices):
+            option_deltas[(question_id, key)] += 1
+    return total_deltas, option_deltas
+
+
+def _delta_case(deltas):
+    """[(행 조건, 증분), ...] → 행마다 자신의 증분을 고르는 CASE 식"""
+    return Case(
+        *(When(condition, then=Value(delta)) for condition, delta in deltas),
+        default=Value(0), output_field=IntegerField(),
+    )
+
+
+def lock_rows(queryset, *ordering):
+    """갱신할 집계 행을 키 순서로 미리 잠금 (트랜잭션 안에서 호출)
+
+    UPDATE는 힙(저장) 순서로 행을 잠그고 갱신된 행은 위치가 바뀌므로, 같은 행을 갱신하는
+    동시 트랜잭션끼리 잠금 순서가 엇갈려 교착 상태가 생길 수 있다.
+    SELECT ... FOR UPDATE ORDER BY 는 정렬한 뒤 잠그므로 모든 트랜잭션이 같은 순서로 기다린다.
+    행 잠금이 없는 DB(SQLite는 쓰기 트랜잭션이 DB 전체를 잠금)에서는 쿼리를 보내지 않는다.
+    """
+    if not connections[queryset.db].features.has_select_for_update:
+        return
+    list(queryset.select_for_update().order_by(*ordering).values_list('pk', flat=True))
+
+
+def apply_deltas(total_deltas, option_deltas, sign=1):
+    """집계 증분을 F() 표현식으로 반영 (테이블마다 CASE로 행별 증분을 고르는 UPDATE 1회)
+
+    증분 값별로 UPDATE를 나누면 동시 제출이 같은 집계 행을 서로 다른 순서로 잠그므로
+    행을 키 순서로 먼저 잠근 뒤 한 문장으로 갱신한다.
+    """
+    question_ids = sorted(question_id for question_id, delta in total_deltas.items() if delta)
+    for offset in range(0, len(question_ids), CONDITION_BATCH_SIZE):
+        batch = question_ids[offset:offset + CONDITION_BATCH_SIZE]
+        lock_rows(QuestionTally.objects.filter(question_id__in=batch), 'question_id')
+        QuestionTally.objects.filter(question_id__in=batch).update(
+            total_answers=F('total_answers') + _delta_case(
+                (Q(question_id=question_id), total_deltas[question_id] * sign) for question_id in batch
+            )
+        )
+
+    option_keys = sorted(key for key, delta in option_deltas.items() if delta)
+    for offset in range(0, len(option_keys), CONDITION_BATCH_SIZE):
+        # OR 조건이 너무 길어지지 않도록 나누어 갱신 (SQLite 식 깊이 제한)
+        conditions = [
+            (Q(question_id=question_id, option=key), option_deltas[(question_id, key)] * sign)
+            for question_id, key in option_keys[offset:offset + CONDITION_BATCH_SIZE]
+        ]
+        rows = OptionTally.objects.filter(reduce(operator.or_, (condition for condition, _ in conditions)))
+        lock_rows(rows, 'question_id', 'option')
+        rows.update(count=F('count') + _delta_case(conditions))
+
+
+def record_answers(answers, questions_by_id):
+    """새로 저장된 답변들을 집계에 반영"""
+    apply_deltas(*answer_deltas(answers, questions_by_id))
+
+
+def discount_response(response):
+    """삭제되는 응답의 답변들을 집계에서 차감"""
+    answers = list(response.answers.values_list('question_id', 'choice_answers'))
+    if not answers:
+        return
+    questions = Question.objects.filter(
+        id__in={question_id for question_id, _ in answers}
+    ).only('id', 'type', 'options')
+    questions_by_id = {question.id: question for question in questions}
+    apply_deltas(*answer_deltas(answers, questions_by_id), sign=-1)
+
+
+@transaction.atomic
+def rebuild_question_tallies(questions):
+    """질문들의 집계 행을 답변 테이블로부터 다시 계산 (질문 수와 무관하게 쿼리 수 고정)
+
+    없는 집계 행을 먼저 0으로 만들고(동시 생성은 무시) 모든 행을 키 순서로 잠근 뒤
+    지우지 않고 제자리에서 덮어쓴다. 잠금 이후 커밋되는 제출의 증분은 재계산 결과 위에
+    더해지고, 같은 질문을 동시에 재계산해도 기본 키 충돌이나 교착 상태가 생기지 않는다.
+    """
+    # 같은 질문이 두 번 들어오면 한 INSERT ... ON CONFLICT 안에서 같은 행을 두 번 갱신하게 됨
+    questions = sorted({question.id: question for question in questions}.values(), key=lambda question: question.id)
+    if not questions:
+        return {}
+
+    question_ids = [question.id for question in questions]
+    option_keys = sorted(
+        (question.id, option_key(option)) for question in questions
+        if question.type in CHOICE_QUESTION_TYPES for option in question.options
+    )
+    QuestionTally.objects.bulk_create(
+        [QuestionTally(question_id=question_id) for question_id in question_ids], ignore_conflicts=True,
+    )
+    OptionTally.objects.bulk_create(
+        [OptionTally(question_id=question_id, option=key) for question_id, key in dict.fromkeys(option_keys)],
+        ignore_conflicts=True,
+    )
+    lock_rows(QuestionTally.objects.filter(question_id__in=question_ids), 'question_id')
+    existing_options = list(
+        OptionTally.objects.select_for_update().filter(question_id__in=question_ids)
+        .order_by('question_id', 'option').values_list('pk', 'question_id', 'option')
+    )
+
+    groups = collect_answer_groups(question_ids)
+    results = {}
+    question_tallies = []
+    option_tallies = []
+    for question in questions:
+        total_answers, option_counts = compute_distribution(question, groups.get(question.id, []))
+        results[question.id] = (total_answers, option_counts)
+        question_tallies.append(QuestionTally(question=question, total_answers=total_answers))
+        option_tallies.extend(
+            OptionTally(question=question, option=key, count=count)
+            for key, count in sorted(option_counts.items())
+        )
+
+    QuestionTally.objects.bulk_create(
+        question_tallies, update_conflicts=True, unique_fields=['question'], update_fields=['total_answers'],
+    )
+    OptionTally.objects.bulk_create(
+        option_tallies, update_conflicts=True, unique_fields=['question', 'option'], update_fields=['count'],
+    )
+    # 질문 수정으로 사라진 선택지의 집계 행 삭제
+    stale = [pk for pk, question_id, key in existing_options if key not in results[question_id][1]]
+    if stale:
+        OptionTally.objects.filter(pk__in=stale).delete()
+    return results
+
+
+def load_question_tallies(questions):
+    """질문별 (전체 답변 수, {선택지 키: 선택 수})를 집계 테이블에서 읽기"""
+    questions = list(questions)
+    question_ids = [question.id for question in questions]
+
+    totals = dict(
+        QuestionTally.objects.filter(question_id__in=question_ids)
+        .values_list('question_id', 'total_answers')
+    )
+    option_counts = defaultdict(dict)
+    for question_id, key, count in (
+        OptionTally.objects.filter(question_id__in=question_ids)
+        .values_list('question_id', 'option', 'count')
+    ):
+        option_counts[question_id][key] = count
+
+    results = {
+        question_id: (total, option_counts[question_id])
+        for question_id, total in totals.items()
+    }
+
+    # 집계 행이 없는 질문은 답변으로부터 재구성
+    missing = [question for question in questions if question.id not in totals]
+    if missing:
+        results.update(rebuild_question_tallies(missing))
+    return results
+
+
+def rebuild_tallies_for_question_ids(question_ids):
+    """질문 ID 목록의 집계를 다시 생성 (관리자 화면 수정 등 증분 갱신이 어려운 경우)"""
+    question_ids = {question_id for question_id in question_ids if question_id}
+    if question_ids:
+        rebuild_question_tallies(Question.objects.filter(id__in=question_ids))
@@ -0,0 +1,627 @@
+import json
+import shutil
+import tempfile
+import time
+import uuid
+from importlib import import_module
+from unittest import mock
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import OperationalError
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, Client, TestCase, TransactionTestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from . import idempotency
+from . import spool as spool_module
+from . import views
+from .caching import cache_stats
+from .exports import aiter_rows
+from .ingest import create_responses
+from .models import Answer, OptionTally, Question, QuestionTally, Response, Survey, SurveyTimeBucket
+from .spool import SubmissionSpool, flush_spool
+from .tallies import load_question_tallies, rebuild_question_tallies
+
+
+def make_survey(questions, status='active', creator=None):
+    """작성자와 설문, 질문 생성. questions는 [(유형, 선택지), ...]"""
+    creator = creator or get_user_model().objects.create_user(
+        username=f'tester-{uuid.uuid4().hex[:8]}', password='test-password'
+    )
+    survey = Survey.objects.create(title='테스트 설문', creator=creator, status=status)
+    created = Question.objects.bulk_create([
+        Question(survey=survey, text=f'질문 {order}', type=question_type, order=order, options=options)
+        for order, (question_type, options) in enumerate(questions, start=1)
+    ])
+    rebuild_question_tallies(created)
+    return survey
+
+
+def post_json(client, url, data, **headers):
+    return client.post(url, json.dumps(data, ensure_ascii=False), content_type='application/json', **headers)
+
+
+class SurveyCacheMixin:
+    """테스트마다 설문 캐시(정의/분석/멱등성 키)를 비움"""
+
+    def setUp(self):
+        super().setUp()
+        caches[settings.SURVEY_CACHE_ALIAS].clear()
+        caches[settings.SURVEY_IDEMPOTENCY_CACHE_ALIAS].clear()
+
+
+class QueryCountTests(SurveyCacheMixin, TestCase):
+    """엔드포인트별 쿼리 수가 데이터 규모와 무관하게 고정되는지 확인 (N+1 회귀 감지)"""
+
+    EXPECTED = {
+        'survey-list': ('/api/surveys/', 2),
+        'survey-detail': ('/api/surveys/{id}/', 2),
+        'analytics': ('/api/surveys/{id}/analytics/', 4),
+        'timeline': ('/api/surveys/{id}/timeline/?granularity=hour', 2),
+        'responses': ('/api/surveys/{id}/responses/', 4),
+        'responses-page': ('/api/surveys/{id}/responses/?page_size=20', 4),
+        'public': ('/api/public/{id}/', 2),
+    }
+
+    def seed(self, scale):
+        user = get_user_model().objects.create_user(username=f'scale-{scale}', password='test-password')
+        surveys = []
+        for _ in range(scale):
+            survey = make_survey([('radio', ['예', '아니오'])] * scale, creator=user)
+            questions = list(survey.questions.all())
+            create_responses(survey, [
+                ({}, [
+                    {'question_id': question.id, 'text_answer': '', 'choice_answers': ['예']}
+                    for question in questions
+                ])
+                for _ in range(scale)
+            ], questions=questions)
+            surveys.append(survey)
+        return user, surveys[0]
+
+    def assert_query_counts(self, scale):
+        user, survey = self.seed(scale)
+        client = APIClient()
+        client.force_authenticate(user)
+        for name, (url, expected) in self.EXPECTED.items():
+            with self.subTest(name=name, scale=scale), self.assertNumQueries(expected):
+                response = client.get(url.format(id=survey.id))
+                self.assertEqual(response.status_code, 200)
+
+    def test_small(self):
+        self.assert_query_counts(2)
+
+    def test_large(self):
+        self.assert_query_counts(12)
+
+
+class CacheStatsTests(SurveyCacheMixin, TestCase):
+    def test_hit_is_counted_without_cache_writes(self):
+        """캐시 적중은 캐시에 쓰지 않고 요청 지표에 집계되어 cache_stats에 보고됨"""
+        survey = make_survey([('radio', ['예', '아니오'])])
+        client = APIClient()
+        client.force_authenticate(survey.creator)
+        url = f'/api/surveys/{survey.id}/analytics/'
+        before = cache_stats()
+        self.assertEqual(client.get(url)['X-Analytics-Cache'], 'MISS')
+
+        cache = caches[settings.SURVEY_CACHE_ALIAS]
+        with mock.patch.object(cache, 'set') as cache_set, mock.patch.object(cache, 'add') as cache_add, \
+                mock.patch.object(cache, 'incr') as cache_incr:
+            self.assertEqual(client.get(url)['X-Analytics-Cache'], 'HIT')
+        for write in (cache_set, cache_add, cache_incr):
+            write.assert_not_called()
+
+        after = cache_stats()
+        self.assertEqual((after['hits'] - before['hits'], after['misses'] - before['misses']), (1, 1))
+
+
+class AnswerValidationTests(SurveyCacheMixin, TestCase):
+    def test_out_of_range_date_time_answers(self):
+        """형식은 맞지만 범위를 벗어난 날짜/시간 답변은 500이 아니라 400 필드 오류"""
+        survey = make_survey([('date', []), ('time', [])])
+        date_question, time_question = survey.questions.order_by('order')
+        for question, value in ((date_question, '2024-02-30'), (time_question, '25:00')):
+            response = post_json(self.client, f'/api/public/{survey.id}/submit/', {
+                'answers': [{'question_id': str(question.id), 'answer': value}],
+            })
+            self.assertEqual(response.status_code, 400, value)
+            self.assertIn(str(question.id), response.json()['answers'])
+
+        response = post_json(self.client, f'/api/public/{survey.id}/submit/', {
+            'answers': [
+                {'question_id': str(date_question.id), 'answer': '2024-02-29'},
+                {'question_id': str(time_question.id), 'answer': '23:59'},
+            ],
+        })
+        self.assertEqual(response.status_code, 201)
+
+
+class IdempotentSubmissionTests(SurveyCacheMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.survey = make_survey([('text', [])])
+        self.question = self.survey.questions.get()
+        self.url = f'/api/public/{self.survey.id}/submit/'
+
+    def body(self, answer='응답'):
+        return {'answers': [{'question_id': str(self.question.id), 'answer': answer}]}
+
+    def test_replay_returns_first_result(self):
+        first = post_json(self.client, self.url, self.body(), HTTP_IDEMPOTENCY_KEY='key-1')
+        self.assertEqual(first.status_code, 201)
+        replay = post_json(self.client, self.url, self.body(), HTTP_IDEMPOTENCY_KEY='key-1')
+        self.assertEqual(replay.status_code, 201)
+        self.assertEqual(replay['Idempotent-Replayed'], 'true')
+        self.assertEqual(replay.json()['response_id'], first.json()['response_id'])
+        self.assertEqual(Response.objects.filter(survey=self.survey).count(), 1)
+        # 멱등성 키는 설문 캐시가 아니라 전용 캐시에 저장
+        key = idempotency._store_key(self.survey.id, 'key-1')
+        self.assertIsNotNone(caches[settings.SURVEY_IDEMPOTENCY_CACHE_ALIAS].get(key))
+        self.assertIsNone(caches[settings.SURVEY_CACHE_ALIAS].get(key))
+
+    def test_same_key_with_different_body_is_rejected(self):
+        post_json(self.client, self.url, self.body(), HTTP_IDEMPOTENCY_KEY='key-1')
+        response = post_json(self.client, self.url, self.body('다른 응답'), HTTP_IDEMPOTENCY_KEY='key-1')
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(Response.objects.filter(survey=self.survey).count(), 1)
+
+    def test_retry_after_key_eviction_returns_stored_response(self):
+        first = post_json(self.client, self.url, self.body(), HTTP_IDEMPOTENCY_KEY='key-1')
+        caches[settings.SURVEY_IDEMPOTENCY_CACHE_ALIAS].clear()
+        retry = post_json(self.client, self.url, self.body(), HTTP_IDEMPOTENCY_KEY='key-1')
+        self.assertEqual(retry.status_code, 200)
+        self.assertEqual(retry.json()['response_id'], first.json()['response_id'])
+        self.assertEqual(Response.objects.filter(survey=self.survey).count(), 1)
+
+
+class BatchSubmissionTests(SurveyCacheMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.survey = make_survey([('text', [])])
+        self.question = self.survey.questions.get()
+        self.url = f'/api/public/{self.survey.id}/submit/batch/'
+
+    def item(self, client_submission_id):
+        return {
+            'client_submission_id': client_submission_id,
+            'answers': [{'question_id': str(self.question.id), 'answer': client_submission_id}],
+        }
+
+    def test_duplicate_submission_ids(self):
+        """같은 요청 안의 중복/이미 저장된 client_submission_id는 500 없이 duplicate로 보고"""
+        response = post_json(self.client, self.url, {'responses': [self.item('a'), self.item('a'), self.item('b')]})
+        self.assertEqual(response.status_code, 201)
+        body = response.json()
+        self.assertEqual((body['created'], body['duplicates'], body['failed']), (2, 1, 0))
+        first, repeat, _ = body['results']
+        self.assertEqual(repeat['status'], 'duplicate')
+        self.assertEqual(repeat['response_id'], first['response_id'])
+
+        # 재전송: 이미 저장된 ID는 기존 응답 ID를 돌려주고 새 항목만 저장
+        response = post_json(self.client, self.url, [self.item('a'), self.item('b'), self.item('c')])
+        self.assertEqual(response.status_code, 201)
+        body = response.json()
+        self.assertEqual([result['status'] for result in body['results']], ['duplicate', 'duplicate', 'created'])
+        self.assertEqual(body['results'][0]['response_id'], first['response_id'])
+
+        response = post_json(self.client, self.url, [self.item('a'), self.item('c')])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['duplicates'], 2)
+        self.assertEqual(Response.objects.filter(survey=self.survey).count(), 3)
+
+    def test_concurrent_insert_of_same_submission_id(self):
+        """조회 이후 다른 요청이 같은 ID를 먼저 저장한 경우 IntegrityError 후 재시도"""
+        original = views.create_responses
+        calls = []
+
+        def racing_create(survey, submissions, **kwargs):
+            if not calls:
+                calls.append(1)
+                original(survey, [({'client_submission_id': 'd'}, [])])
+            return original(survey, submissions, **kwargs)
+
+        views.create_responses = racing_create
+        try:
+            response = post_json(self.client, self.url, [self.item('d'), self.item('e')])
+        finally:
+            views.create_responses = original
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([result['status'] for result in response.json()['results']], ['duplicate', 'created'])
+        self.assertEqual(Response.objects.filter(survey=self.survey).count(), 2)
+
+
+class TallyRebuildTests(SurveyCacheMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.survey = make_survey([('checkbox', ['a', 'b'])])
+        self.question = self.survey.questions.get()
+        for choices in (['a'], ['a', 'b']):
+            response = post_json(self.client, f'/api/public/{self.survey.id}/submit/', {
+                'answers': [{'question_id': str(self.question.id), 'answer': json.dumps(choices)}],
+            })
+            self.assertEqual(response.status_code, 201)
+
+    def option_rows(self):
+        return dict(OptionTally.objects.filter(question=self.question).values_list('option', 'count'))
+
+    def test_rebuild_overwrites_rows_in_place(self):
+        """재계산은 기존 집계 행을 덮어쓰고 사라진 선택지 행만 지움 (같은 질문이 중복돼도 충돌 없음)"""
+        kept = OptionTally.objects.get(question=self.question, option='a').pk
+        Question.objects.filter(pk=self.question.pk).update(options=['a', 'c'])
+        self.question.refresh_from_db()
+        results = rebuild_question_tallies([self.question, self.question])
+
+        self.assertEqual(results[self.question.id], (2, {'a': 2, 'c': 0}))
+        self.assertEqual(self.option_rows(), {'a': 2, 'c': 0})
+        self.assertEqual(OptionTally.objects.get(question=self.question, option='a').pk, kept)
+        self.assertEqual(QuestionTally.objects.get(question=self.question).total_answers, 2)
+
+    def test_read_rebuilds_missing_tally_over_existing_rows(self):
+        """집계 행 일부가 이미 있어도(동시 재구성) 조회 시 재구성이 키 충돌 없이 끝남"""
+        QuestionTally.objects.filter(question=self.question).delete()
+        OptionTally.objects.filter(question=self.question).update(count=0)
+        self.assertEqual(load_question_tallies([self.question]), {self.question.id: (2, {'a': 2, 'b': 1})})
+        self.assertEqual(self.option_rows(), {'a': 2, 'b': 1})
+
+
+class QuestionSyncTests(SurveyCacheMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.survey = make_survey([('text', []), ('radio', ['예', '아니오'])])
+        self.text_question, self.radio_question = self.survey.questions.order_by('order')
+        response = post_json(Client(), f'/api/public/{self.survey.id}/submit/', {
+            'answers': [
+                {'question_id': str(self.text_question.id), 'answer': '좋아요'},
+                {'question_id': str(self.radio_question.id), 'answer': '예'},
+            ],
+        })
+        self.assertEqual(response.status_code, 201)
+        self.client = APIClient()
+        self.client.force_authenticate(self.survey.creator)
+
+    def put_questions(self, questions):
+        response = self.client.put(f'/api/surveys/{self.survey.id}/', {
+            'title': '테스트 설문 (수정)', 'description': '', 'status': 'active', 'questions': questions,
+        }, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        return response
+
+    def question(self, text, question_type='text', order=1, options=(), **extra):
+        return {
+            'text': text, 'description': '', 'type': question_type, 'required': False,
+            'order': order, 'options': list(options), **extra,
+        }
+
+    def test_reorder_and_remove_by_id_keeps_answers(self):
+        """id를 보내면 순서를 바꾸고 질문 하나를 빼도 남은 질문과 답변은 유지"""
+        self.put_questions([
+            self.question('질문 2', 'radio', 1, ['예', '아니오'], id=str(self.radio_question.id)),
+        ])
+        self.assertEqual(list(self.survey.questions.values_list('id', 'order')), [(self.radio_question.id, 1)])
+        self.assertEqual(list(Answer.objects.filter(response__survey=self.survey).values_list('question_id', flat=True)),
+                         [self.radio_question.id])
+
+    def test_edit_by_id_updates_in_place(self):
+        self.put_questions([
+            self.question('질문 1 (수정)', 'text', 1, id=str(self.text_question.id)),
+            self.question('질문 2', 'radio', 2, ['예', '아니오'], id=str(self.radio_question.id)),
+            self.question('새 질문', 'text', 3),
+        ])
+        questions = list(self.survey.questions.order_by('order'))
+        self.assertEqual([question.id for question in questions[:2]], [self.text_question.id, self.radio_question.id])
+        self.assertEqual(questions[0].text, '질문 1 (수정)')
+        self.assertEqual(len(questions), 3)
+        self.assertEqual(Answer.objects.filter(response__survey=self.survey).count(), 2)
+
+    def test_drop_first_question_without_ids(self):
+        """id 없이 첫 질문을 빼면 남은 질문이 첫 질문 자리에 덮어써지지 않고 답변과 함께 유지"""
+        self.put_questions([self.question('질문 2', 'radio', 1, ['예', '아니오'])])
+        self.assertEqual(list(self.survey.questions.values_list('id', 'type', 'order')),
+                         [(self.radio_question.id, 'radio', 1)])
+        self.assertEqual(
+            list(Answer.objects.filter(response__survey=self.survey).values_list('question_id', 'text_answer')),
+            [(self.radio_question.id, '예')],
+        )
+
+    def test_changed_question_without_id_is_created_new(self):
+        """id가 없고 문구가 바뀐 질문은 같은 순서의 기존 질문에 대응시키지 않고 새로 생성"""
+        self.put_questions([
+            self.question('다른 질문', 'text', 1),
+            self.question('질문 2', 'radio', 2, ['예', '아니오']),
+        ])
+        first, second = self.survey.questions.order_by('order')
+        self.assertNotEqual(first.id, self.text_question.id)
+        self.assertEqual(second.id, self.radio_question.id)
+        self.assertFalse(Answer.objects.filter(question=first).exists())
+        self.assertEqual(Answer.objects.filter(response__survey=self.survey).count(), 1)
+
+
+class BulkDuplicateTests(SurveyCacheMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.first = make_survey([('text', []), ('radio', ['예', '아니오'])])
+        self.second = make_survey([('checkbox', ['a', 'b'])], creator=self.first.creator)
+        self.client = APIClient()
+        self.client.force_authenticate(self.first.creator)
+
+    def test_copies_questions_in_request_order(self):
+        response = post_json(self.client, '/api/surveys/bulk-duplicate/', {
+            'ids': [str(self.second.id), str(self.first.id)],
+        })
+        self.assertEqual(response.status_code, 201)
+        copies = response.json()
+        self.assertEqual([copy['title'] for copy in copies], ['테스트 설문 (복사본)'] * 2)
+        self.assertEqual([len(copy['questions']) for copy in copies], [1, 2])
+        self.assertEqual([copy['status'] for copy in copies], ['draft', 'draft'])
+        self.assertEqual(Question.objects.filter(survey_id=copies[1]['id']).count(), 2)
+
+    def test_repeated_id_copies_questions_each_time(self):
+        """같은 설문 ID를 여러 번 보내면 복사본마다 질문이 모두 복제됨"""
+        response = post_json(self.client, '/api/surveys/bulk-duplicate/', {
+            'ids': [str(self.first.id), str(self.first.id), str(self.second.id)],
+        })
+        self.assertEqual(response.status_code, 201)
+        copies = response.json()
+        self.assertEqual([len(copy['questions']) for copy in copies], [2, 2, 1])
+        self.assertEqual(len({copy['id'] for copy in copies}), 3)
+        for copy in copies:
+            self.assertEqual(Question.objects.filter(survey_id=copy['id']).count(), len(copy['questions']))
+
+    def test_unknown_or_foreign_ids_are_rejected(self):
+        other = make_survey([('text', [])])
+        response = post_json(self.client, '/api/surveys/bulk-duplicate/', {
+            'ids': [str(self.first.id), str(other.id)],
+        })
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()['missing'], [str(other.id)])
+        self.assertEqual(Survey.objects.count(), 3)
+
+
+class SubmissionSpoolTests(SurveyCacheMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.mkdtemp(prefix='survey-spool-test-')
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        # 반영 스레드 없이 flush_spool을 직접 호출해 확인
+        settings_override = override_settings(
+            SURVEY_SUBMISSION_MODE='spool', SURVEY_SPOOL_PATH=f'{self.directory}/spool.sqlite3',
+            SURVEY_SPOOL_IN_PROCESS_FLUSH=False,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        # 프로세스 공용 스풀 인스턴스를 테스트 경로로 다시 만들도록 초기화
+        spool_module._spool = None
+        self.addCleanup(setattr, spool_module, '_spool', None)
+
+        self.survey = make_survey([('text', [])])
+        self.question = self.survey.questions.get()
+        self.url = f'/api/public/{self.survey.id}/submit/'
+
+    def submit(self, answer, **headers):
+        return post_json(self.client, self.url, {
+            'answers': [{'question_id': str(self.question.id), 'answer': answer}],
+        }, **headers)
+
+    def test_submissions_are_stored_once_on_flush(self):
+        accepted = self.submit('첫 번째', HTTP_IDEMPOTENCY_KEY='spool-1')
+        self.assertEqual(accepted.status_code, 202)
+        self.assertEqual(accepted.json()['submission_id'], 'spool-1')
+        self.submit('두 번째')
+        spool = spool_module.get_spool()
+        self.assertEqual(spool.pending_count(), 2)
+        self.assertEqual(Response.objects.filter(survey=self.survey).count(), 0)
+
+        self.assertEqual(flush_spool(spool), 2)
+        self.assertEqual(spool.pending_count(), 0)
+        self.assertEqual(
+            sorted(Answer.objects.filter(question=self.question).values_list('text_answer', flat=True)),
+            ['두 번째', '첫 번째'],
+        )
+        self.survey.refresh_from_db()
+        self.assertEqual(self.survey.response_count, 2)
+
+    def test_reprocessed_entry_is_not_saved_twice(self):
+        """저장 후 ack 전에 중단되어 다시 처리되는 항목은 한 번만 저장"""
+        self.submit('응답', HTTP_IDEMPOTENCY_KEY='spool-1')
+        spool = spool_module.get_spool()
+        entries = spool.claim(10)
+        spool.release([entry['id'] for entry in entries])
+        create_responses(self.survey, [({'client_submission_id': 'spool-1'}, [])])
+
+        self.assertEqual(flush_spool(spool), 1)
+        self.assertEqual(spool.pending_count(), 0)
+        self.assertEqual(Response.objects.filter(survey=self.survey).count(), 1)
+
+    def test_entries_for_deleted_survey_are_dropped(self):
+        self.submit('응답')
+        self.survey.delete()
+        spool = spool_module.get_spool()
+        self.assertEqual(flush_spool(spool), 1)
+        self.assertEqual(spool.pending_count(), 0)
+
+    def test_failing_batch_is_quarantined(self):
+        """저장할 수 없는 묶음은 격리되고 다른 설문의 항목은 그대로 저장됨"""
+        other = make_survey([('text', [])], creator=self.survey.creator)
+        self.submit('응답')
+        spool = spool_module.get_spool()
+        spool.append(other.id, 'broken', {'fields': {}, 'answers': [{'question_id': 'not-a-uuid'}]}, other.created_at)
+
+        self.assertEqual(flush_spool(spool), 2)
+        self.assertEqual((spool.pending_count(), spool.quarantined_count()), (0, 1))
+        self.assertEqual(Response.objects.filter(survey=self.survey).count(), 1)
+        self.assertFalse(Response.objects.filter(survey=other).exists())
+
+    def test_database_error_releases_entries(self):
+        """DB 연결 오류는 항목을 격리하지 않고 임대를 풀어 다음 처리에서 재시도"""
+        self.submit('응답')
+        spool = spool_module.get_spool()
+        with mock.patch.object(spool_module, '_store_entries', side_effect=OperationalError('connection lost')):
+            self.assertEqual(flush_spool(spool), 0)
+        self.assertEqual((spool.pending_count(), spool.quarantined_count()), (1, 0))
+
+        self.assertEqual(flush_spool(spool), 1)
+        self.assertEqual(Response.objects.filter(survey=self.survey).count(), 1)
+
+    def test_append_ignores_repeated_submission_id(self):
+        spool = SubmissionSpool(path=f'{self.directory}/other.sqlite3')
+        received_at = self.survey.created_at
+        self.assertTrue(spool.append(self.survey.id, 'same', {'fields': {}, 'answers': []}, received_at))
+        self.assertFalse(spool.append(self.survey.id, 'same', {'fields': {}, 'answers': []}, received_at))
+        self.assertEqual(spool.pending_count(), 1)
+
+
+class InProcessSpoolFlushTests(SurveyCacheMixin, TransactionTestCase):
+    """반영 스레드가 다른 연결로 기록하므로 커밋된 데이터가 필요 (TransactionTestCase)"""
+
+    def test_web_process_flushes_its_own_spool(self):
+        """spool 모드 제출은 별도 작업자 없이 웹 프로세스의 반영 스레드가 저장"""
+        directory = tempfile.mkdtemp(prefix='survey-spool-test-')
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        spool_module._spool = None
+        self.addCleanup(setattr, spool_module, '_spool', None)
+        survey = make_survey([('text', [])])
+        question = survey.questions.get()
+
+        with override_settings(SURVEY_SUBMISSION_MODE='spool', SURVEY_SPOOL_PATH=f'{directory}/spool.sqlite3',
+                               SURVEY_SPOOL_IN_PROCESS_FLUSH=True, SURVEY_SPOOL_FLUSH_INTERVAL=0.2):
+            response = post_json(self.client, f'/api/public/{survey.id}/submit/', {
+                'answers': [{'question_id': str(question.id), 'answer': '응답'}],
+            })
+            self.assertEqual(response.status_code, 202)
+            # 이미 실행 중인 반영 스레드가 이전 간격만큼 잠들어 있을 수 있으므로 그만큼 기다림
+            deadline = time.monotonic() + 5
+            while not Response.objects.filter(survey=survey).exists() and time.monotonic() < deadline:
+                time.sleep(0.1)
+            self.assertEqual(Response.objects.filter(survey=survey).count(), 1)
+            self.assertEqual(spool_module.get_spool().pending_count(), 0)
+
+
+class ResponseExportTests(SurveyCacheMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.survey = make_survey([('text', []), ('checkbox', ['a', 'b'])])
+        text_question, checkbox_question = self.survey.questions.order_by('order')
+        create_responses(self.survey, [
+            ({}, [
+                {'question_id': text_question.id, 'text_answer': f'응답 {index}', 'choice_answers': []},
+                {'question_id': checkbox_question.id, 'text_answer': '', 'choice_answers': ['a', 'b']},
+            ])
+            for index in range(3)
+        ])
+        self.url = f'/api/surveys/{self.survey.id}/responses/export/'
+        self.token = str(RefreshToken.for_user(self.survey.creator).access_token)
+
+    def test_wsgi_streams_sync_iterator(self):
+        client = APIClient()
+        client.force_authenticate(self.survey.creator)
+        response = client.get(self.url, {'type': 'csv'})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.is_async)
+        lines = b''.join(response.streaming_content).decode('utf-8-sig').splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[1].split(',', 3)[3], '응답 0,"a, b"')
+
+    async def test_asgi_streams_async_iterator(self):
+        """ASGI에서는 Django가 동기 반복자를 통째로 모으므로 비동기 반복자로 스트리밍"""
+        response = await AsyncClient().get(
+            self.url, {'type': 'ndjson'}, headers={'Authorization': f'Bearer {self.token}'}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        body = b''.join([part async for part in response.streaming_content])
+        records = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(len(records), 3)
+        self.assertEqual({len(record['answers']) for record in records}, {2})
+
+    def test_aiter_rows_reads_in_batches(self):
+        produced = []
+
+        def rows():
+            for index in range(10):
+                produced.append(index)
+                yield index
+
+        async def first_rows():
+            iterator = aiter_rows(rows(), batch_size=4)
+            received = [await iterator.__anext__() for _ in range(5)]
+            await iterator.aclose()
+            return received
+
+        self.assertEqual(async_to_sync(first_rows)(), [0, 1, 2, 3, 4])
+        # 다섯 번째 행을 위해 두 번째 묶음까지만 생성
+        self.assertEqual(len(produced), 8)
+
+
+class OperatorEndpointTests(TestCase):
+    URLS = ('/api/metrics/', '/api/health/stats/')
+
+    @override_settings(DEBUG=False, METRICS_AUTH_TOKEN='')
+    def test_closed_without_token_in_production(self):
+        for url in self.URLS:
+            self.assertEqual(self.client.get(url).status_code, 404, url)
+
+    @override_settings(DEBUG=True, METRICS_AUTH_TOKEN='')
+    def test_open_in_debug_without_token(self):
+        for url in self.URLS:
+            self.assertEqual(self.client.get(url).status_code, 200, url)
+
+    @override_settings(DEBUG=False, METRICS_AUTH_TOKEN='test-token')
+    def test_token_required_when_configured(self):
+        for url in self.URLS:
+            self.assertEqual(self.client.get(url).status_code, 401, url)
+            self.assertEqual(self.client.get(url, HTTP_AUTHORIZATION='Bearer wrong').status_code, 401, url)
+            self.assertEqual(self.client.get(url, HTTP_AUTHORIZATION='Bearer test-token').status_code, 200, url)
+
+
+class PublicDefinitionTests(SurveyCacheMixin, TestCase):
+    def test_definition_has_no_response_count(self):
+        """공개 설문 정의는 캐시되므로 제출로 바뀌는 응답 수를 포함하지 않음 (정의/ETag가 제출 후에도 같음)"""
+        survey = make_survey([('text', [])])
+        question = survey.questions.get()
+        before = self.client.get(f'/api/public/{survey.id}/')
+        self.assertEqual(before.status_code, 200)
+        self.assertNotIn('response_count', before.json())
+        response = post_json(self.client, f'/api/public/{survey.id}/submit/', {
+            'answers': [{'question_id': str(question.id), 'answer': '응답'}],
+        })
+        self.assertEqual(response.status_code, 201)
+        after = self.client.get(f'/api/public/{survey.id}/')
+        self.assertEqual(after.json(), before.json())
+        self.assertEqual(after['ETag'], before['ETag'])
+
+
+class ResponseCountResyncTests(TestCase):
+    def test_migration_recounts_responses(self):
+        """0007 마이그레이션은 어긋난 response_count를 응답 행 수로 맞춤 (응답이 없으면 0)"""
+        answered = make_survey([('text', [])])
+        empty = make_survey([('text', [])], creator=answered.creator)
+        Response.objects.bulk_create([Response(survey=answered) for _ in range(3)])
+        Survey.objects.filter(pk=answered.pk).update(response_count=7)
+        Survey.objects.filter(pk=empty.pk).update(response_count=-2)
+
+        migration = import_module('apps.surveys.migrations.0007_resync_response_counts')
+        migration.resync_response_counts(apps, None)
+        self.assertEqual(Survey.objects.get(pk=answered.pk).response_count, 3)
+        self.assertEqual(Survey.objects.get(pk=empty.pk).response_count, 0)
+
+
+class ViewTrackingTests(SurveyCacheMixin, TransactionTestCase):
+    """반영 스레드가 다른 연결로 기록하므로 커밋된 데이터가 필요 (TransactionTestCase)"""
+
+    @override_settings(SURVEY_VIEW_TRACKING=True, SURVEY_VIEW_FLUSH_INTERVAL=1)
+    def test_view_counts_flush_without_traffic(self):
+        """공개 설문 조회 수는 이후 요청이 없어도 반영 간격 안에 DB에 반영"""
+        survey = make_survey([('text', [])])
+        # 이미 실행 중인 반영 스레드가 이전 간격만큼 잠들어 있을 수 있으므로 그만큼 기다림
+        deadline = time.monotonic() + 15
+        for _ in range(3):
+            self.assertEqual(self.client.get(f'/api/public/{survey.id}/').status_code, 200)
+        while Survey.objects.get(id=survey.id).view_count < 3 and time.monotonic() < deadline:
+            time.sleep(0.2)
+        self.assertEqual(Survey.objects.get(id=survey.id).view_count, 3)
+        self.assertEqual(SurveyTimeBucket.objects.get(survey=survey, granularity='hour').views, 3)
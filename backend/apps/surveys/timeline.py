@@ -0,0 +1,168 @@
+"""설문별 시간 단위(시/일) 제출 수/조회 수 집계
+
+응답이 제출될 때 같은 트랜잭션 안에서 SurveyTimeBucket 카운터를 증분 갱신한다.
+공개 설문 조회 수는 tracking 모듈이 모아 두었다가 주기적으로 같은 행에 반영한다.
+시계열 API는 응답 테이블을 스캔하지 않고 요청한 기간의 버킷 행만 읽으므로
+조회 비용이 응답 수가 아니라 버킷 수에 비례한다.
+버킷 경계는 TIME_ZONE 기준 (일 단위는 현지 자정)이다.
+"""
+import operator
+from collections import Counter
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from functools import reduce
+
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, Q, Value, When
+from django.db.models.functions import TruncDay, TruncHour
+from django.utils import timezone
+
+from .models import Response, SurveyTimeBucket
+from .tallies import lock_rows
+
+GRANULARITIES = ('hour', 'day')
+STEPS = {'hour': timedelta(hours=1), 'day': timedelta(days=1)}
+# 기간을 지정하지 않았을 때 현재 시각까지 보여 줄 범위
+DEFAULT_RANGES = {'hour': timedelta(hours=48), 'day': timedelta(days=30)}
+TRUNCATE = {'hour': TruncHour, 'day': TruncDay}
+BUCKET_CREATE_BATCH_SIZE = 1000
+CONDITION_BATCH_SIZE = 200
+
+
+def bucket_start(value, granularity):
+    """value가 속한 버킷의 시작 시각 (현지 시간대)"""
+    local = timezone.localtime(value)
+    if granularity == 'day':
+        return local.replace(hour=0, minute=0, second=0, microsecond=0)
+    return local.replace(minute=0, second=0, microsecond=0)
+
+
+def bucket_range(start, end, granularity):
+    """[start, end) 구간과 겹치는 버킷 시작 시각 목록"""
+    current = bucket_start(start, granularity)
+    buckets = []
+    if granularity == 'day':
+        # 일 단위는 날짜로 진행 (일광 절약 시간이 있는 시간대에서도 현지 자정 유지)
+        day = current.date()
+        while current < end:
+            buckets.append(current)
+            day += timedelta(days=1)
+            current = timezone.make_aware(datetime.combine(day, time.min))
+    else:
+        # 시간 단위는 UTC로 진행 (현지 시각이 반복/생략되는 구간에서도 1시간 간격)
+        current = current.astimezone(dt_timezone.utc)
+        while current < end:
+            buckets.append(timezone.localtime(current))
+            current += timedelta(hours=1)
+    return buckets
+
+
+def bucket_count(start, end, granularity):
+    """bucket_range(start, end) 길이의 상한 (목록을 만들기 전에 기간 제한 확인용)"""
+    span = end - bucket_start(start, granularity)
+    return max(0, -(-span // STEPS[granularity]))
+
+
+def rollup(hour_counts):
+    """{(설문 ID, 시간 버킷 시작): 수} → {(설문 ID, 단위, 버킷 시작): 증분} (일 단위는 시간 단위를 합산)"""
+    deltas = Counter()
+    for (survey_id, hour), count in hour_counts.items():
+        deltas[(survey_id, 'hour', hour)] += count
+        deltas[(survey_id, 'day', bucket_start(hour, 'day'))] += count
+    return deltas
+
+
+def bucket_deltas(survey_id, timestamps):
+    """설문의 제출 시각 목록으로부터 버킷 증분 계산"""
+    return rollup(Counter((survey_id, bucket_start(value, 'hour')) for value in timestamps))
+
+
+def apply_bucket_deltas(deltas, field='responses', sign=1):
+    """버킷 증분을 field 컬럼에 F() 표현식으로 반영 (CASE로 행별 증분을 고르는 UPDATE 1회)
+
+    증분 값별로 UPDATE를 나누면 동시 제출이 같은 버킷 행을 서로 다른 순서로 잠그므로
+    행을 키 순서로 먼저 잠근 뒤 한 문장으로 갱신한다.
+    """
+    if not deltas:
+        return
+    if sign > 0:
+        # 없는 버킷 행을 먼저 만든 뒤 증분 (동시 요청이 같은 행을 만들어도 충돌 무시)
+        SurveyTimeBucket.objects.bulk_create([
+            SurveyTimeBucket(survey_id=survey_id, granularity=granularity, bucket_start=start)
+            for survey_id, granularity, start in sorted(deltas)
+        ], batch_size=BUCKET_CREATE_BATCH_SIZE, ignore_conflicts=True)
+
+    keys = sorted(key for key, delta in deltas.items() if delta)
+    for offset in range(0, len(keys), CONDITION_BATCH_SIZE):
+        # OR 조건이 너무 길어지지 않도록 나누어 갱신 (SQLite 식 깊이 제한)
+        conditions = [
+            (Q(survey_id=survey_id, granularity=granularity, bucket_start=start), deltas[(survey_id, granularity, start)] * sign)
+            for survey_id, granularity, start in keys[offset:offset + CONDITION_BATCH_SIZE]
+        ]
+        rows = SurveyTimeBucket.objects.filter(reduce(operator.or_, (condition for condition, _ in conditions)))
+        lock_rows(rows, 'survey_id', 'granularity', 'bucket_start')
+        rows.update(**{
+            field: F(field) + Case(
+                *(When(condition, then=Value(delta)) for condition, delta in conditions),
+                default=Value(0), output_field=IntegerField(),
+            )
+        })
+
+
+def record_submissions(survey_id, timestamps):
+    """새로 저장된 응답들의 제출 시각을 버킷에 반영"""
+    apply_bucket_deltas(bucket_deltas(survey_id, timestamps))
+
+
+def discount_submission(response):
+    """삭제되는 응답을 버킷에서 차감"""
+    apply_bucket_deltas(bucket_deltas(response.survey_id, [response.submitted_at]), sign=-1)
+
+
+@transaction.atomic
+def rebuild_time_buckets(survey_ids):
+    """설문들의 버킷 응답 수를 응답 테이블로부터 다시 계산 (단위별 GROUP BY 쿼리 1회)
+
+    조회 수(views)는 원본 기록이 없으므로 그대로 두고 응답 수만 덮어쓴다.
+    """
+    survey_ids = list(survey_ids)
+    if not survey_ids:
+        return
+    SurveyTimeBucket.objects.filter(survey_id__in=survey_ids, views=0).delete()
+    SurveyTimeBucket.objects.filter(survey_id__in=survey_ids).update(responses=0)
+
+    tzinfo = timezone.get_current_timezone()
+    buckets = []
+    for granularity in GRANULARITIES:
+        rows = (
+            Response.objects
+            .filter(survey_id__in=survey_ids)
+            .annotate(bucket=TRUNCATE[granularity]('submitted_at', tzinfo=tzinfo))
+            .values('survey_id', 'bucket')
+            .annotate(response_count=Count('id'))
+            .order_by()
+        )
+        buckets.extend(
+            SurveyTimeBucket(
+                survey_id=row['survey_id'], granularity=granularity,
+                bucket_start=row['bucket'], responses=row['response_count'],
+            )
+            for row in rows
+        )
+    SurveyTimeBucket.objects.bulk_create(
+        buckets, batch_size=BUCKET_CREATE_BATCH_SIZE, update_conflicts=True,
+        unique_fields=['survey', 'granularity', 'bucket_start'], update_fields=['responses'],
+    )
+
+
+def load_series(survey_id, granularity, start, end):
+    """[start, end) 구간의 [(버킷 시작, 응답 수, 조회 수), ...] (기록이 없는 버킷은 0)"""
+    buckets = bucket_range(start, end, granularity)
+    if not buckets:
+        return []
+    counts = {
+        bucket: (responses, views)
+        for bucket, responses, views in SurveyTimeBucket.objects
+        .filter(survey_id=survey_id, granularity=granularity, bucket_start__gte=buckets[0], bucket_start__lt=end)
+        .values_list('bucket_start', 'responses', 'views')
+    }
+    return [(bucket, *counts.get(bucket, (0, 0))) for bucket in buckets]
@@ -0,0 +1,156 @@
+"""공개 설문 조회(열람) 수 버퍼링
+
+survey_public_view 요청마다 DB에 쓰지 않고 프로세스 메모리의 카운터에
+(설문 ID, 시간 버킷)별로 더해 두었다가 SurveyTimeBucket.views 와 Survey.view_count 에
+F() 증분으로 한 번에 반영한다. 쓰기 횟수는 조회 수가 아니라 한 간격 동안 조회된
+설문/버킷 수에 비례한다.
+
+반영 시점:
+- 프로세스별 데몬 스레드가 SURVEY_VIEW_FLUSH_INTERVAL초마다 반영하므로, 이후 요청이
+  없어도 반영 지연은 최대 한 간격이다 (첫 조회 기록 시 시작, fork 후 워커에서 다시 시작).
+- 요청 처리 중 간격이 지났거나 버퍼의 키가 SURVEY_VIEW_BUFFER_MAX개를 넘으면 바로 반영한다.
+
+프로세스 종료 시(atexit) 남은 카운터를 기록하지만, 워커가 비정상 종료되면
+마지막 반영 이후의 조회 수(최대 한 간격 분량)는 유실될 수 있다.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django.utils import timezone
+
+from .models import Survey
+from .tallies import lock_rows
+from .timeline import apply_bucket_deltas, bucket_start, rollup
+
+logger = logging.getLogger(__name__)
+
+
+class _ViewBuffer:
+    """현재 프로세스의 {(설문 ID, 시간 버킷 시작): 조회 수}"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.pid = os.getpid()
+        self.counts = Counter()
+        self.last_flush = time.monotonic()
+
+    def add(self, survey_id, viewed_at):
+        key = (survey_id, bucket_start(viewed_at, 'hour'))
+        with self.lock:
+            if self.pid != os.getpid():
+                # preload_app으로 마스터에서 쌓인 카운터를 fork 후 중복 반영하지 않음
+                self.reset()
+            self.counts[key] += 1
+
+    def due(self):
+        return bool(self.counts) and (
+            len(self.counts) >= settings.SURVEY_VIEW_BUFFER_MAX
+            or time.monotonic() - self.last_flush >= settings.SURVEY_VIEW_FLUSH_INTERVAL
+        )
+
+    def take(self):
+        with self.lock:
+            counts, self.counts = self.counts, Counter()
+            self.last_flush = time.monotonic()
+        return counts
+
+    def restore(self, counts):
+        """반영에 실패한 카운터를 다음 반영 때 다시 시도하도록 되돌림"""
+        with self.lock:
+            self.counts.update(counts)
+
+
+class _PeriodicFlusher:
+    """SURVEY_VIEW_FLUSH_INTERVAL초마다 버퍼를 반영하는 데몬 스레드 (프로세스별 하나)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pid = None
+
+    def ensure_started(self):
+        # fork된 워커에는 마스터의 스레드가 복제되지 않으므로 프로세스 ID로 시작 여부 판단
+        if self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.pid != os.getpid():
+                threading.Thread(target=self.run, name='survey-view-flush', daemon=True).start()
+                self.pid = os.getpid()
+
+    def run(self):
+        while True:
+            time.sleep(settings.SURVEY_VIEW_FLUSH_INTERVAL)
+            if not buffer.counts:
+                continue
+            try:
+                flush()
+            except Exception:
+                logger.exception('주기적 조회 수 반영 중 오류가 발생했습니다.')
+            finally:
+                # 이 스레드의 연결을 다음 간격까지 붙잡아 두지 않음 (풀 사용 시 반환)
+                connection.close()
+
+
+buffer = _ViewBuffer()
+flusher = _PeriodicFlusher()
+
+
+def record_view(survey_id):
+    """공개 설문 조회 1회를 버퍼에 기록"""
+    if settings.SURVEY_VIEW_TRACKING:
+        buffer.add(survey_id, timezone.now())
+        flusher.ensure_started()
+
+
+def flush_due():
+    return buffer.due()
+
+
+@transaction.atomic
+def write_views(counts):
+    """{(설문 ID, 시간 버킷 시작): 조회 수}를 버킷과 설문 조회 수에 반영"""
+    # 그 사이 삭제된 설문은 제외 (외래 키 위반 방지)
+    existing = set(
+        Survey.objects.filter(pk__in={survey_id for survey_id, _ in counts}).values_list('pk', flat=True)
+    )
+    counts = Counter({key: count for key, count in counts.items() if key[0] in existing})
+    if not counts:
+        return
+    apply_bucket_deltas(rollup(counts), field='views')
+
+    totals = Counter()
+    for (survey_id, _), count in counts.items():
+        totals[survey_id] += count
+    # 다른 워커의 반영과 같은 순서로 행을 잠근 뒤 한 문장에 갱신
+    survey_ids = sorted(totals)
+    lock_rows(Survey.objects.filter(pk__in=survey_ids), 'pk')
+    Survey.objects.filter(pk__in=survey_ids).update(view_count=F('view_count') + Case(
+        *(When(pk=survey_id, then=Value(totals[survey_id])) for survey_id in survey_ids),
+        default=Value(0), output_field=IntegerField(),
+    ))
+
+
+def flush():
+    """버퍼의 조회 수를 DB에 반영. 반영한 조회 수 반환"""
+    counts = buffer.take()
+    if not counts:
+        return 0
+    try:
+        write_views(counts)
+    except DatabaseError:
+        logger.exception('조회 수 반영 실패, 다음 반영 때 다시 시도합니다.')
+        buffer.restore(counts)
+        return 0
+    return sum(counts.values())
+
+
+atexit.register(flush)
@@ -7,8 +7,12 @@ router.register('surveys', views.SurveyViewSet, basename='survey')
 
 urlpatterns = [
     path('health/', views.health_check, name='health-check'),
+    path('health/stats/', views.health_stats, name='health-stats'),
+    path('metrics/', views.metrics, name='metrics'),
     path('', include(router.urls)),
     path('public/<uuid:survey_id>/', views.survey_public_view, name='survey-public'),
     path('public/<uuid:survey_id>/submit/', views.submit_response, name='submit-response'),
+    path('public/<uuid:survey_id>/submit/batch/', views.submit_response_batch, name='submit-response-batch'),
     path('surveys/<uuid:survey_id>/responses/', views.survey_responses, name='survey-responses'),
+    path('surveys/<uuid:survey_id>/responses/export/', views.survey_responses_export, name='survey-responses-export'),
 ]
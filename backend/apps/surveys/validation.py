@@ -0,0 +1,131 @@
+"""설문별 답변 검증기
+
+설문의 질문 목록으로부터 질문 ID -> (유형, 선택지 키) 표를 한 번 만들어 두고,
+제출된 답변 목록을 한 번 순회하며 소속 질문, 유형, 선택지 포함 여부, 필수 응답을 검사한다.
+검증기는 (설문 ID, 정의 캐시 버전)으로 프로세스 메모리에 보관되므로 설문이 수정되기 전까지
+답변 검증에 DB 조회가 필요 없다.
+"""
+import re
+from functools import lru_cache
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import validate_email
+from django.utils.dateparse import parse_date, parse_time
+
+from .caching import DEFINITION, get_version
+from .models import Question
+from .tallies import CHOICE_QUESTION_TYPES, MULTI_CHOICE_TYPES, option_key
+
+PHONE_PATTERN = re.compile(r'^\+?[0-9][0-9\- ]{5,19}$')
+
+
+def _is_number(value):
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_email(value):
+    try:
+        validate_email(value)
+    except DjangoValidationError:
+        return False
+    return True
+
+
+def _parses(parse):
+    """parse_date/parse_time 검사 함수 (형식은 맞지만 범위를 벗어난 값의 ValueError도 실패로 처리)"""
+    def check(value):
+        try:
+            return parse(value) is not None
+        except ValueError:
+            return False
+    return check
+
+
+# 텍스트 답변 형식 검사 (유형별)
+TEXT_CHECKS = {
+    'rating': (_is_number, '평점은 숫자여야 합니다.'),
+    'date': (_parses(parse_date), '올바른 날짜 형식(YYYY-MM-DD)이 아닙니다.'),
+    'time': (_parses(parse_time), '올바른 시간 형식(HH:MM)이 아닙니다.'),
+    'email': (_is_email, '올바른 이메일 주소가 아닙니다.'),
+    'phone': (lambda value: PHONE_PATTERN.match(value) is not None, '올바른 전화번호 형식이 아닙니다.'),
+}
+
+
+class SurveyAnswerValidator:
+    """질문 정의로부터 미리 구성한 답변 검증기"""
+
+    def __init__(self, questions):
+        self.questions = list(questions)
+        self.specs = {
+            question.id: (question.type, frozenset(option_key(option) for option in question.options))
+            for question in self.questions
+        }
+        self.required_ids = {question.id for question in self.questions if question.required}
+
+    def _check_answer(self, spec, text_answer, choice_answers):
+        question_type, option_keys = spec
+
+        if question_type in CHOICE_QUESTION_TYPES:
+            selected = [option_key(choice) for choice in choice_answers]
+            if text_answer:
+                selected.append(text_answer)
+            if question_type not in MULTI_CHOICE_TYPES and len(selected) > 1:
+                return '하나의 선택지만 고를 수 있습니다.'
+            if any(key not in option_keys for key in selected):
+                return '선택지에 없는 값입니다.'
+            return None
+
+        if choice_answers:
+            return '이 질문에는 선택 답변을 보낼 수 없습니다.'
+        check = TEXT_CHECKS.get(question_type)
+        if check and text_answer and not check[0](text_answer):
+            return check[1]
+        return None
+
+    def errors(self, answers):
+        """답변 목록을 한 번 순회하며 {질문 ID: [오류]} 반환 (오류가 없으면 빈 dict)"""
+        errors = {}
+        seen = set()
+        answered = set()
+        for answer in answers:
+            question_id = answer['question_id']
+            spec = self.specs.get(question_id)
+            if spec is None:
+                errors[str(question_id)] = ['이 설문에 속하지 않은 질문입니다.']
+                continue
+            if question_id in seen:
+                errors[str(question_id)] = ['같은 질문에 대한 답변이 중복되었습니다.']
+                continue
+            seen.add(question_id)
+
+            text_answer = answer['text_answer']
+            choice_answers = answer['choice_answers']
+            if not text_answer and not choice_answers:
+                # 빈 답변은 응답하지 않은 것으로 취급
+                continue
+            answered.add(question_id)
+
+            message = self._check_answer(spec, text_answer, choice_answers)
+            if message:
+                errors[str(question_id)] = [message]
+
+        for question_id in self.required_ids - answered:
+            errors.setdefault(str(question_id), ['필수 질문입니다.'])
+        return errors
+
+
+@lru_cache(maxsize=256)
+def _compiled_validator(survey_id, version):
+    questions = Question.objects.filter(survey_id=survey_id).only(
+        'id', 'survey_id', 'type', 'required', 'options'
+    )
+    return SurveyAnswerValidator(questions)
+
+
+def get_answer_validator(survey_id):
+    """설문의 현재 정의 버전에 해당하는 검증기 (버전이 바뀌면 새로 구성)"""
+    return _compiled_validator(survey_id, get_version(survey_id, DEFINITION))
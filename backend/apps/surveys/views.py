@@ -1,70 +1,225 @@
+from asgiref.sync import sync_to_async
 from rest_framework import status, viewsets
-from rest_framework.decorators import api_view, permission_classes, action
+from rest_framework.decorators import api_view, authentication_classes, permission_classes, action
+from rest_framework.exceptions import NotFound, ParseError
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
-from django.db.models import Count, Q
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.crypto import constant_time_compare
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.http import http_date, quote_etag
+from django.db import IntegrityError
+from django.db.models import Count, IntegerField, OuterRef, Subquery, prefetch_related_objects
+from django.db.models.functions import Coalesce
+from datetime import datetime, time, timedelta
+import functools
+import hashlib
+import io
+import json
 import logging
+import uuid
+from survey_project import metrics as request_metrics
+from survey_project.db.stats import connection_stats
+from survey_project.parsers import FastJSONParser
+from survey_project.renderers import dumps
 from .models import Survey, Question, Response as SurveyResponse
 from .serializers import (
     SurveySerializer, 
+    SurveyListSerializer,
+    PublicSurveySerializer,
     SurveyCreateSerializer, 
-    QuestionSerializer, 
     ResponseSerializer,
-    ResponseDetailSerializer
+    ResponseDetailSerializer,
+    ResponseCompactSerializer
 )
+from .analytics import build_questions_analytics
+from . import timeline, tracking
+from .caching import DEFINITION, aget_or_build, bump_version, cache_stats, get_or_build, invalidate_survey
+from .exports import CSV_CONTENT_TYPE, NDJSON_CONTENT_TYPE, aiter_rows, stream_csv, stream_ndjson
+from .pagination import ResponseKeysetPagination
+from .ingest import create_responses
+from .duplication import duplicate_surveys
+from .spool import get_spool, spool_payload, start_flusher
+from .idempotency import IDEMPOTENCY_HEADER, MAX_KEY_LENGTH, alookup, aremember, fingerprint
+from .validation import get_answer_validator
 
 logger = logging.getLogger(__name__)
 
+def _json_response(data, status=status.HTTP_200_OK):
+    """비동기 뷰용 JSON 응답 (DRF 렌더러와 같은 직렬화)"""
+    return HttpResponse(dumps(data), status=status, content_type='application/json')
+
+def async_api_view(methods):
+    """인증이 필요 없는 공개 비동기 뷰 데코레이터 (허용 메서드 검사, CSRF 제외)
+    
+    ASGI 서버에서는 이벤트 루프에서 바로 실행되어 응답자 한 명이 워커를 점유하지 않는다.
+    WSGI에서도 Django가 동기로 변환하여 실행하므로 그대로 동작한다.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            if request.method not in methods:
+                response = _json_response({
+                    'detail': f'메서드({request.method})는 허용되지 않습니다.'
+                }, status=status.HTTP_405_METHOD_NOT_ALLOWED)
+                response['Allow'] = ', '.join(methods)
+                return response
+            return await view(request, *args, **kwargs)
+        
+        wrapper.csrf_exempt = True
+        return wrapper
+    return decorator
+
+@async_api_view(['GET'])
+async def health_check(request):
+    """헬스체크 엔드포인트 - 인증 불필요"""
+    return _json_response({'status': 'healthy', 'message': 'Survey API is running'})
+
+def _operator_access_error(request):
+    """운영 지표 엔드포인트 접근 확인. 거부할 때 (상태 코드, 메시지) 반환
+
+    METRICS_AUTH_TOKEN이 설정되어 있으면 Bearer 토큰이 필요하고,
+    설정되지 않았으면 DEBUG에서만 열어 두며 운영 환경에서는 없는 경로처럼 404를 돌려준다.
+    """
+    token = settings.METRICS_AUTH_TOKEN
+    if token:
+        if not constant_time_compare(request.headers.get('Authorization', ''), f'Bearer {token}'):
+            return status.HTTP_401_UNAUTHORIZED, '인증이 필요합니다.'
+    elif not settings.DEBUG:
+        return status.HTTP_404_NOT_FOUND, '찾을 수 없습니다.'
+    return None
+
 @api_view(['GET'])
+@authentication_classes([])  # Bearer 헤더는 JWT가 아니라 METRICS_AUTH_TOKEN
 @permission_classes([AllowAny])
-def health_check(request):
-    """헬스체크 엔드포인트 - 인증 불필요"""
-    return Response({'status': 'healthy', 'message': 'Survey API is running'})
+def health_stats(request):
+    """캐시 적중/실패 및 DB 연결 재사용 통계 (연결 통계는 응답한 워커 기준)
+
+    접근 조건은 /api/metrics/ 와 같다 (_operator_access_error).
+    """
+    error = _operator_access_error(request)
+    if error:
+        return Response({'detail': error[1]}, status=error[0])
+    return Response({
+        'analytics_cache': cache_stats(),
+        'definition_cache': cache_stats(DEFINITION),
+        'database': connection_stats(),
+    })
+
+def metrics(request):
+    """라우트별 요청 지표 (Prometheus 텍스트 형식, 모든 워커 합산)
+
+    METRICS_AUTH_TOKEN이 설정되어 있으면 Bearer 토큰이 필요하고, 없으면 DEBUG에서만 응답한다.
+    """
+    error = _operator_access_error(request)
+    if error:
+        return _json_response({'detail': error[1]}, status=error[0])
+    return HttpResponse(request_metrics.render_metrics(), content_type=request_metrics.CONTENT_TYPE)
+
+def _count_subquery(model):
+    """설문별 관련 행 수를 세는 상관 서브쿼리"""
+    counts = (
+        model.objects.filter(survey=OuterRef('pk'))
+        .order_by()
+        .values('survey')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
 
 class SurveyViewSet(viewsets.ModelViewSet):
     """설문조사 CRUD API"""
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        return Survey.objects.filter(creator=self.request.user)
+        queryset = Survey.objects.filter(creator=self.request.user)
+        if self.action == 'list':
+            # 질문/응답 수는 상관 서브쿼리로 계산 (조인으로 인한 행 증가 없음), 요청된 경우에만
+            fields = self.get_serializer().fields
+            counts = {
+                'question_count': Question,
+                'live_response_count': SurveyResponse,
+            }
+            queryset = queryset.annotate(**{
+                name: _count_subquery(model) for name, model in counts.items() if name in fields
+            })
+        elif self.action == 'retrieve':
+            # ?fields= / ?expand= 로 요청한 관계만 조인/프리페치
+            queryset = self.get_serializer().optimize_queryset(queryset)
+        elif self.action == 'analytics':
+            queryset = queryset.select_related('creator')
+        elif self.action == 'timeline':
+            queryset = queryset.only('id', 'creator_id')
+        return queryset
     
     def get_serializer_class(self):
         if self.action in ['create', 'update', 'partial_update']:
             return SurveyCreateSerializer
+        if self.action == 'list':
+            return SurveyListSerializer
         return SurveySerializer
     
     def perform_create(self, serializer):
         logger.info(f"Creating survey with data: {serializer.validated_data}")
         serializer.save(creator=self.request.user)
     
+    def perform_destroy(self, instance):
+        survey_id = instance.id
+        instance.delete()
+        invalidate_survey(survey_id)
+    
     @action(detail=True, methods=['post'])
     def duplicate(self, request, pk=None):
         """설문조사 복제"""
         survey = self.get_object()
+        new_survey, = duplicate_surveys([survey], request.user)
         
-        # 새 설문조사 생성
-        new_survey = Survey.objects.create(
-            title=f"{survey.title} (복사본)",
-            description=survey.description,
-            creator=request.user,
-            status='draft'
+        prefetch_related_objects([new_survey], 'questions')
+        return Response(
+            SurveySerializer(new_survey).data,
+            status=status.HTTP_201_CREATED
         )
+    
+    @action(detail=False, methods=['post'], url_path='bulk-duplicate')
+    def bulk_duplicate(self, request):
+        """여러 설문조사를 한 번에 복제 (예: 학기별 템플릿) - {"ids": [...]}"""
+        ids = request.data.get('ids')
+        if not isinstance(ids, list) or not ids:
+            return Response({
+                'error': '복제할 설문 ID 목록(ids)이 필요합니다.'
+            }, status=status.HTTP_400_BAD_REQUEST)
         
-        # 질문들 복제
-        for question in survey.questions.all():
-            Question.objects.create(
-                survey=new_survey,
-                text=question.text,
-                description=question.description,
-                type=question.type,
-                required=question.required,
-                order=question.order,
-                options=question.options
-            )
+        max_items = settings.SURVEY_BULK_DUPLICATE_MAX
+        if len(ids) > max_items:
+            return Response({
+                'error': f'한 번에 최대 {max_items}개의 설문만 복제할 수 있습니다.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            ids = [uuid.UUID(str(survey_id)) for survey_id in ids]
+        except ValueError:
+            return Response({
+                'error': '올바르지 않은 설문 ID가 포함되어 있습니다.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        surveys = {survey.id: survey for survey in self.get_queryset().filter(id__in=ids)}
+        missing = [str(survey_id) for survey_id in ids if survey_id not in surveys]
+        if missing:
+            return Response({
+                'error': '찾을 수 없는 설문이 있습니다.',
+                'missing': missing
+            }, status=status.HTTP_404_NOT_FOUND)
         
+        copies = duplicate_surveys([surveys[survey_id] for survey_id in ids], request.user)
+        prefetch_related_objects(copies, 'questions')
         return Response(
-            SurveySerializer(new_survey).data,
+            SurveySerializer(copies, many=True).data,
             status=status.HTTP_201_CREATED
         )
     
@@ -73,59 +228,268 @@ class SurveyViewSet(viewsets.ModelViewSet):
         """설문조사 분석 데이터"""
         survey = self.get_object()
         
-        # 기본 통계
-        total_responses = survey.responses.count()
-        
-        # 질문별 응답 분석
-        questions_analytics = []
-        for question in survey.questions.all():
-            question_data = {
-                'question': QuestionSerializer(question).data,
-                'total_answers': question.answers.count(),
-                'answer_distribution': {}
+        def build():
+            # 질문을 한 번만 불러와 분석과 직렬화에서 재사용
+            prefetch_related_objects([survey], 'questions')
+            return {
+                # 기본 통계 (응답 테이블을 세지 않고 누적 응답 수 사용)
+                'survey': SurveySerializer(survey).data,
+                'total_responses': survey.response_count,
+                # 질문별 응답 분석 (집계 테이블에서 질문 수에 비례하는 행만 조회)
+                'questions_analytics': build_questions_analytics(survey.questions.all())
             }
-            
-            if question.type in ['radio', 'dropdown']:
-                # 단일 선택 질문 분석
-                for option in question.options:
-                    count = question.answers.filter(
-                        choice_answers__contains=[option]
-                    ).count()
-                    question_data['answer_distribution'][option] = count
-            
-            elif question.type == 'checkbox':
-                # 다중 선택 질문 분석
-                for option in question.options:
-                    count = question.answers.filter(
-                        choice_answers__contains=option
-                    ).count()
-                    question_data['answer_distribution'][option] = count
-            
-            questions_analytics.append(question_data)
         
+        data, hit = get_or_build(survey.id, build)
+        # 조회 수는 제출과 무관하게 주기적으로 반영되므로 캐시하지 않고 설문 행의 현재 값 사용
+        response = Response({
+            **data,
+            'view_count': survey.view_count,
+            'conversion_rate': _conversion_rate(survey.response_count, survey.view_count),
+        })
+        response['X-Analytics-Cache'] = 'HIT' if hit else 'MISS'
+        return response
+    
+    @action(detail=True, methods=['get'])
+    def timeline(self, request, pk=None):
+        """시간/일 단위 응답 수/조회 수 시계열 (?granularity=hour|day&start=&end=)
+        
+        제출 시 갱신되는 버킷 행만 읽으므로 응답 수가 아니라 기간의 버킷 수에 비례한다.
+        응답이 없는 구간은 0으로 채운다. start/end 생략 시 현재 시각까지의 기본 범위를 사용한다.
+        """
+        survey = self.get_object()
+        params = request.query_params
+        granularity = params.get('granularity', 'day')
+        if granularity not in timeline.GRANULARITIES:
+            return Response({
+                'error': f"granularity는 {', '.join(timeline.GRANULARITIES)} 중 하나여야 합니다."
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            end = _parse_time_bound(params['end'], end=True) if params.get('end') else timezone.now()
+            start = _parse_time_bound(params['start']) if params.get('start') \
+                else end - timeline.DEFAULT_RANGES[granularity]
+        except ValueError:
+            return Response({
+                'error': 'start, end는 ISO 8601 형식의 날짜 또는 일시여야 합니다.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        if start >= end:
+            return Response({
+                'error': 'start는 end보다 이전이어야 합니다.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        max_buckets = settings.SURVEY_TIMELINE_MAX_BUCKETS
+        if timeline.bucket_count(start, end, granularity) > max_buckets:
+            return Response({
+                'error': f'한 번에 최대 {max_buckets}개 구간까지 조회할 수 있습니다. 기간을 줄이거나 granularity=day를 사용하세요.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        series = timeline.load_series(survey.id, granularity, start, end)
+        total_responses = sum(responses for _, responses, _ in series)
+        total_views = sum(views for _, _, views in series)
         return Response({
-            'survey': SurveySerializer(survey).data,
+            'survey_id': survey.id,
+            'granularity': granularity,
+            'timezone': timezone.get_current_timezone_name(),
+            'start': start,
+            'end': end,
             'total_responses': total_responses,
-            'questions_analytics': questions_analytics
+            'total_views': total_views,
+            'conversion_rate': _conversion_rate(total_responses, total_views),
+            'series': [
+                {'bucket_start': bucket, 'responses': responses, 'views': views}
+                for bucket, responses, views in series
+            ],
         })
 
-@api_view(['GET'])
-@permission_classes([AllowAny])
-def survey_public_view(request, survey_id):
-    """공개 설문조사 조회 (응답용)"""
-    survey = get_object_or_404(Survey, id=survey_id)
+def _conversion_rate(responses, views):
+    """조회 대비 응답 비율 (조회 수 집계 이전의 응답이 포함되면 1을 넘을 수 있음)"""
+    return round(responses / views, 4) if views else None
+
+def _parse_time_bound(value, end=False):
+    """?start= / ?end= 값 (ISO 8601). 날짜만 주면 end는 그날 전체를 포함하고, 시간대가 없으면 TIME_ZONE 기준"""
+    day = parse_date(value)
+    if day is not None:
+        moment = datetime.combine(day + timedelta(days=1) if end else day, time.min)
+    else:
+        moment = parse_datetime(value)
+        if moment is None:
+            raise ValueError(value)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+async def _build_public_definition(survey_id):
+    """공개 설문 정의 캐시 항목 생성 (직렬화 결과와 ETag, 활성 여부 판단용 필드)"""
+    survey = await (
+        Survey.objects.select_related('creator').prefetch_related('questions')
+        .filter(id=survey_id).afirst()
+    )
+    if survey is None:
+        raise NotFound()
+    data = PublicSurveySerializer(survey).data
+    body = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True)
+    return {
+        'data': data,
+        'etag': quote_etag(hashlib.sha1(body.encode()).hexdigest()),
+        'last_modified': survey.updated_at.timestamp(),
+        'status': survey.status,
+        'scheduled_date': survey.scheduled_date,
+    }
+
+def _inactive_response():
+    return _json_response({
+        'error': '현재 진행중이지 않은 설문조사입니다.'
+    }, status=status.HTTP_400_BAD_REQUEST)
+
+def _not_found_response():
+    return _json_response({'detail': str(NotFound.default_detail)}, status=status.HTTP_404_NOT_FOUND)
+
+@async_api_view(['GET'])
+async def survey_public_view(request, survey_id):
+    """공개 설문조사 조회 (응답용)
     
+    직렬화된 설문 정의를 캐시하고 ETag/Last-Modified 조건부 요청을 지원한다.
+    캐시는 설문 수정, 상태 변경, 삭제 시 무효화된다. 진행 중인 설문의 조회 수를 집계한다.
+    """
+    try:
+        definition, _ = await aget_or_build(
+            survey_id, lambda: _build_public_definition(survey_id), namespace=DEFINITION
+        )
+    except NotFound:
+        return _not_found_response()
+    
+    # 예약 설문은 시각에 따라 활성 여부가 바뀌므로 요청마다 판단
+    survey = Survey(status=definition['status'], scheduled_date=definition['scheduled_date'])
     if not survey.is_active:
-        return Response({
-            'error': '현재 진행중이지 않은 설문조사입니다.'
-        }, status=status.HTTP_400_BAD_REQUEST)
+        return _inactive_response()
+    
+    last_modified = int(definition['last_modified'])
+    not_modified = get_conditional_response(
+        request, etag=definition['etag'], last_modified=last_modified
+    )
+    response = not_modified or _json_response(definition['data'])
+    response['ETag'] = definition['etag']
+    response['Last-Modified'] = http_date(last_modified)
+    response['Cache-Control'] = 'no-cache'
     
-    return Response(SurveySerializer(survey).data)
+    # 조회 수는 메모리에 모아 두었다가 주기적으로 한 번에 반영 (304 재검증도 열람으로 집계)
+    tracking.record_view(survey_id)
+    if tracking.flush_due():
+        await sync_to_async(tracking.flush)()
+    return response
+
+# 제출 결과 상태 코드별 응답 메시지와 ID 필드 (멱등성 키 재응답에도 사용)
+SUBMISSION_RESULTS = {
+    status.HTTP_200_OK: ('이미 제출된 응답입니다.', 'response_id'),
+    status.HTTP_201_CREATED: ('응답이 성공적으로 제출되었습니다.', 'response_id'),
+    status.HTTP_202_ACCEPTED: ('응답이 접수되었습니다.', 'submission_id'),
+}
+
+def _submission_response(status_code, object_id, replayed=False):
+    message, id_field = SUBMISSION_RESULTS[status_code]
+    response = _json_response({'message': message, id_field: object_id}, status=status_code)
+    if replayed:
+        response['Idempotent-Replayed'] = 'true'
+    return response
+
+def _submission_error(message, status_code=status.HTTP_400_BAD_REQUEST):
+    return _json_response({'error': message}, status=status_code)
+
+@async_api_view(['POST'])
+async def submit_response(request, survey_id):
+    """설문조사 응답 제출
+    
+    조회는 비동기 ORM으로, 트랜잭션이 필요한 저장은 sync_to_async로 실행한다.
+    Idempotency-Key 헤더(또는 client_submission_id)로 재시도를 식별하며, 이미 처리한 키는
+    키 저장소의 결과로 바로 응답하고 다시 저장하지 않는다.
+    """
+    try:
+        data = FastJSONParser().parse(io.BytesIO(request.body))
+    except ParseError as exc:
+        return _json_response({'detail': str(exc.detail)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    idempotency_key = request.headers.get(IDEMPOTENCY_HEADER)
+    if idempotency_key is not None:
+        if not 0 < len(idempotency_key) <= MAX_KEY_LENGTH:
+            return _submission_error(f'{IDEMPOTENCY_HEADER}는 1~{MAX_KEY_LENGTH}자여야 합니다.')
+        if isinstance(data, dict):
+            if data.get('client_submission_id') not in (None, '', idempotency_key):
+                return _submission_error(f'{IDEMPOTENCY_HEADER}와 client_submission_id가 다릅니다.')
+            data['client_submission_id'] = idempotency_key
+    elif isinstance(data, dict) and isinstance(data.get('client_submission_id'), str):
+        idempotency_key = data['client_submission_id'] or None
+    
+    body_fingerprint = fingerprint(request.body)
+    if idempotency_key:
+        stored = await alookup(survey_id, idempotency_key)
+        if stored is not None:
+            status_code, object_id, stored_fingerprint = stored
+            if stored_fingerprint != body_fingerprint:
+                return _submission_error(
+                    f'같은 {IDEMPOTENCY_HEADER}로 다른 내용이 제출되었습니다.',
+                    status.HTTP_422_UNPROCESSABLE_ENTITY
+                )
+            return _submission_response(status_code, object_id, replayed=True)
+    
+    survey = await Survey.objects.filter(id=survey_id).only(
+        'id', 'status', 'scheduled_date'
+    ).afirst()
+    if survey is None:
+        return _not_found_response()
+    
+    if not survey.is_active:
+        return _inactive_response()
+    
+    validator = await sync_to_async(get_answer_validator)(survey.id)
+    serializer = ResponseSerializer(data=data, context={'answer_validator': validator})
+    if not serializer.is_valid():
+        return _json_response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    if settings.SURVEY_SUBMISSION_MODE == 'spool':
+        status_code, object_id = await sync_to_async(_spool_submission)(request, survey, serializer)
+    else:
+        # 키 저장소에서 만료된 재시도는 유일 제약 위반으로 걸러 기존 응답 ID를 돌려줌
+        status_code, object_id = await sync_to_async(_save_submission)(
+            serializer, survey, request.META.get('REMOTE_ADDR')
+        )
+    
+    if idempotency_key:
+        await aremember(survey.id, idempotency_key, status_code, object_id, body_fingerprint)
+    return _submission_response(status_code, object_id)
+
+def _save_submission(serializer, survey, ip_address):
+    """검증된 응답을 한 트랜잭션으로 저장하고 분석 캐시 무효화. (상태 코드, 응답 ID) 반환"""
+    try:
+        response = serializer.save(survey=survey, ip_address=ip_address)
+    except IntegrityError:
+        client_submission_id = serializer.validated_data.get('client_submission_id')
+        response_id = client_submission_id and survey.responses.filter(
+            client_submission_id=client_submission_id
+        ).values_list('id', flat=True).first()
+        if not response_id:
+            raise
+        return status.HTTP_200_OK, str(response_id)
+    bump_version(survey.id)
+    return status.HTTP_201_CREATED, str(response.id)
+
+def _spool_submission(request, survey, serializer):
+    """검증된 응답을 스풀에 추가 (저장은 스풀 반영 스레드가 수행). (202, 제출 ID) 반환"""
+    fields, answers_data = ResponseSerializer.split_submission(serializer.validated_data)
+    submission_id = fields.pop('client_submission_id', None) or str(uuid.uuid4())
+    fields['ip_address'] = request.META.get('REMOTE_ADDR')
+    
+    get_spool().append(survey.id, submission_id, spool_payload(fields, answers_data), timezone.now())
+    start_flusher()
+    return status.HTTP_202_ACCEPTED, submission_id
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
-def submit_response(request, survey_id):
-    """설문조사 응답 제출"""
+def submit_response_batch(request, survey_id):
+    """설문조사 응답 일괄 제출 (오프라인/키오스크 동기화용)
+    
+    요청 본문은 응답 객체의 배열 또는 {"responses": [...]} 형식이며,
+    유효한 응답은 한 번의 일괄 삽입으로 저장하고 항목별 결과를 반환한다.
+    """
     survey = get_object_or_404(Survey, id=survey_id)
     
     if not survey.is_active:
@@ -133,27 +497,154 @@ def submit_response(request, survey_id):
             'error': '현재 진행중이지 않은 설문조사입니다.'
         }, status=status.HTTP_400_BAD_REQUEST)
     
-    # IP 주소 추가
-    request.data['survey'] = survey.id
+    items = request.data.get('responses') if isinstance(request.data, dict) else request.data
+    if not isinstance(items, list) or not items:
+        return Response({
+            'error': '응답 목록(responses)이 필요합니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
     
-    serializer = ResponseSerializer(data=request.data)
-    if serializer.is_valid():
-        response = serializer.save(
-            survey=survey,
-            ip_address=request.META.get('REMOTE_ADDR')
-        )
+    max_items = settings.SURVEY_BATCH_SUBMIT_MAX
+    if len(items) > max_items:
         return Response({
-            'message': '응답이 성공적으로 제출되었습니다.',
-            'response_id': response.id
-        }, status=status.HTTP_201_CREATED)
+            'error': f'한 번에 최대 {max_items}개의 응답만 제출할 수 있습니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    ip_address = request.META.get('REMOTE_ADDR')
+    validator = get_answer_validator(survey.id)
+    results = [None] * len(items)
+    submissions = []
+    # client_submission_id -> 이 요청에서 처음 나온 항목 인덱스 (같은 요청 안의 중복 제거)
+    first_indexes = {}
+    repeats = []
+    for index, item in enumerate(items):
+        serializer = ResponseSerializer(data=item, context={'answer_validator': validator})
+        if not serializer.is_valid():
+            results[index] = {'index': index, 'status': 'invalid', 'errors': serializer.errors}
+            continue
+        fields, answers_data = ResponseSerializer.split_submission(serializer.validated_data)
+        client_submission_id = fields.get('client_submission_id')
+        if client_submission_id:
+            if client_submission_id in first_indexes:
+                repeats.append((index, first_indexes[client_submission_id]))
+                continue
+            first_indexes[client_submission_id] = index
+        submissions.append((index, {**fields, 'ip_address': ip_address}, answers_data))
+    
+    created, existing = _create_batch(survey, submissions, validator.questions)
+    for index, response_id in existing.items():
+        results[index] = {'index': index, 'status': 'duplicate', 'response_id': response_id}
+    for index, response_id in created.items():
+        results[index] = {'index': index, 'status': 'created', 'response_id': response_id}
+    for index, first_index in repeats:
+        results[index] = {'index': index, 'status': 'duplicate', 'response_id': results[first_index]['response_id']}
+    if created:
+        bump_version(survey.id)
     
-    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    duplicates = len(existing) + len(repeats)
+    failed = len(items) - len(created) - duplicates
+    if failed == len(items):
+        response_status = status.HTTP_400_BAD_REQUEST
+    elif failed:
+        response_status = status.HTTP_207_MULTI_STATUS
+    elif created:
+        response_status = status.HTTP_201_CREATED
+    else:
+        # 모두 이미 저장된 응답 (재전송)
+        response_status = status.HTTP_200_OK
+    
+    return Response({
+        'created': len(created),
+        'duplicates': duplicates,
+        'failed': failed,
+        'results': results
+    }, status=response_status)
+
+def _create_batch(survey, submissions, questions):
+    """[(항목 인덱스, 응답 필드, 답변 목록)] 중 아직 저장되지 않은 응답만 일괄 저장
+
+    ({인덱스: 새 응답 ID}, {인덱스: 이미 저장된 응답 ID}) 반환. 조회와 삽입 사이에
+    다른 요청이 같은 client_submission_id를 저장하면 IntegrityError 후 다시 조회해 한 번 재시도한다.
+    """
+    for attempt in range(2):
+        submitted_ids = [fields['client_submission_id'] for _, fields, _ in submissions if fields.get('client_submission_id')]
+        stored = dict(
+            survey.responses.filter(client_submission_id__in=submitted_ids)
+            .values_list('client_submission_id', 'id')
+        ) if submitted_ids else {}
+        existing = {
+            index: stored[fields['client_submission_id']]
+            for index, fields, _ in submissions if fields.get('client_submission_id') in stored
+        }
+        pending = [submission for submission in submissions if submission[0] not in existing]
+        try:
+            responses = create_responses(
+                survey, [(fields, answers_data) for _, fields, answers_data in pending], questions=questions
+            )
+        except IntegrityError:
+            if attempt:
+                raise
+            continue
+        return {index: response.id for (index, _, _), response in zip(pending, responses)}, existing
 
 @api_view(['GET'])
 def survey_responses(request, survey_id):
-    """설문조사 응답 목록 조회"""
-    survey = get_object_or_404(Survey, id=survey_id, creator=request.user)
-    responses = survey.responses.all()
+    """설문조사 응답 목록 조회
     
-    serializer = ResponseDetailSerializer(responses, many=True)
+    cursor 또는 page_size 파라미터가 있으면 (submitted_at, id) 키셋 페이지네이션과
+    설문 정보를 최상단에 한 번만 포함하는 간결한 표현을 사용한다.
+    """
+    context = {'request': request}
+    paginator = ResponseKeysetPagination()
+    if {paginator.cursor_query_param, paginator.page_size_query_param} & set(request.query_params):
+        # ?fields= / ?expand= 는 응답 항목에 적용되고, 최상단 설문 정보는 전체 표현을 유지
+        survey = get_object_or_404(
+            Survey.objects.select_related('creator').prefetch_related('questions'),
+            id=survey_id, creator=request.user
+        )
+        serializer = ResponseCompactSerializer(many=True, context=context)
+        responses = serializer.child.optimize_queryset(survey.responses.all())
+        serializer.instance = paginator.paginate_queryset(responses, request)
+        return paginator.get_paginated_response(serializer.data, survey=SurveySerializer(survey).data)
+    
+    # 기존 형식: 모든 응답이 이미 불러온 설문 인스턴스를 공유하도록 하여 N+1 조회 방지
+    serializer = ResponseDetailSerializer(many=True, context=context)
+    select, prefetch = serializer.child.related_lookups()
+    survey_select = _strip_lookup_prefix(select, 'survey')
+    survey_prefetch = _strip_lookup_prefix(prefetch, 'survey')
+    survey = get_object_or_404(
+        Survey.objects.select_related(*survey_select).prefetch_related(*survey_prefetch),
+        id=survey_id, creator=request.user
+    )
+    own_prefetch = [lookup for lookup in prefetch if not lookup.startswith('survey__')]
+    responses = list(survey.responses.prefetch_related(*own_prefetch))
+    for response in responses:
+        response.survey = survey
+    serializer.instance = responses
     return Response(serializer.data)
+
+def _strip_lookup_prefix(lookups, prefix):
+    """'prefix__a__b' 형태의 lookup에서 접두사를 떼어 낸 목록"""
+    prefix = f'{prefix}__'
+    return [lookup[len(prefix):] for lookup in lookups if lookup.startswith(prefix)]
+
+@api_view(['GET'])
+def survey_responses_export(request, survey_id):
+    """설문조사 응답 스트리밍 내보내기 (?type=csv|ndjson)"""
+    survey = get_object_or_404(Survey, id=survey_id, creator=request.user)
+    export_type = request.query_params.get('type', 'csv')
+    
+    if export_type == 'csv':
+        rows, content_type = stream_csv(survey, list(survey.questions.all())), CSV_CONTENT_TYPE
+    elif export_type == 'ndjson':
+        rows, content_type = stream_ndjson(survey), NDJSON_CONTENT_TYPE
+    else:
+        return Response({
+            'error': '지원하지 않는 내보내기 형식입니다. (csv, ndjson)'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    if isinstance(request._request, ASGIRequest):
+        # 동기 반복자는 ASGI에서 전체를 메모리에 모은 뒤 전송되므로 비동기 반복자로 전달
+        rows = aiter_rows(rows)
+    response = StreamingHttpResponse(rows, content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="survey-{survey.id}.{export_type}"'
+    return response
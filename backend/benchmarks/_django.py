@@ -0,0 +1,38 @@
+"""벤치마크 공용 Django 환경 설정
+
+backend 디렉터리에서 `python -m benchmarks.<모듈>` 형태로 실행한다.
+"""
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup():
+    """Django 설정 로드"""
+    if str(BACKEND_DIR) not in sys.path:
+        sys.path.insert(0, str(BACKEND_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'survey_project.settings')
+
+    import django
+    django.setup()
+
+
+@contextmanager
+def test_database(keepdb=False):
+    """실제 DB를 건드리지 않도록 테스트 DB를 만들어 사용 후 제거"""
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, keepdb=keepdb)
+    try:
+        yield connection
+    finally:
+        # 버퍼에 남은 공개 설문 조회 수를 테스트 DB가 있을 때 반영 (종료 시 atexit 반영 실패 방지)
+        from apps.surveys import tracking
+        tracking.flush()
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=keepdb)
+        teardown_test_environment()
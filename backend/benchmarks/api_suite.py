@@ -0,0 +1,278 @@
+"""설문 API 부하 벤치마크 모음 (커밋 간 비교용)
+
+임시 DB에 지정한 규모(설문 수, 설문당 질문 수, 설문당 기존 응답 수)로 데이터를 만들고
+gunicorn.conf.py 설정으로 서버를 띄운 뒤, 다음 시나리오를 차례로 동시 요청으로 측정한다.
+
+    submit     POST /api/public/<id>/submit/             (submit_response)
+    public     GET  /api/public/<id>/                    (survey_public_view)
+    analytics  GET  /api/surveys/<id>/analytics/         (SurveyViewSet.analytics, JWT 인증)
+    timeline   GET  /api/surveys/<id>/timeline/?granularity=hour  (SurveyViewSet.timeline)
+    responses  GET  /api/surveys/<id>/responses/?page_size=N  (survey_responses)
+    list       GET  /api/surveys/                        (SurveyViewSet.list)
+
+시나리오마다 초당 처리량, 실패율, p50/p95/p99 지연 시간과 요청당 쿼리 수/SQL 시간
+(Server-Timing 헤더)을 출력하고, --output 으로 커밋 정보와 함께 JSON으로 저장한다.
+--compare 로 이전 결과 파일을 지정하면 시나리오별 변화율을 함께 출력한다.
+
+    python -m benchmarks.api_suite --surveys 20 --questions 10 --responses 2000 \\
+        --concurrency 16 --duration 10 --output bench-$(git rev-parse --short HEAD).json
+    python -m benchmarks.api_suite --compare bench-abc1234.json
+
+DATABASE_URL을 지정하지 않으면 임시 SQLite DB를 사용한다 (운영 DB에는 사용하지 말 것).
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+
+from benchmarks._django import BACKEND_DIR, setup
+from benchmarks.public_load import http_exchange
+from benchmarks.worker_profiles import _percentile, serve_profile
+
+SCENARIOS = ('submit', 'public', 'analytics', 'timeline', 'responses', 'list')
+
+_SQL_TIMING = re.compile(r'sql;dur=([\d.]+);desc="(\d+) queries"')
+
+OPTIONS = ['매우 그렇다', '그렇다', '보통이다', '그렇지 않다']
+
+
+def seed(surveys, questions, responses):
+    """작성자 한 명의 활성 설문들과 기존 응답 생성. (설문 ID 목록, access 토큰, 설문별 (질문 ID, 주관식 여부) 목록)"""
+    from django.contrib.auth import get_user_model
+    from rest_framework_simplejwt.tokens import RefreshToken
+    from apps.surveys.ingest import create_responses
+    from apps.surveys.models import Question, Survey
+    from apps.surveys.tallies import rebuild_question_tallies
+
+    user = get_user_model().objects.create_user(username=f'bench-{uuid.uuid4().hex[:8]}', password='bench-password')
+    survey_ids, templates = [], {}
+    for index in range(surveys):
+        survey = Survey.objects.create(title=f'벤치마크 설문 {index + 1}', creator=user, status='active')
+        # 객관식 위주에 주관식을 섞은 구성 (네 번째 질문마다 장문형)
+        survey_questions = Question.objects.bulk_create([
+            Question(
+                survey=survey, text=f'질문 {order}', order=order,
+                type='textarea' if order % 4 == 0 else 'radio',
+                options=[] if order % 4 == 0 else OPTIONS,
+            )
+            for order in range(1, questions + 1)
+        ])
+        rebuild_question_tallies(survey_questions)
+        create_responses(survey, [
+            ({}, [
+                {
+                    'question_id': question.id,
+                    'text_answer': '좋았습니다' if question.type == 'textarea' else '',
+                    'choice_answers': [] if question.type == 'textarea' else [OPTIONS[(n + question.order) % len(OPTIONS)]],
+                }
+                for question in survey_questions
+            ])
+            for n in range(responses)
+        ], questions=survey_questions)
+        survey_ids.append(str(survey.id))
+        templates[str(survey.id)] = [
+            (str(question.id), question.type == 'textarea') for question in survey_questions
+        ]
+    return survey_ids, str(RefreshToken.for_user(user).access_token), templates
+
+
+def submission_body(template):
+    return json.dumps({
+        'client_submission_id': uuid.uuid4().hex,
+        'answers': [
+            {'question_id': question_id, 'answer': '벤치마크 응답' if is_text else random.choice(OPTIONS)}
+            for question_id, is_text in template
+        ],
+    }, ensure_ascii=False).encode()
+
+
+def build_requests(survey_ids, token, templates, page_size):
+    """시나리오별 요청 함수 (호출마다 설문을 무작위로 선택)"""
+    auth = {'Authorization': f'Bearer {token}'}
+
+    def submit():
+        survey_id = random.choice(survey_ids)
+        return 'POST', f'/api/public/{survey_id}/submit/', submission_body(templates[survey_id]), None
+
+    return {
+        'submit': submit,
+        'public': lambda: ('GET', f'/api/public/{random.choice(survey_ids)}/', b'', None),
+        'analytics': lambda: ('GET', f'/api/surveys/{random.choice(survey_ids)}/analytics/', b'', auth),
+        'timeline': lambda: (
+            'GET', f'/api/surveys/{random.choice(survey_ids)}/timeline/?granularity=hour', b'', auth
+        ),
+        'responses': lambda: (
+            'GET', f'/api/surveys/{random.choice(survey_ids)}/responses/?page_size={page_size}', b'', auth
+        ),
+        'list': lambda: ('GET', '/api/surveys/', b'', auth),
+    }
+
+
+async def run_scenario(base_url, make_request, concurrency, duration, warmup):
+    """warmup 초 동안 요청한 뒤 duration 초 동안 측정"""
+    latencies, queries, sql_ms = [], [], []
+    errors = {}
+    measure_from = time.monotonic() + warmup
+    stop_at = measure_from + duration
+
+    async def client():
+        while time.monotonic() < stop_at:
+            method, path, body, headers = make_request()
+            started = time.monotonic()
+            try:
+                status, response_headers, _ = await http_exchange(base_url, method, path, body, headers=headers)
+            except (OSError, asyncio.TimeoutError) as exc:
+                status, response_headers = type(exc).__name__, {}
+            if started < measure_from:
+                continue
+            if not isinstance(status, int) or status >= 400:
+                errors[str(status)] = errors.get(str(status), 0) + 1
+                continue
+            latencies.append(time.monotonic() - started)
+            timing = _SQL_TIMING.search(response_headers.get('server-timing', ''))
+            if timing:
+                sql_ms.append(float(timing.group(1)))
+                queries.append(int(timing.group(2)))
+
+    await asyncio.gather(*[client() for _ in range(concurrency)])
+    latencies.sort()
+    failures = sum(errors.values())
+    total = len(latencies) + failures
+    return {
+        'requests': total,
+        'requests_per_second': round(len(latencies) / duration, 1),
+        'failure_rate': round(failures / total, 4) if total else 0.0,
+        'errors': errors,
+        'p50_ms': round(_percentile(latencies, 0.50) * 1000, 1),
+        'p95_ms': round(_percentile(latencies, 0.95) * 1000, 1),
+        'p99_ms': round(_percentile(latencies, 0.99) * 1000, 1),
+        'queries_per_request': round(sum(queries) / len(queries), 2) if queries else None,
+        'sql_ms_per_request': round(sum(sql_ms) / len(sql_ms), 2) if sql_ms else None,
+    }
+
+
+def _git_revision():
+    try:
+        revision = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ['git', 'status', '--porcelain', '--untracked-files=no'], cwd=BACKEND_DIR, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f'{revision}-dirty' if dirty else revision
+
+
+def _change(current, previous):
+    if not previous:
+        return ''
+    return f'{(current - previous) / previous * 100:+.0f}%'
+
+
+def print_report(results, baseline=None):
+    print(f"{'scenario':<11}{'req/s':>9}{'fail':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'queries':>9}{'sql ms':>8}"
+          + (f"{'Δ req/s':>10}{'Δ p95':>8}" if baseline else ''))
+    for name, row in results.items():
+        queries, sql_ms = (
+            '-' if row[key] is None else row[key] for key in ('queries_per_request', 'sql_ms_per_request')
+        )
+        line = (
+            f"{name:<11}{row['requests_per_second']:>9}{row['failure_rate']:>8.2%}{row['p50_ms']:>9}"
+            f"{row['p95_ms']:>9}{row['p99_ms']:>9}{queries:>9}{sql_ms:>8}"
+        )
+        previous = (baseline or {}).get(name)
+        if previous:
+            line += f"{_change(row['requests_per_second'], previous['requests_per_second']):>10}"
+            line += f"{_change(row['p95_ms'], previous['p95_ms']):>8}"
+        print(line)
+        if row['errors']:
+            print(f"{'':<11}errors: {', '.join(f'{key} x{count}' for key, count in sorted(row['errors'].items()))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS))
+    parser.add_argument('--surveys', type=int, default=10)
+    parser.add_argument('--questions', type=int, default=10, help='설문당 질문 수')
+    parser.add_argument('--responses', type=int, default=1000, help='설문당 기존 응답 수')
+    parser.add_argument('--page-size', type=int, default=50, help='responses 시나리오의 page_size')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=10.0, help='시나리오별 측정 시간(초)')
+    parser.add_argument('--warmup', type=float, default=2.0, help='시나리오별 측정 전 예열 시간(초)')
+    parser.add_argument('--profile', default=os.environ.get('GUNICORN_PROFILE', 'gthread'), help='GUNICORN_PROFILE')
+    parser.add_argument('--seed', type=int, default=0, help='요청 대상 선택용 난수 시드')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON 파일')
+    args = parser.parse_args()
+    scenarios = args.scenarios.split(',')
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(sorted(unknown))}")
+
+    env = dict(os.environ)
+    if 'DATABASE_URL' not in env:
+        env['DATABASE_URL'] = f'sqlite:///{tempfile.mkdtemp()}/api_suite.sqlite3'
+    env.setdefault('SURVEY_CACHE_LOCATION', tempfile.mkdtemp())
+    os.environ.update(env)
+    subprocess.run([sys.executable, 'manage.py', 'migrate', '--verbosity', '0'], cwd=BACKEND_DIR, env=env, check=True)
+    setup()
+    random.seed(args.seed)
+    seeding_started = time.monotonic()
+    survey_ids, token, templates = seed(args.surveys, args.questions, args.responses)
+    seed_seconds = time.monotonic() - seeding_started
+    requests = build_requests(survey_ids, token, templates, args.page_size)
+
+    results = {}
+    with serve_profile(args.profile, env) as base_url:
+        for name in scenarios:
+            results[name] = asyncio.run(
+                run_scenario(base_url, requests[name], args.concurrency, args.duration, args.warmup)
+            )
+
+    from django.db import connection
+    report = {
+        'meta': {
+            'revision': _git_revision(),
+            'recorded_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'cpus': os.cpu_count(),
+            'database': connection.vendor,
+            'profile': args.profile,
+            'workers': env.get('GUNICORN_WORKERS') or env.get('WEB_CONCURRENCY'),
+            'seed_seconds': round(seed_seconds, 1),
+        },
+        'scale': {'surveys': args.surveys, 'questions': args.questions, 'responses': args.responses},
+        'load': {
+            'concurrency': args.concurrency, 'duration': args.duration,
+            'warmup': args.warmup, 'page_size': args.page_size,
+        },
+        'results': results,
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as previous:
+            previous = json.load(previous)
+        baseline = previous['results']
+        print(f"compared with {previous['meta'].get('revision')} ({previous['meta'].get('recorded_at')})")
+        if previous.get('scale') != report['scale'] or previous.get('load') != report['load']:
+            print('  note: scale or load settings differ from the baseline run')
+    print_report(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
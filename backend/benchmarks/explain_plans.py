@@ -0,0 +1,212 @@
+"""엔드포인트별 쿼리 실행 계획(EXPLAIN) 수집 및 순차 스캔/정렬 회귀 확인
+
+시드 데이터를 만든 테스트 DB에서 각 엔드포인트를 호출해 실행된 SELECT 문을 모으고,
+같은 문과 파라미터로 실행 계획을 얻는다. 테이블을 인덱스 없이 전체 스캔하는 계획이
+하나라도 있거나, ORDER BY를 인덱스 대신 별도 정렬로 처리하면 0이 아닌 종료 코드로 끝난다.
+
+- SQLite: EXPLAIN QUERY PLAN 에서 'USING ... INDEX' 없는 'SCAN <테이블>',
+  'USE TEMP B-TREE FOR ORDER BY'
+- PostgreSQL: enable_seqscan/enable_sort=off 로 두고도 남는 'Seq Scan'/'Sort'
+  (사용할 수 있는 인덱스가 없음)
+
+사용법: python -m benchmarks.explain_plans [--verbose] [--output plans.json]
+"""
+import argparse
+import json
+import sys
+from contextlib import contextmanager
+
+from benchmarks._django import setup, test_database
+
+
+def seed(user, surveys, questions, responses):
+    from apps.surveys.models import Survey, Question
+    from apps.surveys.ingest import create_responses
+    from apps.surveys.tallies import rebuild_question_tallies
+
+    created = []
+    for index in range(surveys):
+        survey = Survey.objects.create(title=f'설문 {index + 1}', creator=user, status='active')
+        survey_questions = Question.objects.bulk_create([
+            Question(survey=survey, text=f'질문 {order}', type='radio', order=order, options=['예', '아니오'])
+            for order in range(1, questions + 1)
+        ])
+        rebuild_question_tallies(survey_questions)
+        create_responses(survey, [
+            ({}, [
+                {'question_id': question.id, 'text_answer': '', 'choice_answers': ['예']}
+                for question in survey_questions
+            ])
+            for _ in range(responses)
+        ], questions=survey_questions)
+        created.append(survey)
+    return created
+
+
+@contextmanager
+def recording_statements(connection):
+    """실행된 SELECT 문과 파라미터를 순서대로 기록"""
+    statements = []
+
+    def record(execute, sql, params, many, context):
+        if not many and sql.lstrip().upper().startswith('SELECT'):
+            statements.append((sql, params))
+        return execute(sql, params, many, context)
+
+    # execute_wrapper()는 종료 시 마지막 wrapper를 꺼내므로, 요청 중에 다른 wrapper
+    # (survey_project.metrics)가 추가되어도 이 wrapper만 제거되도록 직접 관리
+    connection.execute_wrappers.append(record)
+    try:
+        yield statements
+    finally:
+        connection.execute_wrappers.remove(record)
+
+
+def _sqlite_plan(cursor, sql, params, tables):
+    cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+    plan = [row[3] for row in cursor.fetchall()]
+    problems = []
+    for detail in plan:
+        words = detail.split()
+        if words[:1] == ['SCAN'] and len(words) > 1 and words[1] in tables and 'INDEX' not in words:
+            problems.append(f'seq scan {words[1]}')
+        elif detail.startswith('USE TEMP B-TREE FOR ORDER BY'):
+            problems.append('sort')
+    return plan, problems
+
+
+def _postgresql_plan(cursor, sql, params, tables):
+    cursor.execute('SET LOCAL enable_seqscan = off')
+    cursor.execute('SET LOCAL enable_sort = off')
+    cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+    root = cursor.fetchone()[0]
+    if isinstance(root, str):
+        root = json.loads(root)
+    plan, problems = [], []
+    nodes = [root[0]['Plan']]
+    while nodes:
+        node = nodes.pop()
+        relation = node.get('Relation Name')
+        plan.append(f"{node['Node Type']} {relation or ''}".strip())
+        if node['Node Type'] == 'Seq Scan' and relation in tables:
+            problems.append(f'seq scan {relation}')
+        elif node['Node Type'] == 'Sort':
+            problems.append('sort')
+        nodes.extend(node.get('Plans', []))
+    return plan, problems
+
+
+PLANNERS = {
+    'sqlite': _sqlite_plan,
+    'postgresql': _postgresql_plan,
+}
+
+
+def explain(connection, statements):
+    """문별 [{'sql', 'plan', 'problems'}] (실행 계획은 트랜잭션 안에서 얻고 되돌림)"""
+    from django.db import transaction
+
+    planner = PLANNERS[connection.vendor]
+    tables = set(connection.introspection.table_names())
+    results = []
+    for sql, params in statements:
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                plan, problems = planner(cursor, sql, params, tables)
+            transaction.set_rollback(True)
+        results.append({'sql': sql, 'plan': plan, 'problems': problems})
+    return results
+
+
+def capture(client, connection, method, url, data=None):
+    with recording_statements(connection) as statements:
+        if method == 'POST':
+            response = client.post(url, json.dumps(data), content_type='application/json')
+        else:
+            response = client.get(url)
+        if response.streaming:
+            b''.join(response.streaming_content)
+    assert response.status_code < 400, (url, response.status_code)
+    return response, explain(connection, statements)
+
+
+def collect_plans(connection):
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.core.cache import caches
+    from rest_framework.test import APIClient
+
+    # 인덱스가 없으면 순차 스캔이 될 만큼의 데이터 (작성자 여러 명, 설문당 응답 수백 건)
+    users = [
+        get_user_model().objects.create_user(username=f'explain{index}', password='bench-password')
+        for index in range(3)
+    ]
+    surveys = []
+    for user in users:
+        surveys.extend(seed(user, surveys=5, questions=8, responses=200))
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+    caches[settings.SURVEY_CACHE_ALIAS].clear()
+
+    user, survey = users[0], surveys[0]
+    client = APIClient()
+    client.force_authenticate(user)
+    questions = list(survey.questions.all())
+    submission = {
+        'answers': [{'question_id': str(question.id), 'answer': '예'} for question in questions],
+    }
+
+    endpoints = {
+        'survey-list': ('GET', '/api/surveys/'),
+        'survey-detail': ('GET', f'/api/surveys/{survey.id}/'),
+        'analytics': ('GET', f'/api/surveys/{survey.id}/analytics/'),
+        'timeline': ('GET', f'/api/surveys/{survey.id}/timeline/?granularity=hour'),
+        'responses': ('GET', f'/api/surveys/{survey.id}/responses/'),
+        'responses-page': ('GET', f'/api/surveys/{survey.id}/responses/?page_size=20'),
+        'export-csv': ('GET', f'/api/surveys/{survey.id}/responses/export/?type=csv'),
+        'public': ('GET', f'/api/public/{survey.id}/'),
+        'submit': ('POST', f'/api/public/{survey.id}/submit/'),
+    }
+    plans = {}
+    for name, (method, url) in endpoints.items():
+        response, plans[name] = capture(client, connection, method, url, submission)
+        if name == 'responses-page':
+            # 두 번째 페이지 (커서 조건이 붙은 키셋 조회)
+            _, plans['responses-cursor'] = capture(client, connection, 'GET', response.json()['next'])
+    return plans
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--verbose', action='store_true', help='모든 문의 실행 계획 출력')
+    parser.add_argument('--output', help='실행 계획을 저장할 JSON 파일')
+    args = parser.parse_args()
+
+    setup()
+    with test_database() as connection:
+        vendor = connection.vendor
+        plans = collect_plans(connection)
+
+    regressions = {}
+    for name, statements in plans.items():
+        problems = sorted({problem for statement in statements for problem in statement['problems']})
+        print(f"{name:<18}{len(statements):>3} statements  {', '.join(problems) or 'ok'}")
+        if problems:
+            regressions[name] = problems
+        for statement in statements:
+            if args.verbose or statement['problems']:
+                print(f"    {statement['sql'][:160]}")
+                for line in statement['plan']:
+                    print(f'      {line}')
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump({'vendor': vendor, 'plans': plans}, output, indent=2, ensure_ascii=False, default=str)
+    if regressions:
+        print(f'Plans without a usable index: {regressions}', file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""JSON 렌더러/파서 마이크로 벤치마크 (DRF 기본 vs orjson 기반)
+
+실제 직렬화기로 만든 설문 목록, 분석, 응답 목록 페이로드와 응답 제출 본문을 대상으로
+렌더링/파싱 시간을 비교하고, 두 구현의 결과가 같은 JSON 값인지 확인한다.
+
+사용법: python -m benchmarks.json_rendering --responses 500 --repeat 50
+"""
+import argparse
+import io
+import json
+import timeit
+
+from benchmarks._django import setup, test_database
+
+
+def build_payloads(response_count):
+    from django.contrib.auth import get_user_model
+    from rest_framework.test import APIRequestFactory
+    from apps.surveys.models import Survey, Question
+    from apps.surveys.analytics import build_questions_analytics
+    from apps.surveys.ingest import create_responses
+    from apps.surveys.serializers import (
+        SurveySerializer, SurveyListSerializer, ResponseDetailSerializer,
+    )
+    from apps.surveys.tallies import rebuild_question_tallies
+
+    user = get_user_model().objects.create_user(username='bench', password='bench-password')
+    survey = Survey.objects.create(title='강의 만족도 조사 ✓', description='수강생 의견을 듣습니다.', creator=user, status='active')
+    options = ['매우 그렇다', '그렇다', '보통이다', '그렇지 않다']
+    questions = Question.objects.bulk_create([
+        Question(survey=survey, text=f'질문 {i + 1}: 강의가 유익했나요?', type='checkbox' if i % 2 else 'radio',
+                 order=i + 1, options=options)
+        for i in range(10)
+    ] + [Question(survey=survey, text='자유 의견', type='textarea', order=11)])
+    rebuild_question_tallies(questions)
+    create_responses(survey, [
+        ({'respondent_email': f'student{n}@example.com'}, [
+            {
+                'question_id': question.id,
+                'text_answer': '설명이 친절하고 예시가 풍부했습니다.' if question.type == 'textarea' else '',
+                'choice_answers': [] if question.type == 'textarea' else options[n % 4:n % 4 + 1 + (n % 2)],
+            }
+            for question in questions
+        ])
+        for n in range(response_count)
+    ], questions=questions)
+
+    surveys = list(Survey.objects.filter(pk=survey.pk).prefetch_related('questions').select_related('creator'))
+    responses = list(survey.responses.prefetch_related('answers'))
+    for response in responses:
+        response.survey = surveys[0]
+
+    submission = {
+        'respondent_email': 'student@example.com',
+        'answers': [
+            {'question_id': str(question.id), 'choice_answers': options[:2]}
+            for question in questions
+        ],
+    }
+    for survey in surveys:
+        survey.question_count = 11
+        survey.live_response_count = response_count
+    return {
+        'survey-list': SurveyListSerializer(surveys * 100, many=True).data,
+        'analytics': {
+            'survey': SurveySerializer(surveys[0]).data,
+            'total_responses': response_count,
+            'questions_analytics': build_questions_analytics(list(questions)),
+        },
+        'responses': ResponseDetailSerializer(responses, many=True).data,
+    }, json.dumps(submission, ensure_ascii=False).encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--responses', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    setup()
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+    from survey_project.parsers import FastJSONParser
+    from survey_project.renderers import FastJSONRenderer
+
+    with test_database():
+        payloads, body = build_payloads(args.responses)
+
+    print(f"{'payload':<14}{'bytes':>10}{'stdlib ms':>12}{'fast ms':>10}{'speedup':>9}")
+    for name, data in payloads.items():
+        baseline, fast = JSONRenderer().render(data), FastJSONRenderer().render(data)
+        assert json.loads(baseline) == json.loads(fast), name
+        base_time = timeit.timeit(lambda: JSONRenderer().render(data), number=args.repeat) / args.repeat
+        fast_time = timeit.timeit(lambda: FastJSONRenderer().render(data), number=args.repeat) / args.repeat
+        print(f'{name:<14}{len(baseline):>10}{base_time * 1000:>12.3f}{fast_time * 1000:>10.3f}{base_time / fast_time:>8.1f}x')
+
+    parse_repeat = args.repeat * 100
+    assert JSONParser().parse(io.BytesIO(body)) == FastJSONParser().parse(io.BytesIO(body))
+    base_time = timeit.timeit(lambda: JSONParser().parse(io.BytesIO(body)), number=parse_repeat) / parse_repeat
+    fast_time = timeit.timeit(lambda: FastJSONParser().parse(io.BytesIO(body)), number=parse_repeat) / parse_repeat
+    print(f"{'submit-parse':<14}{len(body):>10}{base_time * 1000:>12.3f}{fast_time * 1000:>10.3f}{base_time / fast_time:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
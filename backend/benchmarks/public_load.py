@@ -0,0 +1,235 @@
+"""공개 응답 경로 동시 응답자 부하 테스트 (WSGI sync 워커 vs ASGI uvicorn 워커)
+
+응답자 한 명은 공개 설문 정의를 조회하고, 본문을 천천히 업로드하며(--upload-seconds,
+모바일 회선 흉내) 응답을 제출한다. 동시 응답자 수를 단계별로 늘리며 초당 완료 응답자 수,
+실패율, 제출 지연 시간(업로드 시간 제외)을 측정한다.
+
+Django 4.2의 비동기 ORM은 워커당 하나의 스레드에서 쿼리를 실행하므로, ASGI의 이점은
+DB 처리량이 아니라 느린 클라이언트/대기 중인 연결이 워커를 점유하지 않는 데서 나온다.
+
+    # 서버 두 개(gunicorn sync / gunicorn + uvicorn)를 같은 워커 수로 직접 띄워 비교
+    python -m benchmarks.public_load --serve --workers 2 --concurrency 8,32,128
+
+    # 이미 떠 있는 서버 비교 (survey는 활성 상태의 설문 ID)
+    python -m benchmarks.public_load --target wsgi=http://127.0.0.1:8001 \\
+        --target asgi=http://127.0.0.1:8002 --survey <uuid>
+
+--serve는 임시 SQLite DB를 만들어 마이그레이션과 시드를 수행한다. DATABASE_URL을
+지정하면 해당 DB를 사용한다 (운영 DB에는 사용하지 말 것).
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from benchmarks._django import BACKEND_DIR, setup
+
+SERVER_COMMANDS = {
+    'wsgi': ['survey_project.wsgi:application', '--worker-class', 'sync'],
+    'asgi': ['survey_project.asgi:application', '--worker-class', 'uvicorn.workers.UvicornWorker'],
+}
+
+
+async def http_exchange(base_url, method, path, body=b'', upload_seconds=0.0, timeout=30.0, headers=None):
+    """HTTP/1.1 요청 한 건 (Connection: close). 본문은 upload_seconds 동안 나누어 전송.
+    (상태 코드, 소문자 헤더 이름 dict, 본문) 반환"""
+    parts = urlsplit(base_url)
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(parts.hostname, parts.port or 80), timeout
+    )
+    try:
+        head = (
+            f'{method} {path} HTTP/1.1\r\nHost: {parts.netloc}\r\nConnection: close\r\n'
+            f'Content-Type: application/json\r\nContent-Length: {len(body)}\r\n'
+            + ''.join(f'{name}: {value}\r\n' for name, value in (headers or {}).items())
+            + '\r\n'
+        )
+        writer.write(head.encode())
+        chunks = 4 if body and upload_seconds else 1
+        size = -(-len(body) // chunks) if body else 0
+        for index in range(chunks):
+            writer.write(body[index * size:(index + 1) * size])
+            await writer.drain()
+            if upload_seconds and index < chunks - 1:
+                await asyncio.sleep(upload_seconds / (chunks - 1))
+        raw = await asyncio.wait_for(reader.read(), timeout)
+    finally:
+        writer.close()
+    head, _, payload = raw.partition(b'\r\n\r\n')
+    status_line, *header_lines = head.decode('latin-1').split('\r\n')
+    response_headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(':')
+        response_headers[name.strip().lower()] = value.strip()
+    return int(status_line.split()[1]), response_headers, payload
+
+
+async def http_request(base_url, method, path, body=b'', upload_seconds=0.0, timeout=30.0, headers=None):
+    """HTTP/1.1 요청 한 건. (상태 코드, 본문) 반환"""
+    status, _, payload = await http_exchange(base_url, method, path, body, upload_seconds, timeout, headers)
+    return status, payload
+
+
+async def respondent(base_url, survey_id, upload_seconds, stop_at, results):
+    """정의 조회 -> 천천히 제출을 종료 시각까지 반복"""
+    while time.monotonic() < stop_at:
+        started = time.monotonic()
+        try:
+            status, payload = await http_request(base_url, 'GET', f'/api/public/{survey_id}/')
+            if status != 200:
+                raise RuntimeError(f'definition {status}')
+            questions = json.loads(payload)['questions']
+            body = json.dumps({
+                'client_submission_id': uuid.uuid4().hex,
+                'answers': [
+                    {'question_id': question['id'], 'answer': (question['options'] or ['좋았습니다'])[0]}
+                    for question in questions
+                ],
+            }, ensure_ascii=False).encode()
+            submit_started = time.monotonic()
+            status, _ = await http_request(
+                base_url, 'POST', f'/api/public/{survey_id}/submit/', body, upload_seconds
+            )
+            if status != 201:
+                raise RuntimeError(f'submit {status}')
+            results['latency'].append(time.monotonic() - submit_started - upload_seconds)
+            results['completed'] += 1
+        except (OSError, RuntimeError, asyncio.TimeoutError, ValueError, KeyError):
+            results['failed'] += 1
+            await asyncio.sleep(max(0.0, 0.1 - (time.monotonic() - started)))
+
+
+async def run_level(base_url, survey_id, concurrency, duration, upload_seconds):
+    results = {'completed': 0, 'failed': 0, 'latency': []}
+    stop_at = time.monotonic() + duration
+    await asyncio.gather(*[
+        respondent(base_url, survey_id, upload_seconds, stop_at, results)
+        for _ in range(concurrency)
+    ])
+    latency = sorted(results['latency']) or [0.0]
+    total = results['completed'] + results['failed']
+    return {
+        'concurrency': concurrency,
+        'respondents_per_second': round(results['completed'] / duration, 1),
+        'failure_rate': round(results['failed'] / total, 4) if total else 0.0,
+        'p50_ms': round(statistics.median(latency) * 1000, 1),
+        'p95_ms': round(latency[int(len(latency) * 0.95) - 1 if len(latency) > 1 else 0] * 1000, 1),
+    }
+
+
+def seed_survey():
+    """현재 DATABASE_URL DB에 부하 테스트용 활성 설문 생성"""
+    from django.contrib.auth import get_user_model
+    from apps.surveys.models import Survey, Question
+    from apps.surveys.tallies import rebuild_question_tallies
+
+    user, _ = get_user_model().objects.get_or_create(username='loadtest')
+    survey = Survey.objects.create(title='부하 테스트 설문', creator=user, status='active')
+    options = ['매우 그렇다', '그렇다', '보통이다', '그렇지 않다']
+    questions = Question.objects.bulk_create([
+        Question(survey=survey, text=f'질문 {order}', type='radio', order=order, options=options)
+        for order in range(1, 11)
+    ])
+    rebuild_question_tallies(questions)
+    return str(survey.id)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_up(base_url, process, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'server exited with {process.returncode}')
+        try:
+            asyncio.run(http_request(base_url, 'GET', '/api/health/', timeout=1))
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f'{base_url} did not start')
+
+
+@contextmanager
+def serve(kind, workers, env):
+    port = _free_port()
+    # gunicorn.conf.py(접근 로그, 바인드 주소)를 읽지 않도록 빈 설정 파일 사용
+    config = tempfile.NamedTemporaryFile(suffix='.py')
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', *SERVER_COMMANDS[kind], '--workers', str(workers),
+         '--bind', f'127.0.0.1:{port}', '--log-level', 'warning', '--config', config.name],
+        cwd=BACKEND_DIR, env=env,
+    )
+    base_url = f'http://127.0.0.1:{port}'
+    try:
+        _wait_until_up(base_url, process)
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait()
+        config.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--target', action='append', default=[], help='NAME=URL (여러 번 지정 가능)')
+    parser.add_argument('--survey', help='활성 설문 ID (--serve에서는 자동 생성)')
+    parser.add_argument('--serve', action='store_true', help='wsgi/asgi 서버를 직접 띄워 비교')
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--concurrency', default='8,32,128')
+    parser.add_argument('--duration', type=float, default=10.0, help='단계별 측정 시간(초)')
+    parser.add_argument('--upload-seconds', type=float, default=0.5, help='제출 본문 업로드 시간(초)')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일')
+    args = parser.parse_args()
+    levels = [int(value) for value in args.concurrency.split(',')]
+
+    env = dict(os.environ)
+    if args.serve:
+        if 'DATABASE_URL' not in env:
+            env['DATABASE_URL'] = f'sqlite:///{tempfile.mkdtemp()}/loadtest.sqlite3'
+        env.setdefault('SURVEY_CACHE_LOCATION', tempfile.mkdtemp())
+        os.environ.update(env)
+        subprocess.run([sys.executable, 'manage.py', 'migrate', '--verbosity', '0'], cwd=BACKEND_DIR, env=env, check=True)
+        setup()
+        args.survey = seed_survey()
+    elif not args.target or not args.survey:
+        parser.error('--serve 또는 --target 과 --survey 가 필요합니다.')
+
+    def measure(name, base_url):
+        rows = []
+        for level in levels:
+            row = asyncio.run(run_level(base_url, args.survey, level, args.duration, args.upload_seconds))
+            rows.append(row)
+            print(f"{name:<6}{row['concurrency']:>6}{row['respondents_per_second']:>10}"
+                  f"{row['failure_rate']:>10.2%}{row['p50_ms']:>10}{row['p95_ms']:>10}")
+        return rows
+
+    print(f"{'server':<6}{'conc':>6}{'resp/s':>10}{'fail':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    report = {}
+    if args.serve:
+        for kind in SERVER_COMMANDS:
+            with serve(kind, args.workers, env) as base_url:
+                report[kind] = measure(kind, base_url)
+    for target in args.target:
+        name, _, base_url = target.partition('=')
+        report[name] = measure(name, base_url)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump({'survey': args.survey, 'workers': args.workers, 'results': report}, output, indent=2)
+
+
+if __name__ == '__main__':
+    main()
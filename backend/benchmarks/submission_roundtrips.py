@@ -0,0 +1,92 @@
+"""응답 제출 1건당 DB 왕복 횟수 비교 (기존 경로 vs 일괄 삽입 경로)
+
+사용법: python -m benchmarks.submission_roundtrips --questions 10 --submissions 20
+"""
+import argparse
+import json
+from collections import Counter
+
+from benchmarks._django import setup, test_database
+
+
+def legacy_create(validated_data):
+    """개선 이전 ResponseSerializer.create (답변마다 INSERT, 응답 수 read-modify-write)"""
+    from apps.surveys.models import Response, Answer
+
+    answers_data = validated_data.pop('answers')
+    validated_data.pop('respondent_name', None)
+    response = Response.objects.create(**validated_data)
+    for answer_data in answers_data:
+        question_id = answer_data.pop('question_id')
+        Answer.objects.create(response=response, question_id=question_id, **answer_data)
+    response.survey.response_count += 1
+    response.survey.save()
+    return response
+
+
+def seed_survey(question_count):
+    from django.contrib.auth import get_user_model
+    from apps.surveys.models import Survey, Question
+    from apps.surveys.tallies import rebuild_question_tallies
+
+    user = get_user_model().objects.create_user(username='bench', password='bench-password')
+    survey = Survey.objects.create(title='벤치마크 설문', creator=user, status='active')
+    types = ['radio', 'checkbox', 'dropdown', 'text', 'rating']
+    questions = [
+        Question.objects.create(
+            survey=survey, text=f'질문 {i + 1}', type=types[i % len(types)], order=i + 1,
+            options=['선택 1', '선택 2', '선택 3'] if types[i % len(types)] in ('radio', 'checkbox', 'dropdown') else []
+        )
+        for i in range(question_count)
+    ]
+    rebuild_question_tallies(questions)
+    return survey, questions
+
+
+def build_payload(questions):
+    answers = []
+    for question in questions:
+        if question.type in ('radio', 'checkbox', 'dropdown'):
+            answer = json.dumps(question.options[:2], ensure_ascii=False)
+        else:
+            answer = '벤치마크 답변'
+        answers.append({'question_id': str(question.id), 'answer': answer})
+    return {'respondent_email': 'bench@example.com', 'answers': answers}
+
+
+def measure(survey, questions, submissions, legacy):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from apps.surveys.serializers import ResponseSerializer
+
+    verbs = Counter()
+    total = 0
+    for _ in range(submissions):
+        serializer = ResponseSerializer(data=build_payload(questions))
+        serializer.is_valid(raise_exception=True)
+        with CaptureQueriesContext(connection) as ctx:
+            if legacy:
+                legacy_create({**serializer.validated_data, 'survey': survey, 'ip_address': '127.0.0.1'})
+            else:
+                serializer.save(survey=survey, ip_address='127.0.0.1')
+        total += len(ctx)
+        verbs.update(query['sql'].split(None, 1)[0].upper() for query in ctx.captured_queries)
+    return total / submissions, {verb: count / submissions for verb, count in sorted(verbs.items())}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--questions', type=int, default=10)
+    parser.add_argument('--submissions', type=int, default=20)
+    args = parser.parse_args()
+
+    setup()
+    with test_database():
+        survey, questions = seed_survey(args.questions)
+        for label, legacy in (('before (per-answer INSERT)', True), ('after (bulk + F())', False)):
+            per_submission, verbs = measure(survey, questions, args.submissions, legacy)
+            print(f'{label:28s} {per_submission:6.1f} queries/submission  {verbs}')
+
+
+if __name__ == '__main__':
+    main()
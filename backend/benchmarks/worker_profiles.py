@@ -0,0 +1,173 @@
+"""gunicorn 워커 프로필별 처리량 비교 (gunicorn.conf.py의 GUNICORN_PROFILE)
+
+각 프로필로 gunicorn을 띄우고 같은 혼합 부하를 건다:
+공개 설문 조회 50%, 응답 제출 30%, 분석 조회(JWT 인증, 제출마다 캐시 무효화) 10%,
+설문 목록 10%. 프로필별 초당 요청 수, 실패율, 지연 시간 분위수를 출력한다.
+워커 수/스레드 수 등은 gunicorn.conf.py가 CPU 수와 환경 변수로 결정한 값을 그대로 쓴다.
+
+사용법: python -m benchmarks.worker_profiles --profiles sync,gthread,asgi --concurrency 32
+"""
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+
+from benchmarks._django import BACKEND_DIR, setup
+from benchmarks.public_load import _free_port, _wait_until_up, http_request, seed_survey
+
+# 프로필별로 필요한 워커 모듈 (설치되지 않았으면 건너뜀)
+PROFILE_REQUIREMENTS = {
+    'sync': None,
+    'gthread': None,
+    'gevent': 'gevent',
+    'asgi': 'uvicorn',
+}
+
+WORKLOAD = [
+    ('public', 50),
+    ('submit', 30),
+    ('analytics', 10),
+    ('list', 10),
+]
+
+
+def seed(responses):
+    """활성 설문과 기존 응답, 작성자 access 토큰 생성"""
+    from rest_framework_simplejwt.tokens import RefreshToken
+    from apps.surveys.ingest import create_responses
+    from apps.surveys.models import Survey
+
+    survey = Survey.objects.select_related('creator').get(id=seed_survey())
+    questions = list(survey.questions.all())
+    create_responses(survey, [
+        ({}, [
+            {'question_id': question.id, 'text_answer': '', 'choice_answers': [question.options[n % len(question.options)]]}
+            for question in questions
+        ])
+        for n in range(responses)
+    ], questions=questions)
+    return str(survey.id), str(RefreshToken.for_user(survey.creator).access_token), questions
+
+
+def _percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else 0.0
+
+
+async def run_mix(base_url, survey_id, token, submit_body, concurrency, duration):
+    names = [name for name, _ in WORKLOAD]
+    weights = [weight for _, weight in WORKLOAD]
+    auth = {'Authorization': f'Bearer {token}'}
+    requests = {
+        'public': lambda: http_request(base_url, 'GET', f'/api/public/{survey_id}/'),
+        'submit': lambda: http_request(
+            base_url, 'POST', f'/api/public/{survey_id}/submit/',
+            submit_body.replace(b'__ID__', uuid.uuid4().hex.encode())
+        ),
+        'analytics': lambda: http_request(base_url, 'GET', f'/api/surveys/{survey_id}/analytics/', headers=auth),
+        'list': lambda: http_request(base_url, 'GET', '/api/surveys/', headers=auth),
+    }
+    latencies = {name: [] for name in names}
+    failures = {name: 0 for name in names}
+    stop_at = time.monotonic() + duration
+
+    async def client():
+        while time.monotonic() < stop_at:
+            name = random.choices(names, weights)[0]
+            started = time.monotonic()
+            try:
+                status, _ = await requests[name]()
+                ok = status < 400
+            except (OSError, asyncio.TimeoutError):
+                ok = False
+            if ok:
+                latencies[name].append(time.monotonic() - started)
+            else:
+                failures[name] += 1
+
+    await asyncio.gather(*[client() for _ in range(concurrency)])
+    every = sorted(value for values in latencies.values() for value in values)
+    total = len(every) + sum(failures.values())
+    return {
+        'requests_per_second': round(len(every) / duration, 1),
+        'failure_rate': round(sum(failures.values()) / total, 4) if total else 0.0,
+        'p50_ms': round(_percentile(every, 0.50) * 1000, 1),
+        'p95_ms': round(_percentile(every, 0.95) * 1000, 1),
+        'p99_ms': round(_percentile(every, 0.99) * 1000, 1),
+        'by_endpoint': {
+            name: {
+                'requests_per_second': round(len(latencies[name]) / duration, 1),
+                'failures': failures[name],
+                'p95_ms': round(_percentile(sorted(latencies[name]), 0.95) * 1000, 1),
+            }
+            for name in names
+        },
+    }
+
+
+@contextmanager
+def serve_profile(profile, env):
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '--config', 'gunicorn.conf.py',
+         '--bind', f'127.0.0.1:{port}', '--access-logfile', '/dev/null', '--log-level', 'warning'],
+        cwd=BACKEND_DIR, env={**env, 'GUNICORN_PROFILE': profile},
+    )
+    base_url = f'http://127.0.0.1:{port}'
+    try:
+        _wait_until_up(base_url, process)
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--profiles', default='sync,gthread,gevent,asgi')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=15.0)
+    parser.add_argument('--responses', type=int, default=2000, help='분석 대상 기존 응답 수')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일')
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if 'DATABASE_URL' not in env:
+        env['DATABASE_URL'] = f'sqlite:///{tempfile.mkdtemp()}/profiles.sqlite3'
+    env.setdefault('SURVEY_CACHE_LOCATION', tempfile.mkdtemp())
+    os.environ.update(env)
+    subprocess.run([sys.executable, 'manage.py', 'migrate', '--verbosity', '0'], cwd=BACKEND_DIR, env=env, check=True)
+    setup()
+    survey_id, token, questions = seed(args.responses)
+    submit_body = json.dumps({
+        'client_submission_id': '__ID__',
+        'answers': [{'question_id': str(question.id), 'answer': question.options[0]} for question in questions],
+    }, ensure_ascii=False).encode()
+
+    print(f"{'profile':<9}{'req/s':>8}{'fail':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    report = {}
+    for profile in args.profiles.split(','):
+        requirement = PROFILE_REQUIREMENTS[profile]
+        if requirement and importlib.util.find_spec(requirement) is None:
+            print(f'{profile:<9}skipped ({requirement} is not installed)')
+            continue
+        with serve_profile(profile, env) as base_url:
+            row = asyncio.run(run_mix(base_url, survey_id, token, submit_body, args.concurrency, args.duration))
+        report[profile] = row
+        print(f"{profile:<9}{row['requests_per_second']:>8}{row['failure_rate']:>8.2%}"
+              f"{row['p50_ms']:>9}{row['p95_ms']:>9}{row['p99_ms']:>9}")
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump({'concurrency': args.concurrency, 'duration': args.duration, 'results': report}, output, indent=2)
+
+
+if __name__ == '__main__':
+    main()
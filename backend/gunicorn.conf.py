@@ -1,15 +1,99 @@
 import os
+import tempfile
+from pathlib import Path
+
+# 워커 프로필 (GUNICORN_PROFILE)
+#   sync    : 요청당 프로세스 하나. CPU 위주 분석 요청에 적합
+#   gthread : 프로세스 x 스레드. 응답 제출처럼 DB 대기가 많은 요청에 적합 (기본값)
+#   gevent  : 이벤트 루프 + 그린렛. 느린 클라이언트가 많을 때 (gevent, psycogreen 설치 필요)
+#   asgi    : uvicorn 워커. 공개 응답 경로의 비동기 뷰 사용
+PROFILES = {
+    'sync': {
+        'wsgi_app': 'survey_project.wsgi:application',
+        'worker_class': 'sync',
+        'workers_per_cpu': 2,
+        'threads': 1,
+    },
+    'gthread': {
+        'wsgi_app': 'survey_project.wsgi:application',
+        'worker_class': 'gthread',
+        'workers_per_cpu': 1,
+        'threads': 4,
+    },
+    'gevent': {
+        'wsgi_app': 'survey_project.wsgi:application',
+        'worker_class': 'gevent',
+        'workers_per_cpu': 1,
+        'threads': 1,
+    },
+    'asgi': {
+        'wsgi_app': 'survey_project.asgi:application',
+        'worker_class': 'uvicorn.workers.UvicornWorker',
+        'workers_per_cpu': 1,
+        'threads': 1,
+    },
+}
+
+profile_name = os.environ.get('GUNICORN_PROFILE', 'gthread')
+if profile_name not in PROFILES:
+    raise ValueError(f"GUNICORN_PROFILE must be one of {', '.join(PROFILES)} (got {profile_name!r})")
+profile = PROFILES[profile_name]
+
+
+def _cpu_count():
+    # 컨테이너에서는 호스트 전체가 아니라 이 프로세스에 할당된 CPU 수를 사용
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
 
 # Server socket
 bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
 backlog = 2048
 
+# Application
+wsgi_app = profile['wsgi_app']
+
 # Worker processes
-workers = 3
-worker_class = "sync"
-worker_connections = 1000
+# GUNICORN_WORKERS(또는 WEB_CONCURRENCY)가 없으면 CPU 수에서 계산하고 GUNICORN_MAX_WORKERS로 제한
+workers = int(os.environ.get('GUNICORN_WORKERS') or os.environ.get('WEB_CONCURRENCY') or min(
+    profile['workers_per_cpu'] * _cpu_count() + 1,
+    int(os.environ.get('GUNICORN_MAX_WORKERS', '12')),
+))
+threads = int(os.environ.get('GUNICORN_THREADS', profile['threads']))
+worker_class = profile['worker_class']
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', '1000'))
 timeout = 120
-keepalive = 2
+# sync 워커는 keep-alive를 지원하지 않으며, 나머지는 로드 밸런서 뒤에서 연결을 재사용
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', '5'))
+
+# 앱을 마스터에서 한 번 import한 뒤 fork하여 코드/메모리를 워커 간 공유
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true').lower() in ('1', 'true', 'yes')
+
+# 워커 프로세스의 DB 연결 풀 크기(settings.DB_POOL_MIN_SIZE/MAX_SIZE 기본값) 계산에 사용
+# (GUNICORN_THREADS는 사용자가 지정한 스레드 수이므로 덮어쓰지 않고 DB_POOL_CONCURRENCY로 전달)
+# 워커당 동시에 DB를 쓰는 요청 수:
+#   gthread: 스레드 수, sync: 1
+#   gevent : 그린렛마다 요청을 처리하므로 GUNICORN_DB_CONCURRENCY
+#   asgi   : Django ASGIHandler가 요청마다 별도의 sync_to_async 스레드 컨텍스트를 쓰므로
+#            동시 요청 수만큼 연결이 필요 (GUNICORN_DB_CONCURRENCY)
+# 이를 넘는 순간적인 요청은 풀에서 DB_POOL_TIMEOUT초 동안 연결 반환을 기다린다.
+if profile_name in ('gevent', 'asgi'):
+    db_concurrency = int(os.environ.get('GUNICORN_DB_CONCURRENCY', '10'))
+elif profile_name == 'gthread':
+    db_concurrency = threads
+else:
+    db_concurrency = 1
+os.environ['DB_POOL_CONCURRENCY'] = str(db_concurrency)
+
+# asgi: 요청마다 다른 스레드에서 DB 연결이 열리므로 지속 연결(CONN_MAX_AGE)을 쓰면
+# 스레드별 연결이 닫히지 않고 쌓인다. 이 프로필에서는 항상 요청 종료 시 연결을 닫음
+if profile_name == 'asgi':
+    os.environ['DB_CONN_MAX_AGE'] = '0'
+
+# 워커별 요청 지표 파일을 모아 /api/metrics/ 에서 합산 (settings.METRICS_DIR)
+metrics_dir = os.environ.setdefault('METRICS_DIR', tempfile.mkdtemp(prefix='survey-metrics-'))
 
 # Restart workers after this many requests, to help prevent memory leaks
 max_requests = 1000
@@ -24,3 +108,31 @@ loglevel = "info"
 limit_request_line = 4094
 limit_request_fields = 100
 limit_request_field_size = 8190
+
+
+def on_starting(server):
+    # 이전 실행에서 남은 워커 집계 파일 제거 (카운터는 마스터 시작 시점부터 누적)
+    for path in Path(metrics_dir).glob('*.json'):
+        path.unlink(missing_ok=True)
+
+
+def post_worker_init(worker):
+    # spool 모드: 재시작 전에 남은 스풀 항목도 새 제출을 기다리지 않고 반영되도록 워커 시작 시 반영 스레드 시작
+    from apps.surveys.spool import start_flusher
+    start_flusher()
+
+
+def post_fork(server, worker):
+    # preload_app으로 마스터에서 열린 DB 연결이 있으면 워커에서 공유하지 않도록 정리
+    if preload_app:
+        from django.db import connections
+        connections.close_all()
+
+    if profile_name == 'gevent':
+        # psycopg2가 그린렛을 막지 않도록 대기 콜백 설치
+        try:
+            from psycogreen.gevent import patch_psycopg
+        except ImportError:
+            server.log.warning('psycogreen is not installed; database calls will block the gevent loop')
+        else:
+            patch_psycopg()
@@ -27,6 +27,6 @@ EOF
 
 echo "✅ Deployment setup complete!"
 
-# Gunicorn 시작
+# Gunicorn 시작 (앱 모듈, 워커 수/종류는 gunicorn.conf.py의 GUNICORN_PROFILE로 결정)
 echo "🌐 Starting Gunicorn server..."
-exec gunicorn survey_project.wsgi:application --bind 0.0.0.0:$PORT --workers 3 --timeout 120
+exec gunicorn --bind 0.0.0.0:$PORT
@@ -3,6 +3,11 @@ ASGI config for survey_project project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+공개 응답 경로(health, public 조회/제출)는 비동기 뷰이므로 ASGI 서버에서 실행하면
+응답자 연결이 워커를 점유하지 않는다:
+
+    GUNICORN_PROFILE=asgi gunicorn
+
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 """
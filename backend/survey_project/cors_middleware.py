@@ -1,24 +1,44 @@
 """
 Enhanced Custom CORS middleware as a fallback for django-cors-headers
 """
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.http import HttpResponse
 
 class CustomCorsMiddleware:
+    # ASGI에서 비동기 뷰가 스레드 전환 없이 실행되도록 양쪽 모드 지원
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
         # Handle preflight OPTIONS request immediately
         if request.method == 'OPTIONS':
             response = HttpResponse()
             response.status_code = 200
         else:
             response = self.get_response(request)
-        
+        return self.add_cors_headers(request, response)
+
+    async def __acall__(self, request):
+        if request.method == 'OPTIONS':
+            response = HttpResponse()
+            response.status_code = 200
+        else:
+            response = await self.get_response(request)
+        return self.add_cors_headers(request, response)
+
+    def add_cors_headers(self, request, response):
         # Force add CORS headers to ALL responses
         response['Access-Control-Allow-Origin'] = '*'
         response['Access-Control-Allow-Methods'] = 'GET, POST, PUT, PATCH, DELETE, OPTIONS'
-        response['Access-Control-Allow-Headers'] = 'accept, accept-encoding, authorization, content-type, dnt, origin, user-agent, x-csrftoken, x-requested-with'
+        response['Access-Control-Allow-Headers'] = 'accept, accept-encoding, authorization, content-type, dnt, origin, user-agent, x-csrftoken, x-requested-with, idempotency-key'
+        response['Access-Control-Expose-Headers'] = 'Idempotent-Replayed'
         response['Access-Control-Allow-Credentials'] = 'true'
         response['Access-Control-Max-Age'] = '86400'
         
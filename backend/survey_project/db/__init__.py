@@ -0,0 +1 @@
+"""DB 연결 관리 (연결 재사용 통계, 프로세스 내 연결 풀 백엔드)"""
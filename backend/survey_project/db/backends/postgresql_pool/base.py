@@ -0,0 +1,170 @@
+"""프로세스 내 연결 풀을 쓰는 PostgreSQL 백엔드
+
+psycopg2 ThreadedConnectionPool에서 연결을 빌려 쓰고, Django가 연결을 닫을 때
+(요청 종료 등) 실제로 닫지 않고 풀에 돌려준다. 풀은 프로세스별로 만들어지므로
+preload_app으로 fork된 워커가 부모의 소켓을 공유하지 않는다.
+
+설정 (settings.DATABASES['default']):
+    ENGINE = 'survey_project.db.backends.postgresql_pool'
+    POOL = {'MIN_SIZE': 워커당 동시 요청 수, 'MAX_SIZE': 동시 요청 수 + 여유분, 'TIMEOUT': 대기 시간(초)}
+
+ThreadedConnectionPool은 MIN_SIZE만큼의 유휴 연결만 보관하고, 그 이상 반환된 연결은 닫는다.
+MAX_SIZE개가 모두 사용 중이면 즉시 실패하지 않고 TIMEOUT초 동안 반환을 기다린다.
+"""
+import os
+import threading
+
+import psycopg2.extras
+from django.db.backends.postgresql import base
+from psycopg2 import extensions, pool as pg_pool
+
+from survey_project.db import stats
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class _CountingPool(pg_pool.ThreadedConnectionPool):
+    """새 물리 연결을 셀 수 있고, 연결이 모두 사용 중이면 반환을 기다리는 ThreadedConnectionPool"""
+
+    def __init__(self, minconn, maxconn, *args, timeout=None, **kwargs):
+        self.fresh = set()
+        self.timeout = timeout
+        super().__init__(minconn, maxconn, *args, **kwargs)
+        # 부모 클래스의 잠금을 공유하는 조건 변수 (putconn이 대기 중인 getconn을 깨움)
+        self._available = threading.Condition(self._lock)
+
+    def _connect(self, key=None):
+        connection = super()._connect(key)
+        # JSONField는 Django가 직접 디코딩하므로 psycopg2의 jsonb 디코딩을 생략 (기본 백엔드와 동일)
+        psycopg2.extras.register_default_jsonb(conn_or_curs=connection, loads=lambda x: x)
+        self.fresh.add(id(connection))
+        stats.increment('pool_opened')
+        return connection
+
+    def _has_capacity(self):
+        return self.closed or bool(self._pool) or len(self._used) < self.maxconn
+
+    def getconn(self, key=None):
+        with self._available:
+            if not self._has_capacity():
+                stats.increment('pool_waits')
+                if not self._available.wait_for(self._has_capacity, timeout=self.timeout):
+                    stats.increment('pool_timeouts')
+                    raise pg_pool.PoolError(
+                        f'connection pool exhausted ({self.maxconn} in use, waited {self.timeout}s)'
+                    )
+            return self._getconn(key)
+
+    def putconn(self, conn=None, key=None, close=False):
+        with self._available:
+            self._putconn(conn, key, close)
+            self._available.notify()
+
+
+def _pool_key(alias, conn_params):
+    # 연결 파라미터도 키에 포함: 테스트 DB 생성처럼 같은 alias의 NAME이 바뀌면 다른 풀을 사용
+    return (os.getpid(), alias, tuple(sorted((name, repr(value)) for name, value in conn_params.items())))
+
+
+def _get_pool(alias, conn_params, pool_settings):
+    key = _pool_key(alias, conn_params)
+    with _pools_lock:
+        connection_pool = _pools.get(key)
+        if connection_pool is None:
+            connection_pool = _pools[key] = _CountingPool(
+                pool_settings.get('MIN_SIZE', 1), pool_settings.get('MAX_SIZE', 4),
+                timeout=pool_settings.get('TIMEOUT'), **conn_params
+            )
+        return connection_pool
+
+
+def close_pools(alias):
+    """현재 프로세스에서 alias의 모든 풀의 연결을 닫음 (테스트 DB 삭제 전 등)"""
+    with _pools_lock:
+        for key in [key for key in _pools if key[:2] == (os.getpid(), alias)]:
+            _pools.pop(key).closeall()
+
+
+class DatabaseCreation(base.DatabaseCreation):
+    def _destroy_test_db(self, test_database_name, verbosity):
+        # 풀에 남은 테스트 DB 유휴 연결이 있으면 DROP DATABASE가 실패하므로 먼저 닫음
+        close_pools(self.connection.alias)
+        super()._destroy_test_db(test_database_name, verbosity)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    creation_class = DatabaseCreation
+    # 현재 연결을 빌려 온 풀 (연결 후 설정이 바뀌어도 같은 풀에 반환)
+    _connection_pool = None
+
+    def _pool(self, conn_params=None):
+        return _get_pool(self.alias, conn_params or self.get_connection_params(), self.settings_dict.get('POOL', {}))
+
+    def get_new_connection(self, conn_params):
+        connection_pool = self._connection_pool = self._pool(conn_params)
+        connection = connection_pool.getconn()
+        reused = id(connection) not in connection_pool.fresh
+        connection_pool.fresh.discard(id(connection))
+        if reused and self.settings_dict.get('CONN_HEALTH_CHECKS') and not self._is_usable(connection):
+            # 풀에 있는 동안 끊어진 연결은 버리고 새 연결 사용
+            connection_pool.putconn(connection, close=True)
+            stats.increment('pool_discarded')
+            connection = connection_pool.getconn()
+            connection_pool.fresh.discard(id(connection))
+        stats.increment('pool_checkouts')
+
+        # 격리 수준은 기본 백엔드와 같이 OPTIONS 값 또는 READ COMMITTED
+        isolation_level = self.settings_dict['OPTIONS'].get('isolation_level')
+        if isolation_level is None:
+            self.isolation_level = base.IsolationLevel.READ_COMMITTED
+        else:
+            self.isolation_level = base.IsolationLevel(isolation_level)
+            connection.isolation_level = self.isolation_level
+        return connection
+
+    @staticmethod
+    def _is_usable(connection):
+        """SELECT 1로 연결 상태 확인. 확인 후 트랜잭션을 끝내 연결을 IDLE 상태로 둔다
+
+        풀의 연결은 autocommit이 아니므로 롤백하지 않으면 SELECT가 연 트랜잭션이 남아
+        이후 autocommit/격리 수준 설정이 실패한다.
+        """
+        if connection.closed:
+            return False
+        try:
+            if connection.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+                connection.rollback()
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            connection.rollback()
+        except psycopg2.Error:
+            return False
+        return True
+
+    def _close(self):
+        if self.connection is None:
+            return
+        connection = self.connection
+        # 트랜잭션 중인 연결은 putconn이 롤백하고, 상태를 알 수 없거나 오류 후 쓸 수 없는 연결은 폐기
+        discard = (
+            connection.closed
+            or connection.info.transaction_status == extensions.TRANSACTION_STATUS_UNKNOWN
+            or (self.errors_occurred and not self._is_usable(connection))
+        )
+        if discard:
+            stats.increment('pool_discarded')
+        with self.wrap_database_errors:
+            (self._connection_pool or self._pool()).putconn(connection, close=bool(discard))
+
+    def pool_status(self):
+        """현재 프로세스 풀의 크기와 사용 중/대기 연결 수"""
+        connection_pool = self._connection_pool
+        pool_settings = self.settings_dict.get('POOL', {})
+        return {
+            'min_size': pool_settings.get('MIN_SIZE', 1),
+            'max_size': pool_settings.get('MAX_SIZE', 4),
+            'timeout': pool_settings.get('TIMEOUT'),
+            'in_use': len(connection_pool._used) if connection_pool else 0,
+            'idle': len(connection_pool._pool) if connection_pool else 0,
+        }
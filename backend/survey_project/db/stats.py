@@ -0,0 +1,69 @@
+"""DB 연결 재사용 통계 (워커 프로세스 단위)
+
+요청 수와 실제로 새로 연 물리 연결 수를 세어 재사용 비율을 계산한다.
+지속 연결(CONN_MAX_AGE)만 쓰면 Django의 연결 생성이 곧 물리 연결이고,
+연결 풀 백엔드를 쓰면 풀이 새로 연 연결만 물리 연결로 센다.
+"""
+import os
+import threading
+
+from django.conf import settings
+from django.core.signals import request_started
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+_lock = threading.Lock()
+_counters = {
+    'requests': 0,
+    'connects': 0,
+    'pool_opened': 0,
+    'pool_checkouts': 0,
+    'pool_discarded': 0,
+    'pool_waits': 0,
+    'pool_timeouts': 0,
+}
+
+
+def increment(name, amount=1):
+    with _lock:
+        _counters[name] += amount
+
+
+@receiver(request_started)
+def _count_request(sender, **kwargs):
+    increment('requests')
+
+
+@receiver(connection_created)
+def _count_connect(sender, connection, **kwargs):
+    increment('connects')
+
+
+def connection_stats(alias='default'):
+    """현재 워커 프로세스의 연결 재사용 통계"""
+    with _lock:
+        counters = dict(_counters)
+    db = settings.DATABASES[alias]
+    pool_status = getattr(connections[alias], 'pool_status', None)
+    pool = pool_status() if pool_status else None
+
+    physical = counters['pool_opened'] if pool is not None else counters['connects']
+    requests = counters['requests']
+    return {
+        'pid': os.getpid(),
+        'engine': db['ENGINE'],
+        'conn_max_age': db.get('CONN_MAX_AGE'),
+        'health_checks': db.get('CONN_HEALTH_CHECKS'),
+        'requests': requests,
+        'connects': counters['connects'],
+        'physical_connections': physical,
+        'reuse_ratio': round(max(0.0, 1 - physical / requests), 4) if requests else None,
+        'pool': pool and {
+            **pool,
+            'checkouts': counters['pool_checkouts'],
+            'discarded': counters['pool_discarded'],
+            'waits': counters['pool_waits'],
+            'timeouts': counters['pool_timeouts'],
+        },
+    }
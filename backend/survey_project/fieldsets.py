@@ -0,0 +1,146 @@
+"""?fields= / ?expand= 기반 부분 응답(sparse fieldset)
+
+    ?fields=id,title,creator.username   나열한 필드만 출력 (점으로 중첩 필드 지정)
+    ?expand=creator,survey.questions    나열한 중첩 관계만 펼침
+
+expand를 지정하면 나열하지 않은 단일 관계(FK)는 기본 키로만 출력되고, 다중 관계는
+생략된다. 두 파라미터가 없으면 기존과 같은 전체 표현을 출력한다.
+
+SparseFieldsetMixin.optimize_queryset()은 남은 필드 기준으로 select_related /
+prefetch_related를 구성하므로 요청하지 않은 관계는 조인하거나 미리 읽지 않는다.
+루트 직렬화기만 요청 파라미터를 읽고, 중첩 직렬화기는 부모가 잘라 준 범위를 따른다.
+"""
+from rest_framework import serializers
+
+from survey_project import metrics
+
+FIELDS_PARAM = 'fields'
+EXPAND_PARAM = 'expand'
+
+_UNSET = object()
+
+
+def parse_selection(value):
+    """'a,b.c,b.d' -> {'a': {}, 'b': {'c': {}, 'd': {}}} (None이면 선택 없음)"""
+    if value is None:
+        return None
+    tree = {}
+    for path in value.split(','):
+        path = path.strip()
+        if not path:
+            continue
+        node = tree
+        for part in path.split('.'):
+            node = node.setdefault(part, {})
+    return tree
+
+
+def _nested_serializer(field):
+    """중첩 직렬화기 필드면 (실제 직렬화기, 다중 여부), 아니면 (None, False)"""
+    if isinstance(field, serializers.ListSerializer):
+        return field.child, True
+    if isinstance(field, serializers.BaseSerializer):
+        return field, False
+    return None, False
+
+
+class SparseFieldsetMixin:
+    """요청한 필드/관계만 출력하고, 그에 맞게 쿼리의 조인/프리페치를 줄이는 직렬화기 믹스인
+
+    Meta.field_prefetches = {'필드명': ('lookup', ...)} 로 SerializerMethodField 처럼
+    중첩 직렬화기가 아닌 필드가 필요로 하는 프리페치를 지정할 수 있다.
+    """
+
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        self._requested = (parse_selection(fields), parse_selection(expand)) if fields or expand else None
+        self._selection = _UNSET
+        super().__init__(*args, **kwargs)
+
+    def _is_root(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+    def to_representation(self, instance):
+        # 요청 지표의 직렬화 시간은 최상위 항목 단위로 기록 (중첩 직렬화기 중복 계산 방지)
+        if self._is_root():
+            with metrics.measure('serialize'):
+                return super().to_representation(instance)
+        return super().to_representation(instance)
+
+    def get_selection(self):
+        """(fields 트리, expand 트리). None은 제한 없음"""
+        if self._selection is not _UNSET:
+            return self._selection
+        if self._requested is not None:
+            return self._requested
+        request = self.context.get('request')
+        if request is None or not self._is_root():
+            return None, None
+        params = getattr(request, 'query_params', request.GET)
+        return parse_selection(params.get(FIELDS_PARAM)), parse_selection(params.get(EXPAND_PARAM))
+
+    def get_fields(self):
+        fields = super().get_fields()
+        fields_tree, expand_tree = self.get_selection()
+
+        if fields_tree is not None:
+            fields = {name: field for name, field in fields.items() if name in fields_tree}
+
+        for name in list(fields):
+            nested, many = _nested_serializer(fields[name])
+            if nested is None:
+                continue
+            field_subtree = fields_tree.get(name) or None if fields_tree is not None else None
+            if expand_tree is not None and name not in expand_tree and field_subtree is None:
+                # 펼치지 않은 관계: 단일 관계는 기본 키만, 다중 관계는 생략
+                if many:
+                    del fields[name]
+                else:
+                    source = fields[name].source
+                    kwargs = {'source': source} if source and source != name else {}
+                    fields[name] = serializers.PrimaryKeyRelatedField(read_only=True, **kwargs)
+                continue
+            if isinstance(nested, SparseFieldsetMixin):
+                nested._selection = (
+                    field_subtree,
+                    expand_tree.get(name, {}) if expand_tree is not None else None,
+                )
+        return fields
+
+    def related_lookups(self, prefix=''):
+        """출력할 필드에 필요한 (select_related 목록, prefetch_related 목록)"""
+        model = self.Meta.model
+        field_prefetches = getattr(self.Meta, 'field_prefetches', {})
+        select, prefetch = [], []
+
+        for name, field in self.fields.items():
+            for lookup in field_prefetches.get(name, ()):
+                prefetch.append(prefix + lookup)
+
+            nested, many = _nested_serializer(field)
+            if nested is None or field.source == '*':
+                continue
+            path = prefix + field.source.replace('.', '__')
+            model_field = model._meta.get_field(field.source.split('.')[0])
+            to_many = many or model_field.one_to_many or model_field.many_to_many
+            (prefetch if to_many else select).append(path)
+
+            if isinstance(nested, SparseFieldsetMixin):
+                nested_select, nested_prefetch = nested.related_lookups(prefix=path + '__')
+                if to_many:
+                    prefetch.extend(nested_select + nested_prefetch)
+                else:
+                    select.extend(nested_select)
+                    prefetch.extend(nested_prefetch)
+        return select, prefetch
+
+    def optimize_queryset(self, queryset):
+        """필요한 관계만 select_related / prefetch_related 적용"""
+        select, prefetch = self.related_lookups()
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
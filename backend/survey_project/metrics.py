@@ -0,0 +1,307 @@
+"""요청 단위 SQL/시간 계측과 Prometheus 텍스트 형식 집계
+
+RequestMetricsMiddleware가 요청마다 RequestTimings를 컨텍스트 변수에 두면,
+- DB 연결의 execute wrapper가 쿼리 수와 SQL 시간을,
+- 직렬화기(to_representation)와 JSON 렌더러가 직렬화 시간을
+같은 객체에 더한다. 요청이 끝나면 라우트(URL 이름)별 히스토그램에 반영한다.
+
+캐시 적중/실패 같은 라벨별 카운터(COUNTERS)도 increment()로 같은 집계에 더한다.
+
+gunicorn 워커는 프로세스마다 집계를 METRICS_DIR의 자기 파일에 주기적으로 기록하고,
+/metrics 요청을 받은 워커가 디렉터리의 파일을 모두 합쳐 응답한다.
+종료된 워커의 파일도 남겨 두어 카운터가 줄어들지 않도록 하며, 디렉터리는
+gunicorn 시작 시(gunicorn.conf.py의 on_starting) 비운다.
+"""
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+# 이름: (설명, 버킷, RequestTimings 필드)
+HISTOGRAMS = {
+    'survey_request_duration_seconds': ('Total time spent in the application per request', DURATION_BUCKETS, 'total'),
+    'survey_request_view_seconds': ('Time spent in the view excluding serialization', DURATION_BUCKETS, 'view'),
+    'survey_request_sql_seconds': ('Time spent executing SQL per request', DURATION_BUCKETS, 'sql'),
+    'survey_request_serialize_seconds': ('Time spent serializing and rendering the response', DURATION_BUCKETS, 'serialize'),
+    'survey_request_queries': ('SQL queries executed per request', QUERY_BUCKETS, 'queries'),
+}
+RESPONSES_TOTAL = 'survey_responses_total'
+CACHE_REQUESTS_TOTAL = 'survey_cache_requests_total'
+
+# 이름: (설명, 라벨 이름들)
+COUNTERS = {
+    CACHE_REQUESTS_TOTAL: ('Survey cache lookups by namespace and result', ('namespace', 'result')),
+}
+
+_current = ContextVar('request_timings', default=None)
+
+
+class RequestTimings:
+    """요청 하나의 계측 값 (시간은 초 단위)"""
+    __slots__ = ('started', 'view_started', 'queries', 'sql', 'serialize', 'view', 'total')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.view_started = None
+        self.queries = 0
+        self.sql = 0.0
+        self.serialize = 0.0
+        self.view = 0.0
+        self.total = 0.0
+
+    def finish(self):
+        now = time.perf_counter()
+        self.total = now - self.started
+        if self.view_started is not None:
+            self.view = max(0.0, now - self.view_started - self.serialize)
+
+    def server_timing(self):
+        """Server-Timing 헤더 값 (밀리초)"""
+        return ', '.join([
+            f'sql;dur={self.sql * 1000:.1f};desc="{self.queries} queries"',
+            f'view;dur={self.view * 1000:.1f}',
+            f'serialize;dur={self.serialize * 1000:.1f}',
+            f'total;dur={self.total * 1000:.1f}',
+        ])
+
+
+def start_request():
+    """현재 컨텍스트에서 요청 계측 시작. (계측 객체, reset용 토큰) 반환"""
+    timings = RequestTimings()
+    return timings, _current.set(timings)
+
+
+def end_request(token):
+    _current.reset(token)
+
+
+def current():
+    return _current.get()
+
+
+@contextmanager
+def measure(field):
+    """계측 중인 요청이 있으면 블록 실행 시간을 field에 더함"""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        setattr(timings, field, getattr(timings, field) + time.perf_counter() - started)
+
+
+def _record_query(execute, sql, params, many, context):
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.queries += 1
+        timings.sql += time.perf_counter() - started
+
+
+@receiver(connection_created)
+def _install_query_recorder(sender, connection, **kwargs):
+    # 같은 DatabaseWrapper가 재연결할 때마다 중복 등록되지 않도록 확인
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+# 이 모듈을 import하기 전에 이미 열린 연결에도 설치
+for _connection in connections.all(initialized_only=True):
+    _install_query_recorder(None, _connection)
+
+
+class _Registry:
+    """현재 프로세스의 라우트별 히스토그램/카운터"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.pid = os.getpid()
+        self.path = None
+        self.last_flush = 0.0
+        # {(이름, 라우트, 메서드): [버킷별 개수..., 합계, 개수]}
+        self.histograms = {}
+        # {(라우트, 메서드, 상태 코드): 개수}
+        self.responses = {}
+        # {(이름, 라벨 값...): 개수}
+        self.counters = {}
+
+    def increment(self, name, *labels):
+        key = (name, *labels)
+        with self.lock:
+            if self.pid != os.getpid():
+                self.reset()
+            self.counters[key] = self.counters.get(key, 0) + 1
+
+    def observe(self, route, method, status_code, timings):
+        with self.lock:
+            if self.pid != os.getpid():
+                # preload_app으로 마스터에서 import된 집계를 fork 후 물려받지 않음
+                self.reset()
+            for name, (_, buckets, field) in HISTOGRAMS.items():
+                value = getattr(timings, field)
+                key = (name, route, method)
+                values = self.histograms.get(key)
+                if values is None:
+                    values = self.histograms[key] = [0] * len(buckets) + [0.0, 0]
+                for index, bound in enumerate(buckets):
+                    if value <= bound:
+                        values[index] += 1
+                        break
+                values[-2] += value
+                values[-1] += 1
+            key = (route, method, str(status_code))
+            self.responses[key] = self.responses.get(key, 0) + 1
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'histograms': [[*key, list(values)] for key, values in self.histograms.items()],
+                'responses': [[*key, count] for key, count in self.responses.items()],
+                'counters': [[*key, count] for key, count in self.counters.items()],
+            }
+
+    def flush(self, force=False):
+        """METRICS_DIR의 이 프로세스 파일에 집계 기록 (METRICS_FLUSH_INTERVAL 간격)"""
+        directory = settings.METRICS_DIR
+        now = time.monotonic()
+        if not directory or (not force and now - self.last_flush < settings.METRICS_FLUSH_INTERVAL):
+            return
+        self.last_flush = now
+        if self.path is None or self.pid != os.getpid():
+            # pid가 재사용되어도 종료된 워커의 파일을 덮어쓰지 않도록 임의 접미사 사용
+            self.path = Path(directory) / f'{os.getpid()}-{uuid.uuid4().hex[:8]}.json'
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_suffix('.tmp')
+            temporary.write_text(json.dumps(self.snapshot()))
+            os.replace(temporary, self.path)
+        except OSError:
+            pass
+
+
+registry = _Registry()
+
+
+def observe(request, response, timings):
+    match = getattr(request, 'resolver_match', None)
+    route = (match.view_name or match.route) if match else 'unmatched'
+    registry.observe(route, request.method, response.status_code, timings)
+    registry.flush()
+
+
+def increment(name, *labels):
+    """라벨별 카운터를 1 증가 (프로세스 메모리, 다음 요청의 flush 때 파일에 기록)"""
+    registry.increment(name, *labels)
+
+
+def _load_snapshots():
+    registry.flush(force=True)
+    directory = settings.METRICS_DIR
+    if not directory:
+        return [registry.snapshot()]
+    snapshots = []
+    for path in Path(directory).glob('*.json'):
+        try:
+            snapshots.append(json.loads(path.read_text()))
+        except (OSError, ValueError):
+            # 다른 워커가 교체 중이거나 손상된 파일은 이번 수집에서 제외
+            continue
+    return snapshots or [registry.snapshot()]
+
+
+def _labels(**labels):
+    escaped = (
+        (name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in labels.items()
+    )
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+
+def _merge_counters(snapshots):
+    counters = {}
+    for snapshot in snapshots:
+        # 카운터가 추가되기 전에 기록된 워커 파일에는 항목이 없을 수 있음
+        for *key, count in snapshot.get('counters', []):
+            if key[0] in COUNTERS:
+                counters[tuple(key)] = counters.get(tuple(key), 0) + count
+    return counters
+
+
+def counter_values(name):
+    """모든 워커의 name 카운터 합계 {라벨 값 튜플: 개수}"""
+    return {
+        tuple(labels): count
+        for (metric, *labels), count in _merge_counters(_load_snapshots()).items()
+        if metric == name
+    }
+
+
+def render_metrics():
+    """모든 워커의 집계를 합쳐 Prometheus 텍스트 형식으로 반환"""
+    histograms = {}
+    responses = {}
+    snapshots = _load_snapshots()
+    for snapshot in snapshots:
+        for name, route, method, values in snapshot['histograms']:
+            if name not in HISTOGRAMS:
+                continue
+            merged = histograms.setdefault((name, route, method), [0] * len(values))
+            for index, value in enumerate(values):
+                merged[index] += value
+        for route, method, status_code, count in snapshot['responses']:
+            key = (route, method, status_code)
+            responses[key] = responses.get(key, 0) + count
+
+    lines = [
+        f'# HELP {RESPONSES_TOTAL} Responses by route, method and status code',
+        f'# TYPE {RESPONSES_TOTAL} counter',
+    ]
+    for (route, method, status_code), count in sorted(responses.items()):
+        lines.append(f'{RESPONSES_TOTAL}{_labels(route=route, method=method, status=status_code)} {count}')
+
+    counters = _merge_counters(snapshots)
+    for name, (description, label_names) in COUNTERS.items():
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} counter')
+        for (metric, *labels), count in sorted(counters.items()):
+            if metric == name:
+                lines.append(f'{name}{_labels(**dict(zip(label_names, labels)))} {count}')
+
+    for name, (description, buckets, _) in HISTOGRAMS.items():
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} histogram')
+        for (metric, route, method), values in sorted(histograms.items()):
+            if metric != name:
+                continue
+            cumulative = 0
+            for bound, count in zip(buckets, values):
+                cumulative += count
+                lines.append(f'{name}_bucket{_labels(route=route, method=method, le=bound)} {cumulative}')
+            lines.append(f'{name}_bucket{_labels(route=route, method=method, le="+Inf")} {values[-1]}')
+            lines.append(f'{name}_sum{_labels(route=route, method=method)} {values[-2]:.6f}')
+            lines.append(f'{name}_count{_labels(route=route, method=method)} {values[-1]}')
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,95 @@
+"""ASGI에서도 이벤트 루프를 막지 않는 미들웨어
+
+Django는 동기 전용 미들웨어가 하나라도 있으면 ASGI 요청마다 스레드 전환을 거치며,
+그동안 동기 스레드를 점유하므로 비동기 뷰의 동시 처리 이점이 사라진다.
+"""
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from survey_project import metrics
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """동기/비동기 양쪽을 지원하는 WhiteNoiseMiddleware
+
+    정적 파일 요청만 스레드에서 처리하고, 나머지 요청은 바로 다음 단계로 넘긴다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def _static_file(self, request):
+        if self.autorefresh:
+            return self.find_file(request.path_info)
+        return self.files.get(request.path_info)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        static_file = self._static_file(request)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
+
+
+class RequestMetricsMiddleware:
+    """요청별 쿼리 수, SQL/뷰/직렬화/전체 시간 계측
+
+    Server-Timing 헤더로 내보내고 라우트별 히스토그램(/api/metrics/)에 반영한다.
+    전체 시간을 재도록 MIDDLEWARE 맨 앞에 둔다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+            # ASGI에서 동기 process_view는 요청마다 스레드 전환을 일으키므로 비동기 버전 사용
+            self.process_view = self._aprocess_view
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings, token = metrics.start_request()
+        try:
+            response = self.get_response(request)
+        finally:
+            metrics.end_request(token)
+        return self._finish(request, response, timings)
+
+    async def __acall__(self, request):
+        timings, token = metrics.start_request()
+        try:
+            response = await self.get_response(request)
+        finally:
+            metrics.end_request(token)
+        return self._finish(request, response, timings)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        self._mark_view_started()
+
+    async def _aprocess_view(self, request, view_func, view_args, view_kwargs):
+        self._mark_view_started()
+
+    def _mark_view_started(self):
+        timings = metrics.current()
+        if timings is not None:
+            timings.view_started = time.perf_counter()
+
+    def _finish(self, request, response, timings):
+        timings.finish()
+        if settings.SERVER_TIMING_ENABLED:
+            response['Server-Timing'] = timings.server_timing()
+        metrics.observe(request, response, timings)
+        return response
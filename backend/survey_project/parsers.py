@@ -0,0 +1,29 @@
+"""orjson 기반 JSON 파서
+
+요청 본문을 바이트 그대로 orjson.loads로 해석한다. UTF-8이 아닌 charset이 지정되었거나
+orjson이 없으면 DRF 기본 JSONParser로 처리한다.
+"""
+import codecs
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from .renderers import FastJSONRenderer, orjson
+
+
+class FastJSONParser(JSONParser):
+    """orjson으로 요청 본문을 해석하는 JSONParser"""
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or codecs.lookup(encoding).name != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            # orjson은 NaN/Infinity를 허용하지 않으므로 STRICT_JSON과 같은 동작
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
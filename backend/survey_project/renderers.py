@@ -0,0 +1,66 @@
+"""orjson 기반 JSON 렌더러
+
+orjson이 설치되어 있으면 UUID, datetime, 한글 문자열을 C 구현으로 바로 직렬화하고,
+없으면 DRF 기본 JSONRenderer(표준 json 모듈)로 동작한다. 출력 형식은 DRF 기본값
+(UTF-8 그대로, 공백 없는 구분자, UTC는 'Z' 접미사, U+2028/U+2029 이스케이프)과 같다.
+orjson이 지원하지 않는 값(Decimal, 지연 번역 문자열 등)은 DRF 인코더의 default로 변환한다.
+"""
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import JSONRenderer
+
+from survey_project import metrics
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    orjson = None
+
+ORJSON_OPTIONS = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+_LINE_SEPARATORS = ((b'\xe2\x80\xa8', b'\\u2028'), (b'\xe2\x80\xa9', b'\\u2029'))
+
+
+def _escape_line_separators(content):
+    # JavaScript 문자열로 안전하게 쓸 수 있도록 DRF와 같이 이스케이프
+    for raw, escaped in _LINE_SEPARATORS:
+        if raw in content:
+            content = content.replace(raw, escaped)
+    return content
+
+
+def dumps(data, default=None):
+    """data를 UTF-8 JSON 바이트로 직렬화 (orjson이 없으면 표준 json 모듈 사용)"""
+    with metrics.measure('serialize'):
+        return _dumps(data, default)
+
+
+def _dumps(data, default):
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=default or DjangoJSONEncoder().default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # 64비트를 넘는 정수 등 orjson이 처리하지 못하는 값은 표준 모듈로 처리
+            pass
+    return json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+class FastJSONRenderer(JSONRenderer):
+    """orjson으로 직렬화하는 JSONRenderer (들여쓰기 요청 시에는 기본 구현 사용)"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with metrics.measure('serialize'):
+            return self._render(data, accepted_media_type, renderer_context)
+
+    def _render(self, data, accepted_media_type, renderer_context):
+        if data is None:
+            return b''
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            content = orjson.dumps(data, default=self.encoder_class().default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        return _escape_line_separators(content)
@@ -1,5 +1,7 @@
 import os
+import tempfile
 from pathlib import Path
+from corsheaders.defaults import default_headers
 from decouple import config
 from datetime import timedelta
 
@@ -55,10 +57,11 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 AUTH_USER_MODEL = 'authentication.User'
 
 MIDDLEWARE = [
+    'survey_project.middleware.RequestMetricsMiddleware',  # 요청 전체 시간을 재도록 맨 앞에
     'survey_project.cors_middleware.CustomCorsMiddleware',  # 커스텀 CORS 미들웨어 추가
     'corsheaders.middleware.CorsMiddleware',  # CORS는 최상단에!
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'survey_project.middleware.AsyncWhiteNoiseMiddleware',  # ASGI에서도 동기 전환 없이 동작
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',  # CORS 다음에 바로!
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -88,12 +91,22 @@ TEMPLATES = [
 WSGI_APPLICATION = 'survey_project.wsgi.application'
 
 # Database
+# 지속 연결: 요청마다 새 연결을 열지 않고 DB_CONN_MAX_AGE초 동안 재사용하며,
+# 재사용 전 연결 상태를 확인한다 (DB_CONN_HEALTH_CHECKS)
+# gunicorn.conf.py의 asgi 프로필은 요청별 스레드의 연결이 쌓이지 않도록 0으로 고정한다.
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=600, cast=int)
+DB_CONN_HEALTH_CHECKS = config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool)
+
 # Use DATABASE_URL for production (Railway/Render) - prioritize production DB
 if config('DATABASE_URL', default=None):
     try:
         import dj_database_url
         DATABASES = {
-            'default': dj_database_url.parse(config('DATABASE_URL'))
+            'default': dj_database_url.parse(
+                config('DATABASE_URL'),
+                conn_max_age=DB_CONN_MAX_AGE,
+                conn_health_checks=DB_CONN_HEALTH_CHECKS,
+            )
         }
         print(f"✅ Using production database: {DATABASES['default']['ENGINE']}")
     except ImportError as e:
@@ -115,6 +128,98 @@ else:
     }
     print("📝 Using development SQLite database")
 
+# 프로세스 내 연결 풀 (PostgreSQL 전용, 선택)
+# 풀 크기는 워커 프로세스당 동시 요청 수(gunicorn.conf.py가 프로필별로 계산한
+# DB_POOL_CONCURRENCY)에 맞추며, 연결 반환은 풀이 담당하므로 Django의 지속 연결은 끈다.
+DB_POOL_CONCURRENCY = config('DB_POOL_CONCURRENCY', default=1, cast=int)
+DB_POOL = config('DB_POOL', default=False, cast=bool)
+if DB_POOL and DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+    DATABASES['default'].update({
+        'ENGINE': 'survey_project.db.backends.postgresql_pool',
+        'CONN_MAX_AGE': 0,
+        'POOL': {
+            'MIN_SIZE': config('DB_POOL_MIN_SIZE', default=DB_POOL_CONCURRENCY, cast=int),
+            'MAX_SIZE': config('DB_POOL_MAX_SIZE', default=DB_POOL_CONCURRENCY + config('DB_POOL_OVERFLOW', default=2, cast=int), cast=int),
+            # 연결이 모두 사용 중일 때 반환을 기다리는 시간(초). 넘으면 요청 실패
+            'TIMEOUT': config('DB_POOL_TIMEOUT', default=10, cast=float),
+        },
+    })
+
+# Cache
+# 설문 캐시는 여러 gunicorn 워커가 버전을 공유하도록 기본값으로 파일 백엔드를 사용
+# (단일 프로세스라면 SURVEY_CACHE_BACKEND=django.core.cache.backends.locmem.LocMemCache 로 LRU 사용)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # 설문 단위 버전 캐시 (apps/surveys/caching.py). 워커 간에 버전을 공유해야 하므로
+    # 프로세스 간 공유되는 백엔드(파일/Redis/Memcached)를 사용한다. 무효화는 새 버전 토큰을
+    # set하는 방식이라 원자적 incr가 없는 파일 백엔드에서도 동시 무효화가 유실되지 않는다.
+    'surveys': {
+        'BACKEND': config('SURVEY_CACHE_BACKEND', default='django.core.cache.backends.filebased.FileBasedCache'),
+        'LOCATION': config('SURVEY_CACHE_LOCATION', default=os.path.join(tempfile.gettempdir(), 'survey_cache')),
+        'TIMEOUT': config('SURVEY_CACHE_TIMEOUT', default=300, cast=int),
+        'OPTIONS': {
+            'MAX_ENTRIES': config('SURVEY_CACHE_MAX_ENTRIES', default=1000, cast=int),
+            'CULL_FREQUENCY': config('SURVEY_CACHE_CULL_FREQUENCY', default=3, cast=int),
+        },
+    },
+    # 응답 제출 멱등성 키 (apps/surveys/idempotency.py). 제출마다 새 키가 쌓이므로 설문 캐시와
+    # 분리해 정의/분석 항목이 키에 밀려 축출되지 않게 한다. 워커 간에 공유되어야 한다.
+    'idempotency': {
+        'BACKEND': config('SURVEY_IDEMPOTENCY_CACHE_BACKEND', default='django.core.cache.backends.filebased.FileBasedCache'),
+        'LOCATION': config('SURVEY_IDEMPOTENCY_CACHE_LOCATION', default=os.path.join(tempfile.gettempdir(), 'survey_idempotency')),
+        'OPTIONS': {
+            'MAX_ENTRIES': config('SURVEY_IDEMPOTENCY_CACHE_MAX_ENTRIES', default=10000, cast=int),
+            'CULL_FREQUENCY': config('SURVEY_IDEMPOTENCY_CACHE_CULL_FREQUENCY', default=3, cast=int),
+        },
+    },
+}
+
+SURVEY_CACHE_ALIAS = 'surveys'
+SURVEY_IDEMPOTENCY_CACHE_ALIAS = 'idempotency'
+SURVEY_CACHE_TIMEOUTS = {
+    'analytics': config('SURVEY_ANALYTICS_CACHE_TIMEOUT', default=300, cast=int),
+    'definition': config('SURVEY_DEFINITION_CACHE_TIMEOUT', default=3600, cast=int),
+}
+
+# Survey duplication
+SURVEY_BULK_DUPLICATE_MAX = config('SURVEY_BULK_DUPLICATE_MAX', default=100, cast=int)
+
+# Survey submission
+SURVEY_BATCH_SUBMIT_MAX = config('SURVEY_BATCH_SUBMIT_MAX', default=500, cast=int)
+
+# 'direct': 요청 안에서 바로 저장, 'spool': 로컬 스풀에 추가 후 202 반환
+SURVEY_SUBMISSION_MODE = config('SURVEY_SUBMISSION_MODE', default='direct')
+# 스풀은 웹 프로세스의 로컬 SQLite 파일이므로 같은 파일 시스템의 프로세스만 비울 수 있다.
+# 기본값은 웹 워커마다 반영 스레드를 두는 방식이다. 별도 `flush_submission_spool --loop`
+# 프로세스를 쓰려면 SURVEY_SPOOL_PATH를 웹과 공유하는 볼륨에 두고 이 값을 False로 한다
+# (Heroku/Railway의 프로세스 유형은 파일 시스템을 공유하지 않는다).
+SURVEY_SPOOL_IN_PROCESS_FLUSH = config('SURVEY_SPOOL_IN_PROCESS_FLUSH', default=True, cast=bool)
+SURVEY_SPOOL_FLUSH_INTERVAL = config('SURVEY_SPOOL_FLUSH_INTERVAL', default=1, cast=float)
+SURVEY_SPOOL_PATH = config('SURVEY_SPOOL_PATH', default=str(BASE_DIR / 'var' / 'submission_spool.sqlite3'))
+SURVEY_SPOOL_BATCH_SIZE = config('SURVEY_SPOOL_BATCH_SIZE', default=500, cast=int)
+SURVEY_SPOOL_LEASE_SECONDS = config('SURVEY_SPOOL_LEASE_SECONDS', default=60, cast=int)
+# 응답 제출 Idempotency-Key 결과 보관 시간(초)
+SURVEY_IDEMPOTENCY_TTL = config('SURVEY_IDEMPOTENCY_TTL', default=60 * 60 * 24, cast=int)
+
+# 응답 시계열 API (/api/surveys/<id>/timeline/) 한 번에 조회할 수 있는 최대 버킷 수
+SURVEY_TIMELINE_MAX_BUCKETS = config('SURVEY_TIMELINE_MAX_BUCKETS', default=2000, cast=int)
+
+# 공개 설문 조회 수 집계: 워커 메모리에 모아 두었다가 간격(초)마다 또는 버퍼 키가 최대 개수를 넘으면 DB에 반영
+SURVEY_VIEW_TRACKING = config('SURVEY_VIEW_TRACKING', default=True, cast=bool)
+SURVEY_VIEW_FLUSH_INTERVAL = config('SURVEY_VIEW_FLUSH_INTERVAL', default=10, cast=int)
+SURVEY_VIEW_BUFFER_MAX = config('SURVEY_VIEW_BUFFER_MAX', default=1000, cast=int)
+
+# 요청 계측 (Server-Timing 헤더, /api/metrics/)
+SERVER_TIMING_ENABLED = config('SERVER_TIMING_ENABLED', default=True, cast=bool)
+# 워커별 집계 파일 디렉터리 (비우면 프로세스 단위, gunicorn.conf.py가 임시 디렉터리를 지정)
+METRICS_DIR = config('METRICS_DIR', default='')
+METRICS_FLUSH_INTERVAL = config('METRICS_FLUSH_INTERVAL', default=5, cast=float)
+# /api/metrics/, /api/health/stats/ 접근 토큰: 지정하면 'Authorization: Bearer <토큰>' 필요,
+# 비워 두면 DEBUG에서만 열리고 운영 환경에서는 404
+METRICS_AUTH_TOKEN = config('METRICS_AUTH_TOKEN', default='')
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -159,10 +264,10 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'survey_project.renderers.FastJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'survey_project.parsers.FastJSONParser',
         'rest_framework.parsers.FormParser',
         'rest_framework.parsers.MultiPartParser',
     ],
@@ -200,6 +305,8 @@ CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
 CORS_ALLOW_ALL_HEADERS = True
 CORS_ALLOW_ALL_METHODS = True
+CORS_ALLOW_HEADERS = (*default_headers, 'idempotency-key')
+CORS_EXPOSE_HEADERS = ['Idempotent-Replayed']
 CORS_PREFLIGHT_MAX_AGE = 86400
 
 # Backup whitelist for Render
@@ -4,7 +4,7 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.http import JsonResponse
 
-def health_check(request):
+async def health_check(request):
     return JsonResponse({'status': 'ok', 'message': 'Survey API is running'})
 
 urlpatterns = [
@@ -112,11 +112,24 @@ export default function DashboardPage() {
     input.click();
   };
   
-  const handleExportSurvey = (survey: Survey) => {
+  const handleExportSurvey = async (survey: Survey) => {
+    // 목록 API는 질문을 포함하지 않으므로 내보낼 때 상세 정보를 조회
+    let questions = survey.questions || [];
+    if (!survey.id.startsWith('survey-')) {
+      try {
+        const detail = await surveyAPI.getSurvey(survey.id);
+        questions = detail.questions || [];
+      } catch (error) {
+        console.error('설문 상세 조회 실패:', error);
+        alert('설문 정보를 불러오지 못했습니다.');
+        return;
+      }
+    }
+
     const exportData = {
       title: survey.title,
       description: survey.description,
-      questions: survey.questions || [],
+      questions,
       isPublic: survey.status === 'published',
       status: 'draft'
     };
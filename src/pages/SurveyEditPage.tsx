@@ -5,6 +5,9 @@ import { surveyAPI } from '../services/api';
 import QuestionEditor from '../components/QuestionEditor';
 import type { Survey, Question } from '../types/survey';
 
+// 서버가 발급한 질문 ID (새로 추가한 질문은 'q-<timestamp>' 임시 ID)
+const SAVED_QUESTION_ID = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
+
 // 프론트엔드 질문 타입을 백엔드 타입으로 매핑
 const mapQuestionType = (frontendType: string) => {
   const typeMap: { [key: string]: string } = {
@@ -140,6 +143,8 @@ export default function SurveyEditPage() {
         title: survey.title,
         description: survey.description || '',
         questions: survey.questions?.map((q, index) => ({
+          // 서버에 저장된 질문은 id를 함께 보내 수정으로 처리 (삭제 후 재생성되면 수집된 답변이 사라짐)
+          ...(SAVED_QUESTION_ID.test(q.id) ? { id: q.id } : {}),
           text: q.title,
           description: q.description || '',
           type: mapQuestionType(q.type),
@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { useParams } from 'react-router-dom';
 import { surveyAPI } from '../services/api';
 import type { Survey, Question } from '../types/survey';
@@ -87,6 +87,8 @@ export default function SurveyResponsePage() {
   const [isSubmitting, setIsSubmitting] = useState(false);
   const [isCompleted, setIsCompleted] = useState(false);
   const [errors, setErrors] = useState<{ [questionId: string]: string }>({});
+  // 이 화면에서의 제출 재시도를 서버가 한 건으로 인식하도록 고정된 멱등성 키
+  const submissionKey = useRef(crypto.randomUUID());
 
   useEffect(() => {
     // 설문지 데이터 로드
@@ -390,7 +392,7 @@ export default function SurveyResponsePage() {
       console.log('🚀 Submitting response to backend:', responseData);
       console.log('🚀 API URL will be:', `${import.meta.env.DEV ? 'http://localhost:8000' : 'https://survey-backend-dgiy.onrender.com'}/api/public/${survey.id}/submit/`);
       
-      const result = await surveyAPI.submitResponse(survey.id, responseData);
+      const result = await surveyAPI.submitResponse(survey.id, responseData, submissionKey.current);
       console.log('✅ 응답이 백엔드로 제출되었습니다:', result);
       
       // 백엔드 제출 성공 시에도 로컬에 저장 (Analytics 페이지에서 사용)
@@ -139,7 +139,8 @@ export const surveyAPI = {
   },
   
   // 설문조사 응답 제출
-  submitResponse: async (id: string, responseData: any) => {
+  // idempotencyKey: 같은 제출을 재시도할 때 동일한 값을 보내면 서버가 한 번만 저장
+  submitResponse: async (id: string, responseData: any, idempotencyKey?: string) => {
     const url = `${API_BASE_URL}/public/${id}/submit/`;
     console.log('🚀 submitResponse URL:', url);
     console.log('🚀 submitResponse data:', responseData);
@@ -149,6 +150,7 @@ export const surveyAPI = {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
+          ...(idempotencyKey ? { 'Idempotency-Key': idempotencyKey } : {}),
         },
         body: JSON.stringify(responseData),
       });
@@ -176,6 +178,14 @@ export const surveyAPI = {
   getAnalytics: (id: string) =>
     apiRequest(`/surveys/${id}/analytics/`),
   
+  // 시간/일 단위 응답 수 시계열 (start/end: ISO 8601 날짜 또는 일시)
+  getTimeline: (id: string, params: { granularity?: 'hour' | 'day'; start?: string; end?: string } = {}) => {
+    const query = new URLSearchParams(
+      Object.entries(params).filter(([, value]) => value) as [string, string][]
+    ).toString();
+    return apiRequest(`/surveys/${id}/timeline/${query ? `?${query}` : ''}`);
+  },
+  
   // 설문조사 응답 목록
   getResponses: (id: string) =>
     apiRequest(`/surveys/${id}/responses/`),